@@ -6,8 +6,10 @@ import psutil
 import gc
 import json
 import hashlib
+import queue
+from concurrent.futures import CancelledError
 from datetime import datetime, timedelta
-from youtube_crawler import YouTubeCrawler
+from youtube_crawler import YouTubeCrawler, CrawlCancelledError
 from typing import Dict, List, Optional, Any
 import logging
 
@@ -1157,7 +1159,7 @@ def main():
                     max_workers = st.slider(
                         "동시 처리 수",
                         min_value=1, max_value=8, value=4,
-                        help="동시에 처리할 작업의 수"
+                        help="동시에 처리할 작업의 시작값 - 실행 중 응답 지연, 오류, 메모리 사용량에 따라 자동으로 늘리거나 줄입니다"
                     )
                 
                 with col2:
@@ -1215,6 +1217,11 @@ def main():
         if _ := st.button("⏹️ 크롤링 중단", type="secondary", use_container_width=True,
                     disabled=not st.session_state.crawling_in_progress,
                     help="진행 중인 크롤링을 중단합니다"):
+            # 실행 중인 크롤러의 대기 작업, 스크롤 루프, 드라이버 대기를 즉시 취소
+            active_crawler = st.session_state.get('active_crawler')
+            if active_crawler:
+                active_crawler.cancel()
+                st.session_state.active_crawler = None
             st.session_state.crawling_in_progress = False
             st.session_state.crawling_completed = False
             st.success("⏹️ 크롤링이 중단되었습니다.")
@@ -1306,86 +1313,79 @@ def main():
             
             crawler = YouTubeCrawler()
             crawler.update_config(config)
+            st.session_state.active_crawler = crawler
             
             add_log("✅ 크롤러 초기화 완료", "success")
             
             progress_bar.progress(0.1)
             
-            # 단계 2: 영상 검색 (콤팩트)
+            # 단계 2~3: 영상 검색 + 댓글 수집 파이프라인 (검색이 끝난 키워드의 영상부터 바로 댓글 수집)
             status_text.text("🔍 영상 검색 중...")
             add_log("🔍 영상 검색 시작", "info")
+            if collect_comments:
+                add_log("💬 검색된 영상부터 댓글 수집 시작", "info")
+            
+            # 날짜 필터링 적용
+            start_dt = datetime.combine(start_date, datetime.min.time()) if start_date else None
+            end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
+            
+            pipeline_progress = {'keywords': 0, 'videos': 0, 'comment_videos': 0}
             
-            videos = []
+            # 같은 조건으로 다시 실행하면 중단된 지점부터 이어서 수집 (완료 후 체크포인트 삭제)
+            job_id = hashlib.md5(f"{cache_key_data}_{start_dt}_{end_dt}".encode()).hexdigest()[:16]
+            checkpoint = crawler.checkpoint_journal(job_id)
+            if checkpoint.units:
+                add_log(f"♻️ 이전 작업 재개 - 완료된 작업 {len(checkpoint.units)}개 건너뜀", "info")
             
-            for i, keyword in enumerate(keywords):
-                progress = 0.1 + (i / len(keywords)) * 0.4  # 10%~50%
+            def update_pipeline_progress():
+                # 검색 10%~50%, 댓글 50%~90% 구간을 완료된 작업 비율로 표시
+                progress = 0.1 + (pipeline_progress['keywords'] / len(keywords)) * 0.4
+                if collect_comments and pipeline_progress['videos']:
+                    progress += (pipeline_progress['comment_videos'] / pipeline_progress['videos']) * 0.4
+                progress = min(progress, 0.9)
                 progress_bar.progress(progress)
-                
-                # 콤팩트한 진행 상태 업데이트
-                status_text.text(f"🔍 '{keyword}' 검색 중... ({i+1}/{len(keywords)})")
                 progress_text.text(f"{int(progress * 100)}%")
-                
-                # 날짜 필터링 적용
-                start_dt = datetime.combine(start_date, datetime.min.time()) if start_date else None
-                end_dt = datetime.combine(end_date, datetime.max.time()) if end_date else None
-                
-                keyword_videos = crawler.search_videos([keyword], videos_per_keyword, start_dt, end_dt)
-                videos.extend(keyword_videos)
+            
+            def on_videos(keyword, keyword_videos):
+                pipeline_progress['keywords'] += 1
+                pipeline_progress['videos'] += len({video.get('video_id') for video in keyword_videos if video.get('video_id')})
+                status_text.text(f"🔍 '{keyword}' 검색 완료 ({pipeline_progress['keywords']}/{len(keywords)})")
+                add_log(f"✅ '{keyword}' 검색 완료 - {len(keyword_videos)}개 영상", "success")
+                update_pipeline_progress()
+            
+            def on_comments(video, comments):
+                pipeline_progress['comment_videos'] += 1
+                status_text.text(f"💬 댓글 수집 중... ({pipeline_progress['comment_videos']}/{pipeline_progress['videos']})")
+                if comments:
+                    add_log(f"✅ 댓글 수집 성공 - {video.get('title', 'Unknown')[:30]}... ({len(comments)}개)", "success")
+                else:
+                    add_log(f"⚠️ 댓글 없음 - {video.get('title', 'Unknown')[:30]}...", "warning")
+                update_pipeline_progress()
+            
+            # 파이프라인은 크롤러 이벤트 루프에서 실행하고, 진행 이벤트는 스크립트 스레드에서 받아 화면 갱신
+            # (짧은 간격으로 화면을 갱신하므로 중단 버튼을 누르면 즉시 finally의 취소가 실행됨)
+            pipeline_events = queue.Queue()
+            future = crawler.submit(crawler.run_pipeline_async(
+                keywords, videos_per_keyword, comments_per_video if collect_comments else 0, start_dt, end_dt,
+                on_videos=lambda keyword, items: pipeline_events.put((on_videos, keyword, items)),
+                on_comments=lambda video, items: pipeline_events.put((on_comments, video, items)),
+                job_id=job_id
+            ))
+            while not future.done() or not pipeline_events.empty():
+                try:
+                    callback, key, items = pipeline_events.get(timeout=0.3)
+                except queue.Empty:
+                    update_pipeline_progress()
+                    continue
+                callback(key, items)
+            
+            videos, all_comments = future.result()
             
             if not videos:
                 add_log("❌ 검색된 영상이 없습니다.", "error")
                 st.error("❌ 검색된 영상이 없습니다.")
                 return
             
-            # 단계 3: 댓글 수집 (선택사항) - 콤팩트
-            all_comments = []
-            if collect_comments and videos:
-                status_text.text("💬 댓글 수집 중...")
-                add_log("💬 댓글 수집 시작", "info")
-                
-                for i, video in enumerate(videos):
-                    progress = 0.5 + (i / len(videos)) * 0.4  # 50%~90%
-                    progress_bar.progress(progress)
-                    
-                    # 콤팩트한 댓글 수집 진행 상태
-                    status_text.text(f"💬 댓글 수집 중... ({i+1}/{len(videos)})")
-                    progress_text.text(f"{int(progress * 100)}%")
-                    
-                    if video.get('video_id'):
-                        try:
-                            add_log(f"💬 댓글 수집 시도 - {video.get('title', 'Unknown')[:30]}... (ID: {video['video_id']})", "info")
-                            comments = crawler.get_video_comments(video['video_id'], comments_per_video)
-                            
-                            if comments:
-                                all_comments.extend(comments)
-                                add_log(f"✅ 댓글 수집 성공 - {len(comments)}개 댓글 수집", "success")
-                            else:
-                                add_log(f"⚠️ 댓글 없음 - {video.get('title', 'Unknown')[:30]}...", "warning")
-                                
-                        except Exception as comment_error:
-                            error_msg = str(comment_error)
-                            add_log(f"❌ 댓글 수집 실패 - {video.get('title', 'Unknown')[:30]}... (오류: {error_msg[:100]}...)", "error")
-                            
-                            # 상세 오류 정보 표시
-                            with st.expander(f"🔧 댓글 수집 오류 상세 정보 - {video.get('title', 'Unknown')[:30]}..."):
-                                st.error(f"**오류 유형**: {type(comment_error).__name__}")
-                                st.error(f"**오류 메시지**: {error_msg}")
-                                st.error(f"**영상 ID**: {video.get('video_id', 'N/A')}")
-                                st.error(f"**영상 제목**: {video.get('title', 'N/A')}")
-                            
-                            # ChromeDriver 재연결 시도
-                            if "connection" in error_msg.lower() or "webdriver" in error_msg.lower():
-                                try:
-                                    add_log("🔄 ChromeDriver 재연결 시도 중...", "info")
-                                    crawler.close()
-                                    time.sleep(2)
-                                    crawler = YouTubeCrawler()
-                                    crawler.update_config(config)
-                                    add_log("✅ ChromeDriver 재연결 성공", "success")
-                                except Exception as reconnect_error:
-                                    add_log(f"❌ ChromeDriver 재연결 실패: {str(reconnect_error)}", "error")
-                                    break
-            
             # 단계 4: 데이터 저장 (콤팩트)
             status_text.text("💾 데이터 저장 중...")
             progress_text.text("95%")
@@ -1560,6 +1560,7 @@ def main():
                 st.session_state.excel_buffer = excel_buffer.getvalue()
                 st.session_state.filename = filename
                 st.session_state.crawling_completed = True
+                checkpoint.remove()
                 
                 # 디버깅 정보 표시
                 add_log(f"💾 세션 상태 저장 완료 - 영상: {len(videos)}, 댓글: {len(all_comments)}", "info")
@@ -1620,6 +1621,9 @@ def main():
                 st.session_state.crawling_completed = True
                 st.session_state.crawling_in_progress = False
                 
+        except (CrawlCancelledError, CancelledError):
+            add_log("⏹️ 크롤링이 중단되었습니다.", "warning")
+            st.warning("⏹️ 크롤링이 중단되었습니다. 같은 조건으로 다시 시작하면 완료된 작업은 건너뜁니다.")
         except Exception as e:
             error_msg = str(e)
             add_log(f"❌ 크롤링 중 오류 발생: {error_msg[:100]}...", "error")
@@ -1647,7 +1651,10 @@ def main():
                 """)
         finally:
             if crawler:
+                st.session_state.active_crawler = None
                 try:
+                    # 중단 버튼 등으로 스크립트가 중단된 경우에도 남은 작업을 취소하고 드라이버 반납
+                    crawler.cancel()
                     crawler.close()
                 except:
                     pass
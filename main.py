@@ -107,9 +107,25 @@ def main():
     try:
         crawler = YouTubeCrawler()
         
-        # 영상 검색
+        # 영상 검색 + 댓글 수집 (키워드 검색이 끝나는 대로 바로 댓글 수집 시작)
         print(f"\n🔍 영상을 검색하고 있습니다...")
-        videos = crawler.search_videos(keywords, videos_per_keyword, start_date, end_date)
+        if collect_comments:
+            print(f"💬 검색된 영상부터 댓글을 바로 수집합니다...")
+        
+        progress = {'videos': 0, 'done': 0}
+        
+        def on_videos(keyword, keyword_videos):
+            progress['videos'] += len(keyword_videos)
+            print(f"   ✅ '{keyword}' 검색 완료 - {len(keyword_videos)}개 영상")
+        
+        def on_comments(video, comments):
+            progress['done'] += 1
+            print(f"   진행률: {progress['done']}/{progress['videos']} - {video['title'][:50]}... ({len(comments)}개 댓글)")
+        
+        videos, all_comments = crawler.run_pipeline(
+            keywords, videos_per_keyword, comments_per_video, start_date, end_date,
+            on_videos=on_videos, on_comments=on_comments
+        )
         
         if not videos:
             print("❌ 검색된 영상이 없습니다.")
@@ -117,17 +133,6 @@ def main():
         
         print(f"✅ {len(videos)}개의 영상을 찾았습니다.")
         
-        # 댓글 수집
-        all_comments = []
-        if collect_comments and videos:
-            print(f"\n💬 댓글을 수집하고 있습니다...")
-            
-            for i, video in enumerate(videos):
-                if video.get('video_id'):
-                    print(f"   진행률: {i+1}/{len(videos)} - {video['title'][:50]}...")
-                    comments = crawler.get_video_comments(video['video_id'], comments_per_video)
-                    all_comments.extend(comments)
-        
         # 엑셀 저장
         print(f"\n💾 데이터를 엑셀 파일로 저장하고 있습니다...")
         saved_file = crawler.save_to_excel(videos, all_comments, filename)
@@ -0,0 +1,597 @@
+#!/usr/bin/env python3
+"""
+브라우저 엔진 오프라인 테스트
+- 가짜 드라이버로 스크롤/대기/추출 흐름 검증 (Chrome 불필요)
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from selenium.common.exceptions import WebDriverException
+from youtube_crawler import CrawlCancelledError, YouTubeDataParser, DriverPool, CacheManager, CrawlBackend
+from test_http_engine import make_fixture_crawler, load_fixture
+
+class FakeDriver:
+    """Selenium 드라이버 대역 - 스크립트 호출을 기록하고 지정한 응답 반환"""
+
+    def __init__(self, scripts=None, waits=None, on_wait=None):
+        # scripts: 스크립트 내용의 일부 → 반환값(또는 호출마다 값을 돌려주는 함수)
+        self.scripts = scripts or {}
+        self.waits = list(waits or [])
+        self.on_wait = on_wait
+        self.calls = []
+        self.current_url = ''
+        self.quit_called = False
+        self.performance_log = []
+
+    def get(self, url):
+        self.calls.append(('get', url))
+        self.current_url = url
+
+    def execute_script(self, script, *args):
+        self.calls.append(('script', script.strip()[:40]))
+        for fragment, value in self.scripts.items():
+            if fragment in script:
+                return value(*args) if callable(value) else value
+        return None
+
+    def execute_async_script(self, script, *args):
+        self.calls.append(('wait', args[0]))
+        if self.on_wait:
+            self.on_wait(self)
+        if self.waits:
+            return self.waits.pop(0)
+        return {'reason': 'idle', 'initial': 0, 'count': 0}
+
+    def get_log(self, log_type):
+        return self.performance_log
+
+    def find_element(self, *args):
+        return object()
+
+    def find_elements(self, *args):
+        return []
+
+    def quit(self):
+        self.quit_called = True
+
+def test_cancel_during_scroll():
+    """스크롤 중 취소 테스트 - 넓은 예외 처리에 삼켜지지 않고 즉시 중단되어 드라이버 호출이 멈추는지 확인"""
+    crawler = make_fixture_crawler()
+    try:
+        # 댓글 수집: 페이지 로딩 후 두 번째 DOM 대기에서 취소
+        def cancel_on_second_wait(driver):
+            if sum(1 for call in driver.calls if call[0] == 'wait') == 2:
+                crawler.cancel_token.cancel()
+
+        driver = FakeDriver(on_wait=cancel_on_second_wait)
+        try:
+            crawler._get_video_comments_with_driver(driver, 'vidA0000001', 10)
+            raise AssertionError("취소된 댓글 수집이 정상 반환되었습니다.")
+        except CrawlCancelledError:
+            pass
+        last_wait = max(index for index, call in enumerate(driver.calls) if call[0] == 'wait')
+        assert driver.calls[last_wait + 1:] == []
+
+        # 취소된 상태에서는 페이지 로딩 전에 중단 (빈 결과로 바뀌지 않음)
+        driver = FakeDriver()
+        try:
+            crawler._get_video_comments_with_driver(driver, 'vidA0000001', 10)
+            raise AssertionError("취소된 댓글 수집이 정상 반환되었습니다.")
+        except CrawlCancelledError:
+            pass
+        assert driver.calls == []
+
+        # 검색 스크롤
+        crawler.reset_cancellation()
+        driver = FakeDriver(
+            scripts={'scrollHeight': lambda: time.time()},
+            on_wait=lambda driver: crawler.cancel_token.cancel()
+        )
+        try:
+            crawler._scroll_page_optimized(driver)
+            raise AssertionError("취소된 스크롤이 계속되었습니다.")
+        except CrawlCancelledError:
+            pass
+        assert [call[0] for call in driver.calls].count('wait') == 1
+    finally:
+        crawler.close()
+
+def test_comment_page_failure_raises():
+    """댓글 페이지 로딩 실패는 빈 결과가 아니라 예외로 전달 (체크포인트에 완료로 기록되지 않도록)"""
+    class BrokenDriver(FakeDriver):
+        def get(self, url):
+            raise TimeoutError("페이지 로딩 시간 초과")
+
+    crawler = make_fixture_crawler()
+    try:
+        crawler._get_video_comments_with_driver(BrokenDriver(), 'vidA0000001', 10)
+        raise AssertionError("페이지 로딩 실패가 빈 결과로 반환되었습니다.")
+    except TimeoutError:
+        pass
+    finally:
+        crawler.close()
+
+def test_search_continuation_state():
+    """브라우저 검색 연속 토큰 조회 - HTTP 검색과 같은 파서로 continuationItemRenderer의 토큰 사용"""
+    html = load_fixture('search_results.html')
+    ytcfg = YouTubeDataParser.extract_ytcfg(html)
+    driver = FakeDriver(scripts={'ytInitialData': {
+        'initial': json.dumps(YouTubeDataParser.extract_initial_data(html)),
+        'api_key': ytcfg.get('INNERTUBE_API_KEY'),
+        'context': ytcfg.get('INNERTUBE_CONTEXT')
+    }})
+
+    crawler = make_fixture_crawler()
+    try:
+        state = crawler._get_search_continuation_state(driver)
+        expected_token, expected_key, _ = crawler.http_search._continuation_request(html)
+    finally:
+        crawler.close()
+
+    assert state['token'] == expected_token and state['api_key'] == expected_key
+    # ytInitialData가 없는 페이지는 토큰 없음 (스크롤 방식으로 대체)
+    assert crawler._get_search_continuation_state(FakeDriver())['token'] is None
+
+def test_driver_pool():
+    """드라이버 풀 테스트 - 대여/반납 재사용, 크기 제한, 상태 확인 교체, 크기 변경"""
+    created = []
+
+    def dead_browser():
+        raise RuntimeError("브라우저 응답 없음")
+
+    def factory():
+        driver = FakeDriver(scripts={'return 1': 1})
+        created.append(driver)
+        return driver
+
+    pool = DriverPool(factory, size=2)
+    first = pool.acquire()
+    second = pool.acquire()
+    assert len(created) == 2 and first is not second
+    assert not pool.has_capacity()
+    try:
+        pool.acquire(timeout=0.05)
+        raise AssertionError("풀 크기를 넘어 드라이버가 대여되었습니다.")
+    except TimeoutError:
+        pass
+
+    # 최근 반납한 드라이버를 먼저 재사용
+    pool.release(first)
+    pool.release(second)
+    assert pool.acquire() is second
+    pool.release(second)
+
+    # 오래 쉬었던 드라이버가 응답하지 않으면 대여 시 새 드라이버로 교체
+    pool.health_check_interval = 0
+    second.scripts['return 1'] = dead_browser
+    replacement = pool.acquire()
+    assert replacement is created[2] and second.quit_called
+    assert pool.get_stats()['replaced'] == 1 and pool.get_stats()['health_failures'] == 1
+    pool.health_check_interval = 30
+
+    # 오류 후 반납된 비정상 드라이버도 교체
+    replacement.scripts['return 1'] = dead_browser
+    pool.release(replacement, healthy=False)
+    assert replacement.quit_called and pool.get_stats()['alive'] == 2
+
+    # 크기를 줄이면 유휴 드라이버부터 종료하고, 사용 중인 드라이버는 반납할 때 종료
+    leased = [pool.acquire(), pool.acquire()]
+    pool.resize(1)
+    assert pool.get_stats()['alive'] == 2
+    pool.release(leased[0])
+    pool.release(leased[1])
+    stats = pool.get_stats()
+    assert stats['alive'] == 1 and stats['idle'] == 1
+    assert leased[0].quit_called and not leased[1].quit_called
+    pool.resize(2)
+    extra = pool.acquire(), pool.acquire()
+    pool.release(extra[0])
+    pool.release(extra[1])
+    pool.resize(1)
+    assert pool.get_stats()['alive'] == 1 and pool.get_stats()['idle'] == 1
+
+    with pool.driver() as driver:
+        assert driver in created
+    pool.close_all()
+    assert all(driver.quit_called for driver in created)
+    try:
+        pool.acquire()
+        raise AssertionError("종료된 풀에서 드라이버가 대여되었습니다.")
+    except RuntimeError:
+        pass
+
+def test_driver_pool_release_errors():
+    """반납 시 교체 실패가 호출자의 원래 오류를 가리지 않고, 전용 드라이버는 워커와 공유하지 않는지 테스트"""
+    created = []
+    fail_create = []
+
+    def factory():
+        if fail_create:
+            raise RuntimeError("브라우저 실행 실패")
+        driver = FakeDriver(scripts={'return 1': 1})
+        created.append(driver)
+        return driver
+
+    pool = DriverPool(factory, size=1)
+    try:
+        with pool.driver() as driver:
+            driver.scripts['return 1'] = 0
+            fail_create.append(True)
+            raise WebDriverException("세션 종료")
+    except WebDriverException:
+        pass
+    assert driver.quit_called and pool.get_stats()['alive'] == 0
+
+    # 교체에 실패한 슬롯은 다음 대여 때 새로 생성
+    fail_create.clear()
+    with pool.driver() as driver:
+        assert driver is created[1]
+
+    dedicated = pool.create_dedicated()
+    assert pool.acquire() is created[1] and pool.get_stats()['alive'] == 1
+    pool.close_all()
+    assert dedicated.quit_called
+
+def test_driver_pool_concurrent_resize():
+    """워커가 대여/반납하는 동안 크기를 계속 바꿔도 반납 후 드라이버 수가 풀 크기를 넘지 않는지 테스트"""
+    created = []
+
+    def factory():
+        driver = FakeDriver(scripts={'return 1': 1})
+        created.append(driver)
+        return driver
+
+    pool = DriverPool(factory, size=4)
+    stop = threading.Event()
+
+    def worker():
+        while not stop.is_set():
+            try:
+                with pool.driver(timeout=0.05):
+                    time.sleep(0.001)
+            except TimeoutError:
+                pass
+
+    workers = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in workers:
+        thread.start()
+    for index in range(200):
+        pool.resize(1 + index % 4)
+        time.sleep(0.001)
+    pool.resize(2)
+    stop.set()
+    for thread in workers:
+        thread.join()
+
+    stats = pool.get_stats()
+    assert stats['alive'] <= 2 and stats['idle'] == stats['alive']
+    assert sum(1 for driver in created if not driver.quit_called) == stats['alive']
+    pool.close_all()
+
+def test_pipeline_budget_follows_driver_pool():
+    """브라우저 파이프라인의 작업 시간 예산이 워커 한도 상한이 아니라 현재 드라이버 풀 크기를 사용하는지 테스트"""
+    crawler = make_fixture_crawler()
+    crawler.backend.concurrent = False  # 브라우저 백엔드처럼 드라이버 풀로 동시 실행 제한
+    crawler.driver_pool = DriverPool(FakeDriver, size=2)
+    budget_workers = []
+
+    async def record_budget(video_id, max_comments, budget, journal=None):
+        budget_workers.append(budget.workers)
+        crawler.driver_pool.resize(1)  # 적응형 동시성 한도가 줄어든 상황
+        return []
+
+    crawler._get_video_comments_with_deadline = record_budget
+    try:
+        crawler.run_pipeline(['파이썬'], 3, 5)
+    finally:
+        crawler.close()
+
+    assert crawler.worker_concurrency.maximum > 2
+    assert budget_workers == [2, 1, 1]
+
+def test_hedged_browser_loser_stops():
+    """브라우저 헤징 테스트 - 늦게 끝난 스레드 풀 요청은 하위 취소 토큰으로 스크롤 루프가 멈춰 드라이버를 반납"""
+    crawler = make_fixture_crawler(enable_hedging=True, hedge_max_ratio=0.5)
+    crawler.driver_pool = DriverPool(FakeDriver, size=2)
+    for _ in range(20):
+        crawler.monitor.record_latency('comments', 0.05)
+    calls = []
+    loser_stopped = threading.Event()
+
+    class SlowBrowserBackend(CrawlBackend):
+        name = 'browser'
+        executor = ThreadPoolExecutor(max_workers=2)
+
+        def search(self, keyword, max_videos, start_date=None, end_date=None):
+            return []
+
+        def get_video_details(self, video_id):
+            return {}
+
+        def get_comments(self, video_id, max_comments=50, time_budget=None):
+            calls.append(video_id)
+            if len(calls) == 1:
+                # 브라우저 스크롤 루프처럼 현재 스레드의 취소 토큰을 확인하며 대기
+                try:
+                    while not crawler.cancel_token.wait(0.02):
+                        pass
+                    crawler.cancel_token.raise_if_cancelled()
+                finally:
+                    loser_stopped.set()
+            return [{'video_id': video_id}]
+
+    crawler.backend = SlowBrowserBackend()
+    try:
+        assert crawler.get_video_comments('vidA0000001', 5) == [{'video_id': 'vidA0000001'}]
+        assert len(calls) == 2
+        assert loser_stopped.wait(1)
+        # 하위 토큰 취소는 크롤러 전체 취소가 아님
+        assert not crawler.cancel_token.cancelled
+    finally:
+        crawler.cancel()  # 실패한 경우에도 대기 중인 스레드 정리
+        crawler.backend.executor.shutdown(wait=False)
+        crawler.close()
+
+def test_bulk_extraction():
+    """일괄 추출 테스트 - 한 번의 스크립트 호출 결과를 영상/댓글 필드로 변환"""
+    crawler = make_fixture_crawler()
+    try:
+        cards = [
+            {'title': '최근 영상', 'href': 'https://www.youtube.com/watch?v=vidA0000001', 'channel': '채널A',
+             'views': '조회수 1.2만회', 'uploaded': '3일 전'},
+            {'title': '오래된 영상', 'href': 'https://www.youtube.com/watch?v=vidB0000002', 'channel': '채널B',
+             'views': '조회수 10회', 'uploaded': '1년 전'},
+        ]
+        driver = FakeDriver(scripts={'ytd-video-renderer': cards})
+        videos = crawler._collect_video_cards(driver, '파이썬', 5, datetime.now() - timedelta(days=30), None)
+        assert [call[0] for call in driver.calls] == ['script']
+        assert len(videos) == 1
+        video = videos[0]
+        assert video['video_id'] == 'vidA0000001' and video['title'] == '최근 영상'
+        assert video['channel_name'] == '채널A' and video['view_count'] == '조회수 1.2만회'
+        assert video['keyword'] == '파이썬' and video['formatted_upload_date'] != 'N/A'
+
+        # 일괄 추출이 실패하면 요소별 추출로 전환
+        def broken_script(*args):
+            raise RuntimeError("스크립트 오류")
+        assert crawler._collect_video_cards(FakeDriver(scripts={'ytd-video-renderer': broken_script}),
+                                            '파이썬', 5, None, None) == []
+
+        raws = [
+            {'comment_id': 'Ugx1', 'text': '정말 유익한 영상이네요', 'votes': '1.2천', 'replies': '답글 3개',
+             'published': '2일 전', 'author': '@viewer'},
+            {'comment_id': 'Ugx2', 'text': '굿', 'votes': '', 'replies': '', 'published': '', 'author': '@short'},
+        ]
+        driver = FakeDriver(scripts={'querySelectorAll(arguments[2])': lambda offset, limit, selector: raws[offset:offset + limit]})
+        comments = crawler._extract_comments_bulk(driver, 'vidA0000001', 10)
+        assert len(driver.calls) == 1 and len(comments) == 1
+        comment = comments[0]
+        assert comment['comment_id'] == 'Ugx1' and comment['comment'] == '정말 유익한 영상이네요'
+        assert comment['like_count'] == 1200 and comment['reply_count'] == 3
+        assert comment['author'] == '@viewer' and comment['comment_time'] == '2일 전'
+        assert comment['video_id'] == 'vidA0000001' and not comment['is_reply']
+    finally:
+        crawler.close()
+
+def make_comment_driver(pages, has_more=True):
+    """댓글 노드가 DOM 대기마다 pages 순서대로 붙는 가짜 드라이버"""
+    loaded = []
+
+    def grow(driver):
+        if pages:
+            loaded.extend(pages.pop(0))
+            driver.waits.append({'reason': 'grew', 'initial': 0, 'count': len(loaded)})
+
+    def harvest(offset, limit, selector):
+        return loaded[offset:offset + limit]
+
+    def continuation():
+        return bool(pages) if has_more else False
+
+    driver = FakeDriver(scripts={
+        'querySelectorAll(arguments[2])': harvest,
+        'ytd-continuation-item-renderer': continuation
+    }, on_wait=grow)
+    grow(driver)
+    driver.waits.clear()
+    return driver
+
+def raw_comments(start, count):
+    """댓글 노드 원시 데이터"""
+    return [{'comment_id': f"Ugc{index}", 'text': f"댓글 내용 {index}번"} for index in range(start, start + count)]
+
+def test_dom_wait_and_incremental_loading():
+    """DOM 대기 결과 전달/고정 대기 전환 및 댓글 연속 로딩 종료 조건 테스트"""
+    crawler = make_fixture_crawler(wait_time=0.05, dom_quiet_period=0.01)
+    try:
+        # 관찰 결과는 그대로 반환하고, 스크립트에는 밀리초 단위 시간 전달
+        class RecordingDriver(FakeDriver):
+            def execute_async_script(self, script, *args):
+                self.args = args
+                return super().execute_async_script(script, *args)
+
+        driver = RecordingDriver(waits=[{'reason': 'grew', 'initial': 3, 'count': 5}])
+        assert crawler._wait_for_dom_change(driver, 'ytd-comment-thread-renderer', timeout=2)['reason'] == 'grew'
+        assert driver.args == ('ytd-comment-thread-renderer', 2000, 10)
+
+        # 스크립트 대기를 쓸 수 없으면 최대 시간만큼 대기 후 계속
+        class NoAsyncDriver(FakeDriver):
+            def execute_async_script(self, script, *args):
+                raise RuntimeError("지원하지 않음")
+
+        started = time.time()
+        assert crawler._wait_for_dom_change(NoAsyncDriver(), 'x', timeout=0.05) == {'reason': 'sleep'}
+        assert time.time() - started >= 0.05
+
+        # 목표 개수에 도달하면 스크롤/대기 없이 종료
+        driver = make_comment_driver([raw_comments(0, 5)])
+        comments = crawler._load_comments_incrementally(driver, 'vidA0000001', 3)
+        assert [comment['comment_id'] for comment in comments] == ['Ugc0', 'Ugc1', 'Ugc2']
+        assert not any(call[0] == 'wait' for call in driver.calls)
+
+        # 새 노드가 붙을 때마다 이어서 수집하고, 더 불러올 댓글이 없으면 종료
+        driver = make_comment_driver([raw_comments(0, 2), raw_comments(2, 2), raw_comments(4, 1)], has_more=True)
+        comments = crawler._load_comments_incrementally(driver, 'vidA0000001', 10)
+        assert [comment['comment_id'] for comment in comments] == [f"Ugc{index}" for index in range(5)]
+        assert [call[0] for call in driver.calls].count('wait') == 3
+
+        # 연속 로딩 항목이 없고 새 노드도 없으면 한 번 대기 후 종료
+        driver = make_comment_driver([raw_comments(0, 2), raw_comments(2, 2)], has_more=False)
+        driver.on_wait = None
+        comments = crawler._load_comments_incrementally(driver, 'vidA0000001', 10)
+        assert len(comments) == 2 and [call[0] for call in driver.calls].count('wait') == 1
+
+        # 시간 예산이 없으면 첫 수집 후 종료
+        driver = make_comment_driver([raw_comments(0, 2), raw_comments(2, 2)])
+        comments = crawler._load_comments_incrementally(driver, 'vidA0000001', 10, time_budget=0)
+        assert len(comments) == 2 and not any(call[0] == 'wait' for call in driver.calls)
+    finally:
+        crawler.close()
+
+def test_replies_share_video_deadline():
+    """브라우저 답글 수집이 새 시간 예산을 시작하지 않고 댓글 수집과 같은 영상 마감 시각에서 멈추는지 테스트"""
+    crawler = make_fixture_crawler(collect_replies=True, wait_time=0.02, comment_time_budget=5)
+    reply_clicks = []
+    try:
+        driver = make_comment_driver([raw_comments(0, 2)], has_more=False)
+        driver.on_wait = lambda driver: time.sleep(0.01)
+        # '답글 더보기' 버튼은 계속 보이지만 답글 노드는 늘지 않는 페이지
+        driver.scripts = {
+            'maxClicks': lambda *args: reply_clicks.append(time.time()) or 1,
+            'return document.querySelectorAll(arguments[0]).length': 0,
+            'parent_comment_id': [],
+            **driver.scripts
+        }
+
+        started = time.time()
+        comments = crawler._get_video_comments_with_driver(driver, 'vidA0000001', 10, time_budget=0.3)
+        elapsed = time.time() - started
+    finally:
+        crawler.close()
+
+    assert [comment['comment_id'] for comment in comments] == ['Ugc0', 'Ugc1']
+    assert reply_clicks and max(reply_clicks) - started < 0.4
+    assert elapsed < 1
+
+    # 마감 시각이 이미 지났으면 버튼을 누르지 않고 열린 답글만 추출
+    crawler = make_fixture_crawler(collect_replies=True)
+    try:
+        driver = FakeDriver(scripts={'maxClicks': 1, 'parent_comment_id': [
+            {'comment_id': 'Ugc0.r1', 'parent_comment_id': 'Ugc0', 'text': '이미 열린 답글입니다'}
+        ]})
+        replies = crawler._collect_replies_in_page(driver, 'vidA0000001', [{'comment_id': 'Ugc0'}], time.time() - 1)
+    finally:
+        crawler.close()
+    assert [reply['comment_id'] for reply in replies] == ['Ugc0.r1'] and len(driver.calls) == 1
+
+def performance_entry(method, **params):
+    """Chrome 성능 로그 항목"""
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+def test_network_savings():
+    """성능 로그 집계 테스트 - 요청/전송량/차단 요청과 리소스 종류별 절약 추정치"""
+    crawler = make_fixture_crawler(block_requests=True)
+    try:
+        driver = FakeDriver()
+        driver.performance_log = [
+            performance_entry('Network.requestWillBeSent', requestId='1', type='Document'),
+            performance_entry('Network.requestWillBeSent', requestId='2', type='Image'),
+            performance_entry('Network.requestWillBeSent', requestId='3', type='Script'),
+            performance_entry('Network.loadingFinished', requestId='1', encodedDataLength=1000),
+            performance_entry('Network.loadingFinished', requestId='3', encodedDataLength=500),
+            performance_entry('Network.loadingFailed', requestId='2', blockedReason='inspector'),
+            performance_entry('Network.loadingFailed', requestId='4', type='Media', blockedReason='inspector'),
+            performance_entry('Network.loadingFailed', requestId='5', type='Script'),  # 차단이 아닌 실패
+            {'message': '잘린 항목'},
+        ]
+        crawler._record_network_savings(driver, '검색')
+        crawler._record_network_savings(driver, '댓글')
+        stats = crawler.monitor.network_stats
+        estimates = crawler.BLOCKED_RESOURCE_SIZE_ESTIMATES
+        assert stats['pages'] == 2 and stats['requests'] == 6 and stats['blocked_requests'] == 4
+        assert stats['transferred_bytes'] == 3000
+        assert stats['estimated_bytes_saved'] == 2 * (estimates['Image'] + estimates['Media'])
+
+        # 성능 로그를 읽을 수 없거나 차단을 끈 경우 기록하지 않음
+        class NoLogDriver(FakeDriver):
+            def get_log(self, log_type):
+                raise RuntimeError("성능 로그 없음")
+        crawler._record_network_savings(NoLogDriver(), '검색')
+        crawler.config.update({'block_requests': False})
+        crawler._record_network_savings(driver, '검색')
+        assert stats['pages'] == 2
+    finally:
+        crawler.close()
+
+def test_unblocked_url_patterns():
+    """차단 해제 패턴 테스트 - 차단 목록과 정확히 같은 패턴만 제거"""
+    crawler = make_fixture_crawler(unblocked_url_patterns=['*i.ytimg.com/*', 'https://i.ytimg.com/vi/*'])
+    try:
+        patterns = crawler._get_blocked_url_patterns()
+    finally:
+        crawler.close()
+    assert '*i.ytimg.com/*' not in patterns
+    assert patterns == [pattern for pattern in crawler.DEFAULT_BLOCKED_URL_PATTERNS if pattern != '*i.ytimg.com/*']
+
+def test_enrich_videos_cache():
+    """영상 상세 정보 보강 테스트 - 영상별 캐시 적중은 요청 없이 사용하고 실패한 영상은 건너뜀"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crawler = make_fixture_crawler()
+        crawler.cache = CacheManager(os.path.join(temp_dir, 'cache'))
+        crawler.cache.set('details_vidA0000001', {'view_count_exact': 10, 'published_at': '2024-01-02T03:04:05'})
+        requested = []
+
+        async def fetch_details(video_id):
+            requested.append(video_id)
+            if video_id == 'vidC0000003':
+                raise RuntimeError("상세 정보 없음")
+            return {'view_count_exact': 20, 'published_at': '2024-05-06T00:00:00', 'like_count': 3}
+
+        crawler.get_video_details_async = fetch_details
+        try:
+            videos = [{'video_id': 'vidA0000001'}, {'video_id': 'vidB0000002'}, {'video_id': 'vidC0000003'}, {}]
+            crawler.enrich_videos(videos)
+            assert sorted(requested) == ['vidB0000002', 'vidC0000003']
+            assert videos[0]['view_count_exact'] == 10 and videos[0]['formatted_upload_date'] == '2024.01.02'
+            assert videos[1]['view_count_exact'] == 20 and videos[1]['like_count'] == 3
+            assert 'view_count_exact' not in videos[2]
+
+            # 두 번째 보강에서는 성공한 영상은 캐시 사용, 실패한 영상만 다시 요청
+            requested.clear()
+            again = [{'video_id': 'vidA0000001'}, {'video_id': 'vidB0000002'}, {'video_id': 'vidC0000003'}]
+            crawler.enrich_videos(again)
+            assert requested == ['vidC0000003']
+            assert again[1]['view_count_exact'] == 20
+        finally:
+            crawler.close()
+
+def main():
+    """메인 테스트 함수"""
+    print("🧪 브라우저 엔진 오프라인 테스트")
+    print("=" * 50)
+
+    test_cancel_during_scroll()
+    test_comment_page_failure_raises()
+    test_search_continuation_state()
+    test_driver_pool()
+    test_driver_pool_release_errors()
+    test_driver_pool_concurrent_resize()
+    test_pipeline_budget_follows_driver_pool()
+    test_hedged_browser_loser_stops()
+    test_bulk_extraction()
+    test_dom_wait_and_incremental_loading()
+    test_replies_share_video_deadline()
+    test_network_savings()
+    test_unblocked_url_patterns()
+    test_enrich_videos_cache()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,953 @@
+#!/usr/bin/env python3
+"""
+HTTP 엔진 오프라인 테스트
+- 저장된 fixtures/ 응답으로 파싱 검증 (네트워크/Chrome 불필요)
+- 브라우저 경로와 같은 영상 딕셔너리 형식인지 확인
+"""
+
+import os
+import json
+import time
+import asyncio
+import queue
+import tempfile
+import threading
+from datetime import datetime, timedelta
+from youtube_crawler import (
+    YouTubeHttpClient, HttpSearchEngine, HttpCommentEngine, HttpVideoEngine, YouTubeDataParser, YouTubeParseError,
+    ConfigManager, PerformanceMonitor, RateLimiter, CrawlBackend, HttpBackend, FallbackBackend, ChannelFeedMonitor,
+    YouTubeCrawler, ShardedCrawler, CheckpointJournal, BackgroundEventLoop, DriverPool, CancellationToken,
+    CrawlCancelledError, JobTimeBudget, ConcurrencyController, AsyncYouTubeHttpClient, CacheManager
+)
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+VIDEO_KEYS = {
+    'keyword', 'title', 'channel_name', 'view_count', 'upload_time',
+    'formatted_upload_date', 'video_url', 'video_id', 'crawled_at'
+}
+
+COMMENT_KEYS = {
+    'video_id', 'comment_id', 'parent_comment_id', 'is_reply', 'comment', 'author',
+    'extracted_keywords', 'like_count', 'reply_count', 'comment_time', 'timestamp', 'comment_index'
+}
+
+def load_fixture(name: str) -> str:
+    """픽스처 파일 읽기"""
+    with open(os.path.join(FIXTURE_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+class FakeResponse:
+    """requests.Response 대역"""
+
+    def __init__(self, text: str, status_code: int = 200, headers: dict = None):
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise Exception(f"HTTP {self.status_code}")
+
+class FakeSession:
+    """URL 또는 연속 토큰별로 저장된 응답을 돌려주는 세션 대역"""
+
+    def __init__(self, pages: dict, etag: str = None):
+        self.pages = pages
+        self.etag = etag
+        self.requested = []
+        self.payloads = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requested.append(url)
+        if self.etag and (headers or {}).get('If-None-Match') == self.etag:
+            return FakeResponse('', 304)
+        for prefix, text in self.pages.items():
+            if url.startswith(prefix):
+                return FakeResponse(text, headers={'ETag': self.etag} if self.etag else None)
+        return FakeResponse('', 404)
+
+    def post(self, url, json=None, params=None, timeout=None):
+        self.payloads.append(json)
+        continuation = (json or {}).get('continuation')
+        if continuation in self.pages:
+            self.requested.append(url)
+            return FakeResponse(self.pages[continuation])
+        return self.get(url)
+
+    def close(self):
+        pass
+
+class FakeAsyncClient:
+    """동기 클라이언트를 감싸는 비동기 클라이언트 대역"""
+
+    def __init__(self, client: YouTubeHttpClient, fail_ids: tuple = ()):
+        self.client = client
+        self.fail_ids = fail_ids
+
+    async def get_text(self, url, params=None, headers=None):
+        await asyncio.sleep(0)
+        if any(video_id in url for video_id in self.fail_ids):
+            raise Exception("HTTP 429")
+        return self.client.get_text(url, params, headers)
+
+    async def post_json(self, url, payload, params=None):
+        await asyncio.sleep(0)
+        return self.client.post_json(url, payload, params)
+
+    async def get_conditional(self, url, etag=None, last_modified=None):
+        await asyncio.sleep(0)
+        return self.client.get_conditional(url, etag, last_modified)
+
+    def innertube_url(self, endpoint, api_key):
+        return self.client.innertube_url(endpoint, api_key)
+
+def make_search_engine(pages: dict) -> HttpSearchEngine:
+    """픽스처 세션을 사용하는 검색 엔진 생성"""
+    client = YouTubeHttpClient(ConfigManager(), session=FakeSession(pages))
+    return HttpSearchEngine(client)
+
+def test_parse_search_page():
+    """검색 결과 HTML 파싱 테스트"""
+    print("🔍 검색 결과 HTML 파싱 테스트...")
+
+    engine = make_search_engine({})
+    videos = engine.parse_search_page(load_fixture('search_results.html'), '파이썬', max_videos=10)
+
+    # 채널 카드는 제외되고 선반(shelf) 안의 중복 영상은 한 번만 포함
+    assert [video['video_id'] for video in videos] == ['vidA0000001', 'vidB0000002', 'vidC0000003', 'vidD0000004']
+    for video in videos:
+        assert set(video.keys()) == VIDEO_KEYS
+
+    first = videos[0]
+    assert first['title'] == '파이썬 기초 강의 1편'
+    assert first['channel_name'] == '코딩채널'
+    assert first['view_count'] == '조회수 1.2만회'
+    assert first['upload_time'] == '3일 전'
+    assert first['video_url'] == 'https://www.youtube.com/watch?v=vidA0000001'
+    assert first['formatted_upload_date'] == (datetime.now() - timedelta(days=3)).strftime('%Y.%m.%d')
+
+    print(f"✅ {len(videos)}개 영상 파싱 성공")
+
+def test_search_with_limit_and_date_range():
+    """영상 수 제한 및 날짜 필터 테스트"""
+    print("\n📅 영상 수 제한 및 날짜 필터 테스트...")
+
+    engine = make_search_engine({
+        'https://www.youtube.com/results': load_fixture('search_results.html'),
+        'https://www.youtube.com/youtubei/v1/search': load_fixture('search_continuation.json')
+    })
+
+    videos = engine.search('파이썬', max_videos=2)
+    assert len(videos) == 2
+
+    # 최근 30일 영상만 (1년 전 영상 제외)
+    start_date = datetime.now() - timedelta(days=30)
+    recent = engine.search('파이썬', max_videos=10, start_date=start_date, end_date=datetime.now())
+    assert 'vidC0000003' not in [video['video_id'] for video in recent]
+    assert engine.client.session.requested[-2].endswith('&sp=CAI%253D')
+
+    print(f"✅ 제한 {len(videos)}개, 최근 30일 {len(recent)}개")
+
+def test_search_continuation():
+    """연속 토큰 페이지네이션 테스트"""
+    print("\n📄 연속 토큰 페이지네이션 테스트...")
+
+    engine = make_search_engine({
+        'https://www.youtube.com/results': load_fixture('search_results.html'),
+        'https://www.youtube.com/youtubei/v1/search': load_fixture('search_continuation.json')
+    })
+    videos = engine.search('파이썬', max_videos=6)
+
+    # 첫 페이지 4개 + 다음 페이지에서 중복(vidD)을 건너뛴 2개
+    assert [video['video_id'] for video in videos] == [
+        'vidA0000001', 'vidB0000002', 'vidC0000003', 'vidD0000004', 'vidE0000005', 'vidF0000006'
+    ]
+
+    session = engine.client.session
+    assert session.requested[-1] == 'https://www.youtube.com/youtubei/v1/search?key=TEST_API_KEY&prettyPrint=false'
+    assert session.payloads[-1]['continuation'] == 'SEARCH_TOKEN_PAGE_2'
+    assert session.payloads[-1]['context']['client']['clientName'] == 'WEB'
+
+    # 다음 페이지에 더 이상 토큰이 없으면 멈춤
+    everything = engine.search('파이썬', max_videos=50)
+    assert len(everything) == 7
+    assert len(session.payloads) == 2
+
+    print(f"✅ 연속 페이지 포함 {len(videos)}개 영상")
+
+def make_comment_engine(fail_ids: tuple = (), **config) -> HttpCommentEngine:
+    """댓글 픽스처 세션을 사용하는 댓글 엔진 생성"""
+    config_manager = ConfigManager()
+    config_manager.update(config)
+    client = YouTubeHttpClient(config_manager, session=FakeSession({
+        'https://www.youtube.com/watch': load_fixture('watch_page.html'),
+        'COMMENTS_SECTION_TOKEN': load_fixture('comments_top.json'),
+        'COMMENTS_PAGE_2': load_fixture('comments_page2.json'),
+        'COMMENTS_SORT_NEWEST': load_fixture('comments_newest.json'),
+        'REPLIES_Ugcmt001': load_fixture('replies_page1.json'),
+        'REPLIES_Ugcmt001_PAGE_2': load_fixture('replies_page2.json')
+    }))
+    return HttpCommentEngine(client, FakeAsyncClient(client, fail_ids))
+
+def test_comments_top():
+    """인기순 댓글 페이지네이션 테스트 (구/신 응답 형식 혼합)"""
+    print("\n💬 인기순 댓글 수집 테스트...")
+
+    engine = make_comment_engine(collect_replies=False)
+    comments = engine.get_comments('vidA0000001', max_comments=10)
+
+    # 5자 미만 댓글은 제외, 다음 페이지의 중복 댓글은 한 번만 포함
+    assert [comment['comment'] for comment in comments] == [
+        '설명이 정말 친절해서 이해가 잘 됩니다',
+        '파이썬 리스트 부분 다시 봐야겠어요',
+        '예제 코드가 깔끔해서 따라하기 좋네요',
+        '다음 강의는 클래스 상속 부탁드려요'
+    ]
+    for comment in comments:
+        assert set(comment.keys()) == COMMENT_KEYS
+        assert comment['video_id'] == 'vidA0000001'
+        assert not comment['is_reply']
+
+    first, _, entity = comments[0], comments[1], comments[2]
+    assert (first['like_count'], first['reply_count'], first['comment_time'], first['author']) == (1200, 3, '2일 전', '@learner')
+    assert (entity['like_count'], entity['reply_count'], entity['comment_time'], entity['author']) == (1500, 2, '1주 전', '@coder')
+    assert [comment['comment_index'] for comment in comments] == [1, 2, 3, 4]
+
+    # 시청 페이지 1회 + 댓글 페이지 2회, 관련 영상/답글 토큰은 요청하지 않음
+    payloads = engine.client.session.payloads
+    assert [payload['continuation'] for payload in payloads] == ['COMMENTS_SECTION_TOKEN', 'COMMENTS_PAGE_2']
+    assert engine.client.session.requested[-1] == 'https://www.youtube.com/youtubei/v1/next?key=TEST_API_KEY&prettyPrint=false'
+
+    print(f"✅ {len(comments)}개 댓글 수집 성공")
+
+def test_comment_replies():
+    """답글 연속 토큰 수집 및 부모 댓글 연결 테스트"""
+    print("\n↪️ 답글 수집 테스트...")
+
+    engine = make_comment_engine(collect_replies=True, max_replies_per_video=10)
+    comments = engine.get_comments('vidA0000001', max_comments=10)
+
+    # 답글은 부모 댓글 바로 뒤에 배치되고 5자 미만 답글은 제외
+    assert [comment['comment_id'] for comment in comments] == [
+        'Ugcmt001', 'Ugcmt001.r1', 'Ugcmt001.r3', 'Ugcmt003', 'Ugcmt004', 'Ugcmt005'
+    ]
+    replies = [comment for comment in comments if comment['is_reply']]
+    assert all(reply['parent_comment_id'] == 'Ugcmt001' for reply in replies)
+    assert replies[1]['author'] == '@next'
+    assert [comment['comment_index'] for comment in comments] == [1, 2, 3, 4, 5, 6]
+
+    # 답글 예산을 넘으면 다음 답글 페이지를 요청하지 않음
+    engine = make_comment_engine(collect_replies=True, max_replies_per_video=1)
+    comments = engine.get_comments('vidA0000001', max_comments=10)
+    assert len([comment for comment in comments if comment['is_reply']]) == 1
+    assert 'REPLIES_Ugcmt001_PAGE_2' not in [payload['continuation'] for payload in engine.client.session.payloads]
+
+    print(f"✅ 답글 {len(replies)}개 연결 성공")
+
+def test_comments_newest_and_limit():
+    """최신순 정렬 및 댓글 수 제한 테스트"""
+    print("\n🕒 최신순 댓글 수집 테스트...")
+
+    engine = make_comment_engine()
+    comments = engine.get_comments('vidA0000001', max_comments=2, sort_by='newest')
+
+    assert [comment['comment_time'] for comment in comments] == ['10분 전', '5시간 전']
+    assert [payload['continuation'] for payload in engine.client.session.payloads] == [
+        'COMMENTS_SECTION_TOKEN', 'COMMENTS_SORT_NEWEST'
+    ]
+
+    print(f"✅ 최신순 {len(comments)}개 댓글")
+
+def test_async_matches_sync():
+    """비동기 검색/댓글 수집이 동기 경로와 같은 결과인지 테스트"""
+    print("\n⚡ 비동기 경로 테스트...")
+
+    search_engine = make_search_engine({
+        'https://www.youtube.com/results': load_fixture('search_results.html'),
+        'https://www.youtube.com/youtubei/v1/search': load_fixture('search_continuation.json')
+    })
+    search_engine.async_client = FakeAsyncClient(search_engine.client)
+    sync_videos = search_engine.search('파이썬', max_videos=6)
+    async_videos = asyncio.run(search_engine.search_async('파이썬', max_videos=6))
+    assert [video['video_id'] for video in async_videos] == [video['video_id'] for video in sync_videos]
+
+    comment_engine = make_comment_engine()
+    sync_comments = comment_engine.get_comments('vidA0000001', max_comments=10, sort_by='newest')
+    async_comments = asyncio.run(comment_engine.get_comments_async('vidA0000001', max_comments=10, sort_by='newest'))
+    assert [comment['comment'] for comment in async_comments] == [comment['comment'] for comment in sync_comments]
+
+    # 답글도 같은 수집 단계를 사용
+    comment_engine = make_comment_engine(collect_replies=True, max_replies_per_video=10)
+    sync_comments = comment_engine.get_comments('vidA0000001', max_comments=10)
+    async_comments = asyncio.run(comment_engine.get_comments_async('vidA0000001', max_comments=10))
+    assert [comment['comment_id'] for comment in async_comments] == [comment['comment_id'] for comment in sync_comments]
+    assert any(comment['is_reply'] for comment in async_comments)
+
+    print(f"✅ 영상 {len(async_videos)}개, 댓글 {len(async_comments)}개 일치")
+
+def test_iter_comments_async():
+    """여러 영상 댓글 스트리밍 테스트 (실패한 영상은 빈 목록)"""
+    print("\n🌊 댓글 스트리밍 테스트...")
+
+    engine = make_comment_engine(fail_ids=('vidFAIL0001',))
+    video_ids = ['vidA0000001', 'vidB0000002', 'vidFAIL0001', 'vidD0000004']
+
+    async def collect():
+        return [item async for item in engine.iter_comments_async(video_ids, max_comments=3)]
+
+    results = dict(asyncio.run(collect()))
+    assert set(results) == set(video_ids)
+    assert results['vidFAIL0001'] == []
+    for video_id in ('vidA0000001', 'vidB0000002', 'vidD0000004'):
+        assert len(results[video_id]) == 3
+        assert all(comment['video_id'] == video_id for comment in results[video_id])
+
+    print(f"✅ {len(results)}개 영상 스트리밍 완료")
+
+def test_video_details():
+    """시청 페이지 영상 상세 정보 파싱 테스트"""
+    client = YouTubeHttpClient(ConfigManager(), session=FakeSession({
+        'https://www.youtube.com/watch?v=vidA0000001': load_fixture('watch_page.html'),
+        'https://www.youtube.com/watch': '<html><body>consent</body></html>'
+    }))
+    engine = HttpVideoEngine(client)
+
+    details = engine.get_details('vidA0000001')
+    assert details['title'] == '파이썬 기초 강의 1편'
+    assert details['channel_name'] == '코딩채널'
+    assert details['view_count_exact'] == 12345
+    assert details['duration_seconds'] == 1261
+    assert details['published_at'].startswith('2025-01-05')
+    # 좋아요 수는 축약 표기(1.5천)가 아닌 접근성 텍스트의 정확한 숫자 사용
+    assert details['like_count'] == 1534
+    assert details['comment_count'] == 1024
+
+    try:
+        engine.get_details('vidB0000002')
+    except YouTubeParseError:
+        return
+    raise AssertionError("YouTubeParseError가 발생하지 않았습니다.")
+
+class FakeBrowserBackend(CrawlBackend):
+    """호출을 기록하는 브라우저 백엔드 대역"""
+
+    name = 'browser'
+
+    def __init__(self):
+        self.calls = []
+
+    def search(self, keyword, max_videos, start_date=None, end_date=None):
+        self.calls.append(('search', keyword))
+        return [{'video_id': 'fromBrowser'}]
+
+    def get_comments(self, video_id, max_comments=50, time_budget=None):
+        self.calls.append(('get_comments', video_id))
+        return []
+
+    def get_video_details(self, video_id):
+        self.calls.append(('get_video_details', video_id))
+        return {}
+
+def test_backend_interface():
+    """백엔드 인터페이스 테스트 - 구현하지 않은 메서드가 있으면 크롤링 도중이 아니라 생성할 때 실패"""
+    class IncompleteBackend(CrawlBackend):
+        def search(self, keyword, max_videos, start_date=None, end_date=None):
+            return []
+
+    try:
+        IncompleteBackend()
+        raise AssertionError("불완전한 백엔드가 생성되었습니다.")
+    except TypeError as e:
+        assert 'get_comments' in str(e) and 'get_video_details' in str(e)
+    assert FakeBrowserBackend().name == 'browser'
+
+def test_auto_backend_fallback():
+    """auto 백엔드 - HTTP 파싱 실패한 요청만 브라우저로 재시도하고 대체율 기록"""
+    print("\n🔀 auto 백엔드 대체 테스트...")
+
+    config = ConfigManager()
+    client = YouTubeHttpClient(config, session=FakeSession({
+        'https://www.youtube.com/results?search_query=%ED%8C%8C%EC%9D%B4%EC%8D%AC': load_fixture('search_results.html'),
+        'https://www.youtube.com/results': '<html><body>consent</body></html>',
+        'https://www.youtube.com/watch': load_fixture('watch_page.html'),
+        'COMMENTS_SECTION_TOKEN': load_fixture('comments_top.json')
+    }))
+    http_backend = HttpBackend(HttpSearchEngine(client), HttpCommentEngine(client), HttpVideoEngine(client), config)
+    browser_backend = FakeBrowserBackend()
+    monitor = PerformanceMonitor()
+    backend = FallbackBackend(http_backend, browser_backend, monitor)
+
+    assert len(backend.search('파이썬', 3)) == 3
+    assert backend.search('자바', 3) == [{'video_id': 'fromBrowser'}]
+    assert len(backend.get_comments('vidA0000001', 2)) == 2
+    assert browser_backend.calls == [('search', '자바')]
+
+    stats = monitor.get_metrics()['backend']
+    assert (stats['requests'], stats['fallbacks'], stats['fallback_rate']) == (3, 1, '33.3%')
+    assert stats['by_operation'] == {'search_requests': 2, 'search_fallbacks': 1, 'get_comments_requests': 1}
+
+    print(f"✅ 대체율 {stats['fallback_rate']}")
+
+def test_comments_disabled():
+    """댓글 섹션이 없는 영상 처리 테스트"""
+    client = YouTubeHttpClient(ConfigManager(), session=FakeSession({
+        'https://www.youtube.com/watch': load_fixture('search_results.html')
+    }))
+    assert HttpCommentEngine(client).get_comments('vidA0000001') == []
+
+def test_parse_like_count():
+    """좋아요 수 텍스트 변환 테스트"""
+    assert YouTubeDataParser.parse_like_count('1.2K') == 1200
+    assert YouTubeDataParser.parse_like_count('3.4만') == 34000
+    assert YouTubeDataParser.parse_like_count('1,024') == 1024
+    assert YouTubeDataParser.parse_like_count('') == 0
+
+def test_missing_initial_data():
+    """ytInitialData가 없는 페이지(동의/봇 확인 페이지) 처리 테스트"""
+    print("\n🚫 ytInitialData 누락 페이지 테스트...")
+
+    engine = make_search_engine({})
+    try:
+        engine.parse_search_page('<html><body>consent</body></html>', '파이썬', max_videos=10)
+    except YouTubeParseError:
+        print("✅ YouTubeParseError 발생")
+        return
+    raise AssertionError("YouTubeParseError가 발생하지 않았습니다.")
+
+def test_text_of():
+    """텍스트 객체 변환 테스트"""
+    assert YouTubeDataParser.text_of({'simpleText': '3일 전'}) == '3일 전'
+    assert YouTubeDataParser.text_of({'runs': [{'text': '파이썬 '}, {'text': '강의'}]}) == '파이썬 강의'
+    assert YouTubeDataParser.text_of(None) == ''
+
+def test_parse_channel_feed():
+    """채널 Atom 피드 파싱 테스트"""
+    videos = ChannelFeedMonitor.parse_feed(load_fixture('channel_feed.xml').encode('utf-8'))
+    assert [video['video_id'] for video in videos] == ['feedVid0003', 'feedVid0002', 'feedVid0001']
+    assert all(VIDEO_KEYS <= set(video) for video in videos)
+    assert videos[0]['title'] == '파이썬 비동기 입문'
+    assert videos[0]['channel_name'] == '파이썬 채널'
+    assert videos[0]['view_count'] == '조회수 15,321회'
+    assert videos[0]['formatted_upload_date'] == '2024.05.03'
+    assert videos[0]['keyword'] == 'channel:UCtestchannel000000000'
+
+def test_channel_feed_monitor():
+    """채널 피드 모니터 - 기준선 기록, 304 처리, 새 영상만 반환 테스트"""
+    print("\n📡 채널 피드 모니터 테스트...")
+
+    feed = load_fixture('channel_feed.xml')
+    # 최신 영상(feedVid0003)이 아직 올라오지 않은 이전 피드
+    start = feed.index('<entry>')
+    end = feed.index('<entry>', start + 1)
+    old_feed = feed[:start] + feed[end:]
+
+    channel_id = 'UCtestchannel000000000'
+    feed_url = ChannelFeedMonitor.FEED_URL.format(channel_id=channel_id)
+    session = FakeSession({feed_url: old_feed}, etag='"v1"')
+    client = YouTubeHttpClient(ConfigManager(), session=session)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        state_file = os.path.join(temp_dir, 'state.json')
+        monitor = ChannelFeedMonitor(FakeAsyncClient(client), client.config, state_file=state_file)
+
+        # 처음 확인한 채널은 기존 영상을 기준선으로만 기록
+        assert asyncio.run(monitor.poll_async([channel_id])) == []
+
+        # ETag가 같으면 304 - 본문을 다시 파싱하지 않음
+        assert asyncio.run(monitor.poll_async([channel_id])) == []
+        assert monitor.last_poll_stats['not_modified'] == 1
+
+        # 새 영상이 올라오면 처음 보는 영상만 반환 (상태 파일에서 다시 로드)
+        session.pages = {feed_url: feed}
+        session.etag = '"v2"'
+        monitor = ChannelFeedMonitor(FakeAsyncClient(client), client.config, state_file=state_file)
+        new_videos = asyncio.run(monitor.poll_async([channel_id, 'UCmissing']))
+        assert [video['video_id'] for video in new_videos] == ['feedVid0003']
+        assert monitor.last_poll_stats['errors'] == 1
+        assert monitor.state['channels'][channel_id]['etag'] == '"v2"'
+
+    print(f"✅ 새 영상 {len(new_videos)}개")
+
+def test_rate_limiter():
+    """토큰 버킷 속도 제한 - 엔드포인트 구분, 버스트 이후 대기, 차단 신호 시 감속 테스트"""
+    config = ConfigManager()
+    config.update({'rate_limit_burst': 2, 'rate_limits': {'search': 10.0}})
+    limiter = RateLimiter(config)
+
+    assert RateLimiter.endpoint_class('https://www.youtube.com/results?search_query=a') == 'search'
+    assert RateLimiter.endpoint_class('https://www.youtube.com/youtubei/v1/next?key=k') == 'comments'
+    assert RateLimiter.endpoint_class('https://www.youtube.com/watch?v=vidA0000001') == 'watch'
+    assert RateLimiter.endpoint_class('https://www.youtube.com/feeds/videos.xml?channel_id=UC') == 'feed'
+
+    url = 'https://www.youtube.com/results?search_query=a'
+    # 버스트(2개)까지는 바로 통과하고 이후 요청은 순서대로 1/속도 간격으로 예약
+    waits = [limiter._reserve(url) for _ in range(4)]
+    assert waits[0] == 0 and waits[1] == 0
+    assert 0.05 < waits[2] <= 0.1 and waits[3] > waits[2]
+    # 다른 엔드포인트는 별도 버킷
+    assert limiter._reserve('https://www.youtube.com/watch?v=vidA0000001') == 0
+
+    limiter.observe(url, 429)
+    limiter.observe(url, 200, 'https://consent.youtube.com/m?continue=x')
+    stats = limiter.get_stats()['www.youtube.com:search']
+    assert stats['rate'] == 2.5 and stats['throttled'] == 2
+    limiter.observe(url, 200, url)
+    assert limiter.get_stats()['www.youtube.com:search']['rate'] == 2.7
+
+def make_fixture_crawler(**config) -> YouTubeCrawler:
+    """HTTP 엔진이 픽스처 세션을 사용하는 크롤러 생성"""
+    config_manager = ConfigManager()
+    config_manager.update({'engine': 'http', 'cache_enabled': False})
+    config_manager.update(config)
+    crawler = YouTubeCrawler(config_manager)
+    comment_engine = make_comment_engine()
+    comment_engine.client.session.pages['https://www.youtube.com/results'] = load_fixture('search_results.html')
+    for engine in (crawler.http_search, crawler.http_comments, crawler.http_videos):
+        engine.client = comment_engine.client
+        engine.async_client = comment_engine.async_client
+    return crawler
+
+def test_pipeline():
+    """검색 → 댓글 파이프라인 테스트 (중복 영상은 댓글을 한 번만 수집)"""
+    print("\n🚰 파이프라인 테스트...")
+
+    crawler = make_fixture_crawler(pipeline_queue_size=2)
+
+    events = []
+    try:
+        videos, comments = crawler.run_pipeline(
+            ['파이썬', '자바'], 3, 5,
+            on_videos=lambda keyword, items: events.append(('videos', keyword, len(items))),
+            on_comments=lambda video, items: events.append(('comments', video['video_id'], len(items)))
+        )
+    finally:
+        crawler.close()
+
+    assert [video['keyword'] for video in videos] == ['파이썬'] * 3 + ['자바'] * 3
+    assert sorted(event[1] for event in events if event[0] == 'comments') == ['vidA0000001', 'vidB0000002', 'vidC0000003']
+    assert len(comments) == sum(event[2] for event in events if event[0] == 'comments') > 0
+    assert all(COMMENT_KEYS <= set(comment) for comment in comments)
+    print(f"✅ 영상 {len(videos)}개, 댓글 {len(comments)}개")
+
+def test_checkpoint_resume():
+    """체크포인트 재개 테스트 - 완료한 단위 작업은 다시 요청하지 않음"""
+    print("\n💾 체크포인트 재개 테스트...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crawler = make_fixture_crawler(checkpoint_dir=temp_dir)
+        session = crawler.http_comments.client.session
+        try:
+            videos, comments = crawler.run_pipeline(['파이썬', '자바'], 3, 5, job_id='job1')
+
+            # 마지막 영상 댓글 기록 도중 중단된 상황 (완료 표시 없음 + 잘린 줄)
+            journal_path = os.path.join(temp_dir, 'job1.jsonl')
+            with open(journal_path, encoding='utf-8') as f:
+                lines = f.readlines()
+            last_unit = json.loads(lines[-2])['unit']
+            with open(journal_path, 'w', encoding='utf-8') as f:
+                f.writelines(lines[:-2])
+                f.write(lines[-2][:20])
+
+            session.requested.clear()
+            resumed_videos, resumed_comments = crawler.resume('job1')
+        finally:
+            crawler.close()
+
+        assert last_unit.startswith('comments:')
+        # 잘린 영상의 댓글만 다시 요청 (시청 페이지 + 연속 페이지)
+        assert session.requested and all(last_unit.split(':', 1)[1] in url or 'youtubei' in url for url in session.requested)
+        assert resumed_videos == videos
+        assert sorted(c['comment_id'] for c in resumed_comments) == sorted(c['comment_id'] for c in comments)
+        assert CheckpointJournal('job1', temp_dir).finished
+
+    print(f"✅ 재요청 {len(session.requested)}건")
+
+def test_checkpoint_retries_failed_video():
+    """실패한 영상은 완료로 기록되지 않아 재개할 때 다시 요청하는지 테스트"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crawler = make_fixture_crawler(checkpoint_dir=temp_dir)
+        videos = [{'video_id': 'vidA0000001'}, {'video_id': 'vidB0000002'}]
+        fetch_comments = crawler.backend.get_comments_async
+        calls = []
+        failures = {'vidB0000002': 1}
+
+        async def flaky_fetch(video_id, max_comments=50, time_budget=None):
+            calls.append(video_id)
+            if failures.get(video_id):
+                failures[video_id] -= 1
+                raise YouTubeParseError("페이지 로딩 실패")
+            return await fetch_comments(video_id, max_comments, time_budget)
+
+        crawler.backend.get_comments_async = flaky_fetch
+        try:
+            first = crawler.get_comments_for_videos(videos, 5, job_id='job2')
+            assert not CheckpointJournal('job2', temp_dir).is_done('comments:vidB0000002')
+
+            calls.clear()
+            _, resumed = crawler.resume('job2')
+        finally:
+            crawler.close()
+
+        assert calls == ['vidB0000002']
+        assert {comment['video_id'] for comment in first} == {'vidA0000001'}
+        assert {comment['video_id'] for comment in resumed} == {'vidA0000001', 'vidB0000002'}
+
+def test_truncated_comments_not_stored():
+    """시간 예산에 잘린 댓글 목록은 캐시/체크포인트에 저장하지 않고, 마지막 페이지까지 읽은 목록만 저장"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crawler = make_fixture_crawler(checkpoint_dir=temp_dir, comment_time_budget=0.1)
+        crawler.cache = CacheManager(os.path.join(temp_dir, 'cache'))
+        delays = {'vidA0000001': 0.2, 'vidB0000002': 0}
+
+        async def partial_fetch(video_id, max_comments=50, time_budget=None):
+            # 목표 5개 중 2개만 수집 - vidA는 시간 예산을 넘겨 잘림, vidB는 마지막 페이지 도달
+            await asyncio.sleep(delays[video_id])
+            return [{'video_id': video_id, 'comment_id': f"{video_id}-{index}"} for index in range(2)]
+
+        crawler.backend.get_comments_async = partial_fetch
+        try:
+            comments = crawler.get_comments_for_videos(
+                [{'video_id': 'vidA0000001'}, {'video_id': 'vidB0000002'}], 5, job_id='job3'
+            )
+        finally:
+            crawler.close()
+
+        assert len(comments) == 4
+        journal = CheckpointJournal('job3', temp_dir)
+        assert not journal.is_done('comments:vidA0000001')
+        assert journal.is_done('comments:vidB0000002')
+        assert crawler.cache.get('comments_vidA0000001_5') is None
+        assert len(crawler.cache.get('comments_vidB0000002_5')) == 2
+
+    # 작업 마감으로 줄인 목표(3개)를 채운 결과는 원래 요청(5개)의 완료로 기록하지 않음
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crawler = make_fixture_crawler(checkpoint_dir=temp_dir)
+        journal = CheckpointJournal('job4', temp_dir)
+        try:
+            comments = crawler._run_sync(crawler._get_video_comments_checkpointed('vidA0000001', 3, journal, requested=5))
+        finally:
+            crawler.close()
+        assert len(comments) == 3 and not journal.is_done('comments:vidA0000001')
+
+def test_background_event_loop():
+    """상시 이벤트 루프 테스트 - 호출 사이 루프 재사용, 동시 제출, 루프 안 동기 호출 방지"""
+    event_loop = BackgroundEventLoop()
+
+    async def running_loop():
+        await asyncio.sleep(0.05)
+        return asyncio.get_running_loop()
+
+    loop = event_loop.run(running_loop())
+    assert event_loop.run(running_loop()) is loop
+
+    started = time.time()
+    futures = [event_loop.submit(running_loop()) for _ in range(20)]
+    assert all(future.result() is loop for future in futures)
+    assert time.time() - started < 0.5
+
+    async def nested():
+        return event_loop.run(running_loop())
+    try:
+        event_loop.run(nested())
+        raise AssertionError("루프 스레드 안 동기 호출이 차단되지 않았습니다.")
+    except RuntimeError:
+        pass
+
+    event_loop.stop()
+    assert loop.is_closed()
+
+def test_cancellation():
+    """취소 테스트 - 대기 중인 이벤트 루프 작업과 드라이버 대기가 1초 안에 중단되는지 확인"""
+    print("\n🛑 취소 테스트...")
+
+    crawler = make_fixture_crawler()
+    try:
+        threading.Timer(0.2, crawler.cancel).start()
+        started = time.time()
+        try:
+            crawler._run_sync(asyncio.sleep(30))
+            raise AssertionError("취소된 작업이 완료되었습니다.")
+        except CrawlCancelledError:
+            pass
+        assert time.time() - started < 1.0
+
+        # 취소 상태에서는 새 작업을 시작하지 않고, 해제 후에는 정상 동작
+        try:
+            crawler.run_pipeline(['파이썬'], 3, 0)
+            raise AssertionError("취소 상태에서 파이프라인이 실행되었습니다.")
+        except CrawlCancelledError:
+            pass
+        crawler.reset_cancellation()
+        videos, _ = crawler.run_pipeline(['파이썬'], 3, 0)
+        assert len(videos) == 3
+    finally:
+        crawler.close()
+
+    token = CancellationToken()
+    pool = DriverPool(object, size=1, cancel_token=token)
+    pool.acquire()
+    threading.Timer(0.2, token.cancel).start()
+    started = time.time()
+    try:
+        pool.acquire(timeout=30)
+        raise AssertionError("취소된 드라이버 대기가 끝나지 않았습니다.")
+    except CrawlCancelledError:
+        pass
+    assert time.time() - started < 1.0
+
+    print("✅ 취소 후 1초 안에 중단 확인")
+
+def test_video_deadlines():
+    """영상별 마감 시간 테스트 - 멈춘 영상만 포기하고 먼저 끝난 영상 댓글은 유지, 작업 마감이 가까우면 목표 수 감소"""
+    print("\n⏳ 영상별 마감 시간 테스트...")
+
+    unlimited = JobTimeBudget(0, 4, 60)
+    unlimited.add(10)
+    assert unlimited.plan(50) == (50, 60)
+
+    # 남은 10초를 워커 2개가 영상 4개에 나누면 영상당 5초 → 목표 수를 시간 비율만큼 줄임
+    budget = JobTimeBudget(10, 2, 60, min_comments=5)
+    budget.add(4)
+    target, time_budget = budget.plan(50)
+    assert 5 <= target < 50 and time_budget <= 5
+    budget.deadline = time.time() - 1
+    assert budget.plan(50)[0] == 0 and budget.stats['skipped'] == 1
+
+    crawler = make_fixture_crawler(comment_time_budget=0.3, page_load_timeout=0)
+    crawler.DEADLINE_GRACE = 0.2
+    fetch_comments = crawler.backend.get_comments_async
+
+    async def stalled_fetch(video_id, max_comments=50, time_budget=None):
+        if video_id == 'vidB0000002':
+            await asyncio.sleep(30)
+        return await fetch_comments(video_id, max_comments, time_budget)
+
+    crawler.backend.get_comments_async = stalled_fetch
+    try:
+        started = time.time()
+        comments = crawler.get_comments_for_videos([{'video_id': 'vidA0000001'}, {'video_id': 'vidB0000002'}], 5)
+        elapsed = time.time() - started
+    finally:
+        crawler.close()
+
+    assert elapsed < 2
+    assert comments and {comment['video_id'] for comment in comments} == {'vidA0000001'}
+
+    print(f"✅ 멈춘 영상 포기 후 댓글 {len(comments)}개 유지 ({elapsed:.1f}초)")
+
+def test_concurrency_controller():
+    """AIMD 동시성 제어 테스트 - 정상이면 가산 증가, 과부하면 절반 감소, HTTP 동시 요청 수가 한도를 넘지 않음"""
+    config = ConfigManager()
+    controller = ConcurrencyController('test', 4, 1, 8, config, latency_target=1.0)
+
+    # 한도만큼 정상 응답이 오면 1 증가, 느린 응답은 한도를 유지
+    for _ in range(4):
+        controller.record(time.time())
+    assert controller.limit == 5
+    controller.record(time.time() - 5)
+    assert controller.limit == 5
+
+    started = time.time()
+    controller.record(started, error=True, overload=True)
+    assert controller.limit == 2
+    # 감소 전에 시작한 요청의 과부하는 다시 반영하지 않음
+    controller.record(started - 1, error=True, overload=True)
+    assert controller.limit == 2
+    assert ConcurrencyController.is_overload(asyncio.TimeoutError())
+
+    config.set('adaptive_concurrency', False)
+    controller.record(time.time(), error=True, overload=True)
+    assert controller.limit == 2
+
+    client = AsyncYouTubeHttpClient(ConfigManager())
+    client.concurrency = ConcurrencyController('HTTP', 3, 1, 3, client.config)
+    active = {'now': 0, 'peak': 0}
+
+    async def request():
+        async with client._limit('https://www.youtube.com/watch'):
+            active['now'] += 1
+            active['peak'] = max(active['peak'], active['now'])
+            await asyncio.sleep(0.01)
+            active['now'] -= 1
+
+    async def run_requests():
+        await asyncio.gather(*(request() for _ in range(20)))
+
+    asyncio.run(run_requests())
+    assert active['peak'] == 3
+    assert client.concurrency.get_stats()['samples'] == 20
+
+def test_hedged_comments():
+    """헤징 테스트 - p95보다 늦은 요청은 한 번 더 보내 먼저 끝난 결과를 쓰고 늦은 요청은 취소, 비율 상한 적용"""
+    print("\n🪃 댓글 요청 헤징 테스트...")
+
+    crawler = make_fixture_crawler(enable_hedging=True, hedge_max_ratio=0.5)
+    for _ in range(20):
+        crawler.monitor.record_latency('comments', 0.05)
+    calls = []
+    cancelled = []
+
+    async def slow_first_call(video_id, max_comments=50, time_budget=None):
+        calls.append(video_id)
+        try:
+            await asyncio.sleep(5 if len(calls) % 2 else 0.01)
+        except asyncio.CancelledError:
+            cancelled.append(video_id)
+            raise
+        return [{'video_id': video_id}]
+
+    crawler.backend.get_comments_async = slow_first_call
+    try:
+        started = time.time()
+        assert crawler.get_video_comments('vidA0000001', 5) == [{'video_id': 'vidA0000001'}]
+        assert time.time() - started < 1
+        assert calls == ['vidA0000001', 'vidA0000001'] and cancelled == ['vidA0000001']
+        hedging = crawler.get_performance_metrics()['metrics']['hedging']
+        assert hedging == {'comments_requests': 1, 'comments_hedged': 1, 'comments_hedge_wins': 1}
+
+        # 헤지 비율 상한(요청의 50%)에 도달하면 느린 요청도 그대로 기다림
+        crawler.config.set('hedge_max_ratio', 0.0)
+        calls.clear()
+        future = crawler.submit(crawler.get_video_comments_async('vidB0000002', 5))
+        time.sleep(0.5)
+        assert calls == ['vidB0000002'] and not future.done()
+        future.cancel()
+    finally:
+        crawler.close()
+
+    print("✅ 먼저 끝난 헤지 결과 사용 확인")
+
+def test_cache_memory_tier():
+    """메모리 캐시 테스트 - 크기 제한 LRU 제거, 항목별 만료, 줄이기 후 최근 항목 유지"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cache = CacheManager(temp_dir, max_memory_mb=0.01)  # 약 10KB
+        for index in range(5):
+            cache.set(f"key{index}", 'x' * 3000)
+            cache.get('key0')  # 자주 사용하는 항목은 계속 유지
+
+        stats = cache.get_stats()
+        assert stats['memory_cache_mb'] <= stats['memory_cache_limit_mb']
+        assert stats['evictions'] == 2 and 'key0' in cache._memory_cache
+        assert 'key1' not in cache._memory_cache
+        # 메모리에서 제거된 항목은 파일 캐시에서 다시 읽음
+        assert cache.get('key1') == 'x' * 3000 and cache.get_stats()['disk_hits'] == 1
+
+        cache.set('short', [1, 2, 3], ttl=0.05)
+        time.sleep(0.1)
+        assert 'short' in cache._memory_cache
+        cache.trim_memory(0.5)
+        assert 'short' not in cache._memory_cache and cache.get_stats()['expirations'] == 1
+        assert list(cache._memory_cache) == ['key1']
+
+        # 항목별 만료 시간은 파일 캐시에도 적용 (메모리에서 만료된 뒤 파일의 오래된 값을 다시 읽지 않음)
+        cache.set('short', [1, 2, 3], ttl=0.05)
+        assert cache.get('short') == [1, 2, 3]
+        time.sleep(0.1)
+        assert cache.get('short') is None
+        assert not os.path.exists(os.path.join(temp_dir, 'short.pkl'))
+        # 재시작 후(새 인스턴스)에도 파일의 만료 시각 사용
+        cache.set('long', 'value', ttl=3600)
+        restarted = CacheManager(temp_dir, ttl=0.01)
+        time.sleep(0.05)
+        assert restarted.get('long') == 'value'
+        assert restarted.get('short') is None
+
+def test_optimize_memory_trims_cache():
+    """메모리 사용량이 제한을 넘으면 메모리 캐시를 줄이는지 테스트"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        crawler = make_fixture_crawler(max_memory_mb=100)
+        crawler.cache = CacheManager(temp_dir)
+        trims = []
+        crawler.cache.trim_memory = lambda ratio=0.5: trims.append(ratio) or 0
+        try:
+            crawler.monitor.log_memory_usage = lambda: 50.0
+            crawler.optimize_memory()
+            assert trims == []
+
+            crawler.monitor.log_memory_usage = lambda: 150.0
+            crawler.optimize_memory()
+            assert trims == [0.5]
+            assert crawler.get_performance_metrics()['memory_usage_mb'] == 150.0
+        finally:
+            crawler.close()
+
+def test_shard_exit_after_done():
+    """결과 대기 시간이 끝난 직후 정상 종료한 샤드는 큐에 남은 'done' 메시지로 완료 처리, 메시지 없이 종료하면 비정상 종료"""
+    class ExitedProcess:
+        exitcode = 0
+
+        def is_alive(self):
+            return False
+
+    sharded = ShardedCrawler(processes=2)
+    sharded.shard_stats = {0: {'keywords': ['파이썬'], 'status': 'running'},
+                           1: {'keywords': ['자바'], 'status': 'running'}}
+    results = queue.Queue()
+    results.put(('videos', 0, '파이썬', [{'video_id': 'vidA0000001'}]))
+    results.put(('done', 0, None, {'videos': 1}))
+    pending = {0, 1}
+    handled = []
+
+    def handle_message(kind, shard_id, source, payload):
+        handled.append(kind)
+        if kind == 'done':
+            pending.discard(shard_id)
+            sharded.shard_stats[shard_id]['status'] = 'done'
+
+    sharded._check_crashed_workers({0: ExitedProcess(), 1: ExitedProcess()}, pending, results, handle_message)
+    assert handled == ['videos', 'done'] and not pending
+    assert sharded.shard_stats[0]['status'] == 'done'
+    assert sharded.shard_stats[1]['status'] == 'crashed'
+
+def test_split_shards():
+    """프로세스 샤드 분배 테스트"""
+    assert ShardedCrawler.split_shards(['a', 'b', 'c', 'd', 'e'], 3) == [['a', 'd'], ['b', 'e'], ['c']]
+    assert ShardedCrawler.split_shards(['a'], 4) == [['a']]
+
+def main():
+    """메인 테스트 함수"""
+    print("🧪 HTTP 엔진 오프라인 테스트")
+    print("=" * 50)
+
+    test_parse_search_page()
+    test_search_with_limit_and_date_range()
+    test_search_continuation()
+    test_comments_top()
+    test_comment_replies()
+    test_comments_newest_and_limit()
+    test_async_matches_sync()
+    test_iter_comments_async()
+    test_video_details()
+    test_parse_channel_feed()
+    test_channel_feed_monitor()
+    test_backend_interface()
+    test_auto_backend_fallback()
+    test_rate_limiter()
+    test_pipeline()
+    test_checkpoint_resume()
+    test_checkpoint_retries_failed_video()
+    test_truncated_comments_not_stored()
+    test_background_event_loop()
+    test_cancellation()
+    test_video_deadlines()
+    test_concurrency_controller()
+    test_hedged_comments()
+    test_cache_memory_tier()
+    test_optimize_memory_trims_cache()
+    test_shard_exit_after_done()
+    test_split_shards()
+    test_comments_disabled()
+    test_parse_like_count()
+    test_missing_initial_data()
+    test_text_of()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+분산 작업 큐 오프라인 테스트
+- 임대/완료/재시도/임대 만료 후 재할당 검증 (임시 SQLite DB 사용)
+- 저장된 fixtures/ 응답으로 워커 전체 흐름 검증 (네트워크/Chrome 불필요)
+"""
+
+import os
+import time
+import asyncio
+import tempfile
+import threading
+from youtube_crawler import SqliteWorkQueue, YouTubeCrawler, ConfigManager
+from test_http_engine import make_comment_engine, load_fixture, COMMENT_KEYS
+
+def make_queue(temp_dir: str, **config) -> SqliteWorkQueue:
+    """임시 디렉터리에 작업 큐 생성"""
+    config_manager = ConfigManager()
+    config_manager.update(config)
+    return SqliteWorkQueue(os.path.join(temp_dir, 'queue.db'), config_manager)
+
+def test_lease_and_complete():
+    """작업 등록, 중복 방지, 임대, 완료 테스트"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_queue = make_queue(temp_dir)
+        job_id = work_queue.submit_job(['파이썬', '자바'], 3, 0, job_id='job1')
+        assert not work_queue.enqueue(job_id, 'search', {'keyword': '파이썬'}, dedupe_key='파이썬')
+
+        tasks = work_queue.lease('node-a', 5)
+        assert [task['payload']['keyword'] for task in tasks] == ['파이썬', '자바']
+        assert work_queue.lease('node-b', 5) == []
+
+        assert work_queue.complete('node-a', tasks[0]['id'], [{'video_id': 'vidA0000001'}])
+        # 다른 노드는 임대하지 않은 작업을 완료할 수 없음
+        assert not work_queue.complete('node-b', tasks[1]['id'], [])
+        assert work_queue.stats(job_id) == {'pending': 0, 'leased': 1, 'done': 1, 'failed': 0}
+        assert work_queue.job_results(job_id) == ([{'video_id': 'vidA0000001'}], [])
+        work_queue.close()
+
+def test_lease_expiry_and_retry():
+    """임대 만료 후 재할당, 하트비트 연장, 최대 시도 횟수 초과 테스트"""
+    print("\n⏱️ 임대 만료/재시도 테스트...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_queue = make_queue(temp_dir, work_lease_timeout=0.2, work_max_attempts=2)
+        work_queue.submit_job(['파이썬', '자바'], 3, 0, job_id='job1')
+        first, second = work_queue.lease('node-a', 2)
+
+        # node-a가 첫 작업만 하트비트로 연장하고 멈춘 상황
+        time.sleep(0.12)
+        assert work_queue.heartbeat('node-a', [first['id']]) == [first['id']]
+        time.sleep(0.12)
+
+        reassigned = work_queue.lease('node-b', 5)
+        assert [task['id'] for task in reassigned] == [second['id']]
+        assert reassigned[0]['attempts'] == 2
+        # 임대를 잃은 노드의 완료는 무시
+        assert not work_queue.complete('node-a', second['id'], [])
+
+        # 두 번째 시도도 실패하면 실패 상태로 남음
+        assert work_queue.fail('node-b', second['id'], 'HTTP 429')
+        assert work_queue.stats()['failed'] == 1
+        assert work_queue.complete('node-a', first['id'], [])
+        assert not work_queue.has_unfinished()
+        work_queue.close()
+
+    print("✅ 임대 만료 작업 재할당 확인")
+
+def test_worker_end_to_end():
+    """워커가 검색 작업을 처리하고 영상별 댓글 작업을 추가하여 끝까지 처리하는지 테스트"""
+    print("\n🛠️ 작업 큐 워커 테스트...")
+
+    config = ConfigManager()
+    config.update({'engine': 'http', 'cache_enabled': False, 'work_concurrency': 4})
+    crawler = YouTubeCrawler(config)
+    comment_engine = make_comment_engine()
+    comment_engine.client.session.pages['https://www.youtube.com/results'] = load_fixture('search_results.html')
+    for engine in (crawler.http_search, crawler.http_comments, crawler.http_videos):
+        engine.client = comment_engine.client
+        engine.async_client = comment_engine.async_client
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_queue = make_queue(temp_dir)
+        job_id = work_queue.submit_job(['파이썬', '자바'], 3, 5)
+        try:
+            stats = crawler.run_worker(work_queue, node_id='node-a')
+        finally:
+            crawler.close()
+
+        # 검색 2개 + 중복 제거된 영상 3개의 댓글 작업
+        assert stats['succeeded'] == 5 and stats['failed'] == 0
+        videos, comments = work_queue.job_results(job_id)
+        assert len(videos) == 6
+        assert comments and all(COMMENT_KEYS <= set(comment) for comment in comments)
+        work_queue.close()
+
+    print(f"✅ 영상 {len(videos)}개, 댓글 {len(comments)}개")
+
+class LockedQueue(SqliteWorkQueue):
+    """다른 노드가 쓰기 잠금을 잡고 있는 것처럼 큐 호출마다 지연되는 작업 큐"""
+
+    DELAY = 0.2
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = set()
+
+    def _transaction(self):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.DELAY)
+        return super()._transaction()
+
+def test_worker_queue_calls_off_loop():
+    """작업 큐 호출(SQLite 잠금 대기)이 이벤트 루프를 막지 않는지 테스트"""
+    config = ConfigManager()
+    config.update({'engine': 'http', 'cache_enabled': False})
+    crawler = YouTubeCrawler(config)
+
+    async def fake_comments(video_id, max_comments=50, time_budget=None):
+        return [{'video_id': video_id}]
+
+    crawler.get_video_comments_async = fake_comments
+    gaps = []
+
+    async def run():
+        finished = asyncio.Event()
+
+        async def ticker():
+            last = time.time()
+            while not finished.is_set():
+                await asyncio.sleep(0.01)
+                gaps.append(time.time() - last)
+                last = time.time()
+
+        ticks = asyncio.ensure_future(ticker())
+        try:
+            return await crawler.run_worker_async(work_queue, node_id='node-a')
+        finally:
+            finished.set()
+            await ticks
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_queue = LockedQueue(os.path.join(temp_dir, 'queue.db'), ConfigManager())
+        work_queue.enqueue('job1', 'comments', {'video': {'video_id': 'vidA0000001'}, 'max_comments': 5},
+                           dedupe_key='vidA0000001')
+        work_queue.threads.clear()
+        try:
+            stats = crawler._run_sync(run())
+        finally:
+            crawler.close()
+            work_queue.close()
+
+    assert stats['succeeded'] == 1
+    assert work_queue.threads and all(name.startswith('work-queue') for name in work_queue.threads)
+    assert gaps and max(gaps) < LockedQueue.DELAY
+
+def main():
+    """메인 테스트 함수"""
+    print("🧪 분산 작업 큐 오프라인 테스트")
+    print("=" * 50)
+
+    test_lease_and_complete()
+    test_lease_expiry_and_retry()
+    test_worker_end_to_end()
+    test_worker_queue_calls_off_loop()
+
+    print("\n" + "=" * 50)
+    print("🎉 모든 테스트 완료!")
+
+if __name__ == "__main__":
+    main()
@@ -3,7 +3,13 @@ import re
 import subprocess
 import asyncio
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import multiprocessing
+import sqlite3
+import socket
+import uuid
+from contextlib import contextmanager, asynccontextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, CancelledError
 from datetime import datetime, timedelta
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -16,24 +22,28 @@ from webdriver_manager.chrome import ChromeDriverManager
 # beautifulsoup4는 현재 사용되지 않으므로 제거
 import pandas as pd
 import requests
-from urllib.parse import urlparse, parse_qs
+from urllib.parse import urlparse, parse_qs, quote_plus
 import json
 import os
 import pickle
 import hashlib
-from functools import lru_cache
+from functools import lru_cache, partial
+from abc import ABC, abstractmethod
 from dotenv import load_dotenv
 import logging
 from typing import List, Dict, Optional, Any, Tuple
 import gc
 import random
-from collections import defaultdict
+import xml.etree.ElementTree as ET
+from io import BytesIO
+from collections import defaultdict, deque, OrderedDict
 import numpy as np
 
 # 선택적 임포트 - 설치되지 않은 경우 대체 로직 사용
 textblob_available = False
 jieba_available = False
 konlpy_available = False
+aiohttp_available = False
 
 try:
     from textblob import TextBlob
@@ -53,6 +63,12 @@ try:
 except ImportError:
     pass
 
+try:
+    import aiohttp
+    aiohttp_available = True
+except ImportError:
+    pass
+
 # 로깅 설정 강화
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +82,54 @@ logger = logging.getLogger(__name__)
 
 load_dotenv()
 
+class CrawlCancelledError(Exception):
+    """크롤링 취소 예외"""
+    pass
+
+class CancellationToken:
+    """크롤링 취소 토큰 - 스레드(스크롤 루프, 드라이버 대기)와 코루틴이 함께 확인"""
+    
+    # 하위 토큰이 대기 중에 상위 토큰의 취소를 확인하는 간격 (초)
+    PARENT_CHECK_INTERVAL = 0.1
+    
+    def __init__(self, parent: Optional['CancellationToken'] = None):
+        self._event = threading.Event()
+        self.parent = parent
+    
+    def child(self) -> 'CancellationToken':
+        """하위 토큰 생성 - 이 토큰이 취소되면 함께 취소되고, 하위 토큰만 따로 취소할 수도 있음"""
+        return CancellationToken(self)
+    
+    def cancel(self):
+        """취소 요청"""
+        self._event.set()
+    
+    def reset(self):
+        """다음 작업을 위해 취소 상태 해제"""
+        self._event.clear()
+    
+    @property
+    def cancelled(self) -> bool:
+        """취소 요청 여부 (상위 토큰의 취소 포함)"""
+        return self._event.is_set() or (self.parent is not None and self.parent.cancelled)
+    
+    def raise_if_cancelled(self):
+        """취소되었으면 CrawlCancelledError 발생"""
+        if self.cancelled:
+            raise CrawlCancelledError("크롤링이 취소되었습니다.")
+    
+    def wait(self, timeout: float) -> bool:
+        """취소되거나 timeout이 지날 때까지 대기 - 취소되었으면 True"""
+        if self.parent is None:
+            return self._event.wait(timeout)
+        deadline = time.time() + timeout
+        while not self.cancelled:
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                return False
+            self._event.wait(min(remaining, self.PARENT_CHECK_INTERVAL))
+        return True
+
 class RetryManager:
     """재시도 관리 클래스"""
     
@@ -92,270 +156,2866 @@ class RetryManager:
         raise last_exception
 
 class CacheManager:
-    """캐시 관리 클래스 - 성능 개선"""
+    """캐시 관리 클래스 - 크기 제한 LRU 메모리 캐시 + 파일 캐시"""
     
-    def __init__(self, cache_dir="cache"):
+    # 파일 캐시 항목 표시 키 - 만료 시각을 데이터와 함께 저장 (이전 형식 파일은 데이터만 있어 수정 시각 + ttl로 만료)
+    ENTRY_MARKER = '__cache_entry__'
+    
+    def __init__(self, cache_dir="cache", max_memory_mb: float = 256, ttl: float = 43200):
         self.cache_dir = cache_dir
         os.makedirs(cache_dir, exist_ok=True)
-        self._memory_cache = {}
-        self._cache_stats = {'hits': 0, 'misses': 0}
+        # 메모리 캐시: 키 → (데이터, 만료 시각, 대략적인 크기) - 오래 사용하지 않은 항목이 앞쪽
+        self._memory_cache = OrderedDict()
+        self._memory_bytes = 0
+        self.max_memory_bytes = int(max_memory_mb * 1024 * 1024)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._cache_stats = {'hits': 0, 'misses': 0, 'memory_hits': 0, 'disk_hits': 0,
+                             'evictions': 0, 'expirations': 0, 'evicted_bytes': 0}
         
     def _get_cache_key(self, data: str) -> str:
         """캐시 키 생성"""
         return hashlib.md5(data.encode()).hexdigest()
     
-    def get(self, key: str) -> Optional[Any]:
-        """캐시에서 데이터 가져오기 - 메모리 캐시 우선"""
-        # 메모리 캐시 확인
-        if key in self._memory_cache:
-            self._cache_stats['hits'] += 1
-            return self._memory_cache[key]
-            
-        try:
-            cache_file = os.path.join(self.cache_dir, f"{key}.pkl")
-            if os.path.exists(cache_file):
-                # 캐시 만료 시간 체크 (12시간으로 단축)
-                if time.time() - os.path.getmtime(cache_file) < 43200:
-                    with open(cache_file, 'rb') as f:
-                        data = pickle.load(f)
-                        # 메모리 캐시에 저장
-                        self._memory_cache[key] = data
-                        self._cache_stats['hits'] += 1
-                        return data
-                else:
-                    os.remove(cache_file)  # 만료된 캐시 삭제
-        except Exception as e:
-            logger.warning(f"캐시 읽기 오류: {e}")
-            
-        self._cache_stats['misses'] += 1
-        return None
+    def get(self, key: str) -> Optional[Any]:
+        """캐시에서 데이터 가져오기 - 메모리 캐시 우선"""
+        # 메모리 캐시 확인 (만료된 항목은 제거)
+        with self._lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                data, expires_at, _ = entry
+                if time.time() < expires_at:
+                    self._memory_cache.move_to_end(key)
+                    self._cache_stats['hits'] += 1
+                    self._cache_stats['memory_hits'] += 1
+                    return data
+                self._remove(key)
+                self._cache_stats['expirations'] += 1
+            
+        try:
+            cache_file = os.path.join(self.cache_dir, f"{key}.pkl")
+            if os.path.exists(cache_file):
+                modified = os.path.getmtime(cache_file)
+                with open(cache_file, 'rb') as f:
+                    payload = f.read()
+                entry = pickle.loads(payload)
+                if isinstance(entry, dict) and entry.get(self.ENTRY_MARKER):
+                    data, expires_at = entry['data'], entry['expires_at']
+                else:
+                    data, expires_at = entry, modified + self.ttl
+                
+                # 캐시 만료 시간 체크 (항목별 ttl 포함)
+                if time.time() < expires_at:
+                    with self._lock:
+                        self._store(key, data, expires_at, len(payload))
+                        self._cache_stats['hits'] += 1
+                        self._cache_stats['disk_hits'] += 1
+                    return data
+                os.remove(cache_file)  # 만료된 캐시 삭제
+                with self._lock:
+                    self._cache_stats['expirations'] += 1
+        except Exception as e:
+            logger.warning(f"캐시 읽기 오류: {e}")
+            
+        with self._lock:
+            self._cache_stats['misses'] += 1
+        return None
+    
+    def set(self, key: str, data: Any, ttl: Optional[float] = None):
+        """캐시에 데이터 저장 - 메모리와 파일 모두 (ttl을 주면 기본 만료 시간 대신 그 시간 후 만료)"""
+        try:
+            expires_at = time.time() + (self.ttl if ttl is None else ttl)
+            # 파일에 쓸 직렬화 결과의 길이를 메모리 사용량 근사값으로 사용
+            payload = pickle.dumps({self.ENTRY_MARKER: True, 'expires_at': expires_at, 'data': data})
+            with self._lock:
+                self._store(key, data, expires_at, len(payload))
+            
+            # 파일 캐시에 저장
+            cache_file = os.path.join(self.cache_dir, f"{key}.pkl")
+            with open(cache_file, 'wb') as f:
+                f.write(payload)
+        except Exception as e:
+            logger.warning(f"캐시 저장 오류: {e}")
+    
+    def _store(self, key: str, data: Any, expires_at: float, size: int):
+        """메모리 캐시에 항목 추가 후 크기 제한을 넘은 만큼 오래된 항목 제거 (lock 보유 상태에서 호출)"""
+        self._remove(key)
+        if size > self.max_memory_bytes:
+            return  # 제한보다 큰 항목은 파일 캐시에만 보관
+        self._memory_cache[key] = (data, expires_at, size)
+        self._memory_bytes += size
+        self._evict(self.max_memory_bytes)
+    
+    def _remove(self, key: str):
+        """메모리 캐시 항목 제거 (lock 보유 상태에서 호출)"""
+        entry = self._memory_cache.pop(key, None)
+        if entry is not None:
+            self._memory_bytes -= entry[2]
+    
+    def _evict(self, max_bytes: int):
+        """메모리 사용량이 max_bytes 이하가 될 때까지 가장 오래 사용하지 않은 항목 제거 (lock 보유 상태에서 호출)"""
+        while self._memory_cache and self._memory_bytes > max_bytes:
+            _, (_, _, size) = self._memory_cache.popitem(last=False)
+            self._memory_bytes -= size
+            self._cache_stats['evictions'] += 1
+            self._cache_stats['evicted_bytes'] += size
+    
+    def trim_memory(self, ratio: float = 0.5) -> int:
+        """메모리 캐시를 현재 사용량의 ratio 이하로 줄임 (최근 사용한 항목 유지) - 해제한 바이트 수 반환"""
+        with self._lock:
+            now = time.time()
+            before = self._memory_bytes
+            for key in [key for key, (_, expires_at, _) in self._memory_cache.items() if expires_at <= now]:
+                self._remove(key)
+                self._cache_stats['expirations'] += 1
+            self._evict(int(before * ratio))
+            return before - self._memory_bytes
+    
+    def clear(self):
+        """캐시 전체 삭제"""
+        try:
+            with self._lock:
+                self._memory_cache.clear()
+                self._memory_bytes = 0
+            for file in os.listdir(self.cache_dir):
+                if file.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, file))
+            logger.info("캐시가 삭제되었습니다.")
+        except Exception as e:
+            logger.error(f"캐시 삭제 오류: {e}")
+    
+    def get_stats(self) -> Dict:
+        """캐시 통계 반환"""
+        with self._lock:
+            total = self._cache_stats['hits'] + self._cache_stats['misses']
+            hit_rate = (self._cache_stats['hits'] / total * 100) if total > 0 else 0
+            return {
+                **self._cache_stats,
+                'hit_rate': f"{hit_rate:.1f}%",
+                'memory_cache_size': len(self._memory_cache),
+                'memory_cache_mb': round(self._memory_bytes / 1024 / 1024, 2),
+                'memory_cache_limit_mb': round(self.max_memory_bytes / 1024 / 1024, 2)
+            }
+
+class CheckpointJournal:
+    """작업 체크포인트 저널 - 완료한 단위 작업(키워드 검색, 영상 댓글 수집)과 결과를 작업 ID별 JSONL 파일에 추가 기록"""
+    
+    def __init__(self, job_id: str, checkpoint_dir: str = "checkpoints"):
+        self.job_id = job_id
+        self.path = os.path.join(checkpoint_dir, f"{job_id}.jsonl")
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        self.params = None
+        self.finished = False
+        self.units = {}
+        self._lock = threading.Lock()
+        self._load()
+    
+    def _load(self):
+        """저널 파일에서 작업 설정과 완료한 단위 작업 로드"""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        
+        # 기록 도중 중단되어 잘린 마지막 줄은 잘라내어 다음 기록과 섞이지 않도록 함
+        valid_length = data.rfind(b'\n') + 1
+        if valid_length < len(data):
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_length)
+        
+        for line in data[:valid_length].decode('utf-8').splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            entry_type = entry.get('type')
+            if entry_type == 'job':
+                self.params = entry.get('params')
+            elif entry_type == 'unit':
+                self.units[entry['unit']] = entry.get('output')
+            elif entry_type == 'finished':
+                self.finished = True
+    
+    def _append(self, entry: Dict):
+        """저널에 한 줄 추가 (디스크까지 기록)"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+    
+    @property
+    def exists(self) -> bool:
+        """작업 설정이 기록된 저널인지 여부"""
+        return self.params is not None
+    
+    def start(self, params: Dict):
+        """작업 설정 기록 (이미 기록된 작업이면 기존 설정 유지)"""
+        with self._lock:
+            if self.params is None:
+                self.params = params
+                self._append({'type': 'job', 'job_id': self.job_id, 'params': params,
+                              'created_at': datetime.now().isoformat()})
+    
+    def is_done(self, unit: str) -> bool:
+        """단위 작업 완료 여부"""
+        with self._lock:
+            return unit in self.units
+    
+    def get(self, unit: str) -> Any:
+        """완료한 단위 작업의 결과"""
+        with self._lock:
+            return self.units.get(unit)
+    
+    def record(self, unit: str, output: Any):
+        """단위 작업 완료 및 결과 기록"""
+        with self._lock:
+            self.units[unit] = output
+            self._append({'type': 'unit', 'unit': unit, 'output': output,
+                          'completed_at': datetime.now().isoformat()})
+    
+    def finish(self):
+        """작업 전체 완료 기록"""
+        with self._lock:
+            if not self.finished:
+                self.finished = True
+                self._append({'type': 'finished', 'completed_at': datetime.now().isoformat()})
+    
+    def remove(self):
+        """저널 파일 삭제"""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
+            self.params = None
+            self.finished = False
+            self.units = {}
+
+class ConfigManager:
+    """설정 관리 클래스 - 성능 최적화"""
+    
+    def __init__(self):
+        self.config = {
+            'max_workers': int(os.getenv('MAX_WORKERS', '6')),  # 워커 수 증가
+            'timeout': int(os.getenv('TIMEOUT', '30')),
+            'retry_count': int(os.getenv('RETRY_COUNT', '3')),
+            'cache_enabled': os.getenv('CACHE_ENABLED', 'true').lower() == 'true',
+            'cache_expiry': float(os.getenv('CACHE_EXPIRY', '43200')),  # 캐시 만료 시간 (초)
+            'cache_memory_mb': float(os.getenv('CACHE_MEMORY_MB', '256')),  # 메모리 캐시 크기 상한
+            'headless': os.getenv('HEADLESS', 'true').lower() == 'true',
+            'scroll_count': int(os.getenv('SCROLL_COUNT', '3')),  # 스크롤 수 감소로 속도 향상
+            'wait_time': float(os.getenv('WAIT_TIME', '1.5')),  # 대기 시간 단축
+            'max_memory_mb': int(os.getenv('MAX_MEMORY_MB', '4096')),  # 메모리 증가
+            'comment_batch_size': int(os.getenv('COMMENT_BATCH_SIZE', '20')),  # 댓글 배치 크기
+            'enable_keyword_analysis': os.getenv('ENABLE_KEYWORD_ANALYSIS', 'true').lower() == 'true',
+            'max_comments_per_video': int(os.getenv('MAX_COMMENTS_PER_VIDEO', '100')),
+            'excel_encoding': os.getenv('EXCEL_ENCODING', 'utf-8-sig'),  # 엑셀 인코딩 설정
+            # 네트워크 최적화 설정 추가
+            'page_load_timeout': int(os.getenv('PAGE_LOAD_TIMEOUT', '20')),
+            'implicit_wait': int(os.getenv('IMPLICIT_WAIT', '5')),
+            'network_idle_timeout': int(os.getenv('NETWORK_IDLE_TIMEOUT', '3')),
+            'connection_timeout': int(os.getenv('CONNECTION_TIMEOUT', '10')),
+            'request_timeout': int(os.getenv('REQUEST_TIMEOUT', '15')),
+            # 드라이버 풀 설정
+            'driver_health_check_interval': float(os.getenv('DRIVER_HEALTH_CHECK_INTERVAL', '30')),
+            # DOM 변경 대기 설정 (이 시간 동안 변화가 없으면 로딩 완료로 간주)
+            'dom_quiet_period': float(os.getenv('DOM_QUIET_PERIOD', '0.4')),
+            # 영상당 댓글 연속 로딩 시간 예산 (초)
+            'comment_time_budget': float(os.getenv('COMMENT_TIME_BUDGET', '60')),
+            # 작업 전체 시간 예산 (초, 0이면 제한 없음) 및 예산에 맞춰 줄일 때의 영상당 최소 댓글 수
+            'job_time_budget': float(os.getenv('JOB_TIME_BUDGET', '0')),
+            'min_comments_per_video': int(os.getenv('MIN_COMMENTS_PER_VIDEO', '5')),
+            # 댓글 요청 헤징 (rolling p95보다 오래 걸리면 같은 요청을 한 번 더 보내고 먼저 끝난 결과 사용)
+            'enable_hedging': os.getenv('ENABLE_HEDGING', 'false').lower() == 'true',
+            'hedge_max_ratio': float(os.getenv('HEDGE_MAX_RATIO', '0.05')),  # 전체 댓글 요청 중 헤지 요청 비율 상한
+            # 요청 차단 설정 (쉼표로 구분된 URL 패턴, 비우면 기본 목록 사용)
+            'block_requests': os.getenv('BLOCK_REQUESTS', 'true').lower() == 'true',
+            'blocked_url_patterns': [p.strip() for p in os.getenv('BLOCKED_URL_PATTERNS', '').split(',') if p.strip()],
+            'unblocked_url_patterns': [p.strip() for p in os.getenv('UNBLOCK_URL_PATTERNS', '').split(',') if p.strip()],
+            # 크롤링 엔진 (browser: Chrome, http: 브라우저 없이 HTTP, auto: HTTP 우선 후 실패한 요청만 브라우저)
+            'engine': os.getenv('ENGINE', 'browser').lower(),
+            'http_pool_size': int(os.getenv('HTTP_POOL_SIZE', '20')),
+            # 검색 연속 페이지 최대 요청 수 (키워드당)
+            'search_max_pages': int(os.getenv('SEARCH_MAX_PAGES', '20')),
+            # HTTP 엔진 댓글 정렬 (top: 인기 댓글순, newest: 최신순)
+            'comment_sort': os.getenv('COMMENT_SORT', 'top'),
+            # 비동기 HTTP 동시 요청 수 (전체 / 호스트별)
+            'http_max_concurrency': int(os.getenv('HTTP_MAX_CONCURRENCY', '100')),
+            'http_per_host_concurrency': int(os.getenv('HTTP_PER_HOST_CONCURRENCY', '32')),
+            # 적응형 동시성 제어 (AIMD: 정상이면 한도를 조금씩 늘리고 타임아웃/429/메모리 부족이면 절반으로 줄임)
+            'adaptive_concurrency': os.getenv('ADAPTIVE_CONCURRENCY', 'true').lower() == 'true',
+            'max_workers_limit': int(os.getenv('MAX_WORKERS_LIMIT', '0')),  # 브라우저 워커 상한 (0이면 max_workers의 2배)
+            'http_latency_target': float(os.getenv('HTTP_LATENCY_TARGET', '2.0')),
+            'concurrency_error_threshold': float(os.getenv('CONCURRENCY_ERROR_THRESHOLD', '0.2')),
+            'memory_pressure_percent': float(os.getenv('MEMORY_PRESSURE_PERCENT', '90')),
+            # 답글 수집 (기본 비활성화) 및 영상당 최대 답글 수
+            'collect_replies': os.getenv('COLLECT_REPLIES', 'false').lower() == 'true',
+            'max_replies_per_video': int(os.getenv('MAX_REPLIES_PER_VIDEO', '100')),
+            # 검색 결과를 시청 페이지 상세 정보로 보강 (정확한 조회수, 게시 시각, 길이, 좋아요/댓글 수)
+            'enrich_videos': os.getenv('ENRICH_VIDEOS', 'false').lower() == 'true',
+            # 채널 피드 모니터링 (상태 파일 경로, 확인 주기 초)
+            'channel_state_file': os.getenv('CHANNEL_STATE_FILE', 'channel_feed_state.json'),
+            'channel_poll_interval': float(os.getenv('CHANNEL_POLL_INTERVAL', '900')),
+            # 요청 속도 제한 (엔드포인트별 초당 최대 요청 수, 예: search=5,watch=10,comments=20)
+            'rate_limit_enabled': os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true',
+            'rate_limits': {
+                name.strip(): float(value)
+                for name, value in (item.split('=', 1) for item in os.getenv('RATE_LIMITS', '').split(',') if '=' in item)
+            },
+            'rate_limit_burst': float(os.getenv('RATE_LIMIT_BURST', '20')),
+            # 파이프라인 단계 사이 큐 크기 및 HTTP 엔진 댓글 워커 수 (브라우저는 워커 수 = 드라이버 수)
+            'pipeline_queue_size': int(os.getenv('PIPELINE_QUEUE_SIZE', '100')),
+            'pipeline_comment_workers': int(os.getenv('PIPELINE_COMMENT_WORKERS', '32')),
+            # 프로세스 샤딩 (1이면 단일 프로세스, 2 이상이면 프로세스마다 키워드 일부를 크롤링, 0이면 CPU 코어 수)
+            'crawl_processes': int(os.getenv('CRAWL_PROCESSES', '1')),
+            # 분산 작업 큐 (DB 경로, 임대 시간 초, 최대 시도 횟수, 노드당 동시 작업 수)
+            'work_queue_path': os.getenv('WORK_QUEUE_PATH', 'work_queue.db'),
+            'work_lease_timeout': float(os.getenv('WORK_LEASE_TIMEOUT', '120')),
+            'work_max_attempts': int(os.getenv('WORK_MAX_ATTEMPTS', '3')),
+            'work_concurrency': int(os.getenv('WORK_CONCURRENCY', '8')),
+            # 작업 체크포인트 저널 디렉터리 (작업 ID별 JSONL)
+            'checkpoint_dir': os.getenv('CHECKPOINT_DIR', 'checkpoints')
+        }
+    
+    def get(self, key: str, default=None):
+        """설정값 가져오기"""
+        return self.config.get(key, default)
+    
+    def set(self, key: str, value):
+        """설정값 설정"""
+        self.config[key] = value
+    
+    def update(self, new_config: Dict):
+        """설정 업데이트"""
+        self.config.update(new_config)
+
+class JobTimeBudget:
+    """작업 전체 시간 예산 - 마감이 가까워지면 남은 영상의 댓글 목표 수와 영상당 시간 예산을 줄임"""
+    
+    def __init__(self, total_seconds: float, workers: int, video_budget: float, min_comments: int = 5):
+        # total_seconds가 0 이하이면 제한 없이 영상당 시간 예산만 적용
+        self.deadline = time.time() + total_seconds if total_seconds > 0 else None
+        self.workers = max(1, workers)
+        self.video_budget = video_budget
+        self.min_comments = min_comments
+        self.pending = 0
+        self.stats = {'videos': 0, 'reduced': 0, 'skipped': 0, 'timed_out': 0}
+    
+    def add(self, count: int = 1):
+        """처리할 영상 추가"""
+        self.pending += count
+    
+    def finish(self):
+        """영상 하나 처리 완료"""
+        self.pending = max(0, self.pending - 1)
+    
+    def plan(self, max_comments: int) -> Tuple[int, float]:
+        """다음 영상의 (댓글 목표 수, 시간 예산) - 작업 예산이 끝났으면 목표 수 0"""
+        self.stats['videos'] += 1
+        if self.deadline is None:
+            return max_comments, self.video_budget
+        
+        remaining = self.deadline - time.time()
+        if remaining <= 0:
+            self.stats['skipped'] += 1
+            return 0, 0.0
+        
+        # 남은 영상을 워커들이 나누어 처리할 때 영상 하나에 쓸 수 있는 시간
+        slot = remaining * self.workers / max(1, self.pending)
+        if slot >= self.video_budget:
+            return max_comments, self.video_budget
+        
+        self.stats['reduced'] += 1
+        target = max(min(self.min_comments, max_comments), int(max_comments * slot / self.video_budget))
+        return target, min(slot, remaining)
+
+class RateLimiter:
+    """토큰 버킷 요청 속도 제한 - 호스트와 엔드포인트 종류별로 모든 워커(스레드/코루틴)가 공유"""
+    
+    # URL 경로로 엔드포인트 종류 구분 (앞에서부터 먼저 일치하는 항목 사용)
+    ENDPOINT_PATTERNS = [
+        ('/results', 'search'),
+        ('/youtubei/v1/search', 'search'),
+        ('/youtubei/v1/next', 'comments'),
+        ('/watch', 'watch'),
+        ('/youtubei/v1/player', 'watch'),
+        ('/feeds/', 'feed'),
+    ]
+    DEFAULT_RATES = {'search': 5.0, 'watch': 10.0, 'comments': 20.0, 'feed': 50.0, 'default': 10.0}
+    # 차단 신호(429/동의/캡차) 시 속도 감소 비율, 성공 시 최대 속도 대비 회복 비율
+    DECREASE_FACTOR = 0.5
+    RECOVERY_RATIO = 0.02
+    MIN_RATE = 0.2
+    
+    def __init__(self, config: Optional[ConfigManager] = None):
+        self.config = config or ConfigManager()
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self.reload()
+    
+    def reload(self):
+        """설정에서 활성화 여부, 버스트 크기, 엔드포인트별 최대 속도를 다시 읽음"""
+        with self._lock:
+            self.enabled = self.config.get('rate_limit_enabled', True)
+            self.burst = max(1.0, float(self.config.get('rate_limit_burst', 20)))
+            self.max_rates = dict(self.DEFAULT_RATES)
+            self.max_rates.update(self.config.get('rate_limits') or {})
+            for (_, endpoint), bucket in self._buckets.items():
+                bucket['max_rate'] = float(self.max_rates.get(endpoint, self.max_rates['default']))
+                bucket['rate'] = min(bucket['rate'], bucket['max_rate'])
+    
+    @classmethod
+    def endpoint_class(cls, url: str) -> str:
+        """URL의 엔드포인트 종류 (search, watch, comments, feed, default)"""
+        path = urlparse(url).path or '/'
+        for prefix, name in cls.ENDPOINT_PATTERNS:
+            if path.startswith(prefix):
+                return name
+        return 'default'
+    
+    def _key(self, url: str) -> Tuple[str, str]:
+        """버킷 키 (호스트, 엔드포인트 종류) - 상대 URL은 YouTube 호스트로 간주"""
+        host = urlparse(url).hostname or 'www.youtube.com'
+        return host, self.endpoint_class(url)
+    
+    def _bucket(self, key: Tuple[str, str]) -> Dict:
+        """키별 버킷 반환 (없으면 가득 찬 상태로 생성) - 잠금 안에서 호출"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            max_rate = float(self.max_rates.get(key[1], self.max_rates['default']))
+            bucket = {
+                'rate': max_rate,
+                'max_rate': max_rate,
+                'tokens': self.burst,
+                'updated': time.monotonic(),
+                'requests': 0,
+                'throttled': 0,
+                'wait_time': 0.0
+            }
+            self._buckets[key] = bucket
+        return bucket
+    
+    def _reserve(self, url: str) -> float:
+        """토큰 하나를 예약하고 기다려야 할 시간(초) 반환 - 대기는 잠금 밖에서 수행"""
+        if not self.enabled:
+            return 0.0
+        with self._lock:
+            bucket = self._bucket(self._key(url))
+            now = time.monotonic()
+            bucket['tokens'] = min(self.burst, bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+            bucket['updated'] = now
+            # 토큰이 부족하면 음수로 예약하여 먼저 온 요청부터 순서대로 대기
+            bucket['tokens'] -= 1
+            bucket['requests'] += 1
+            wait = -bucket['tokens'] / bucket['rate'] if bucket['tokens'] < 0 else 0.0
+            bucket['wait_time'] += wait
+            return wait
+    
+    def acquire(self, url: str):
+        """요청 전 토큰 획득 (스레드용, 필요하면 대기)"""
+        wait = self._reserve(url)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, url: str):
+        """요청 전 토큰 획득 (코루틴용, 이벤트 루프를 막지 않고 대기)"""
+        wait = self._reserve(url)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @staticmethod
+    def is_throttled(status: Optional[int], final_url: str = '') -> bool:
+        """차단 신호 여부 - 429 응답, 쿠키 동의 페이지 또는 캡차(/sorry/) 페이지로 리다이렉트"""
+        if status == 429:
+            return True
+        parsed = urlparse(final_url or '')
+        return (parsed.hostname or '').startswith('consent.') or parsed.path.startswith('/sorry/')
+    
+    def observe(self, url: str, status: Optional[int] = None, final_url: str = ''):
+        """응답 결과를 반영 - 차단 신호면 속도를 줄이고, 성공하면 최대 속도까지 조금씩 회복"""
+        if not self.enabled:
+            return
+        throttled = self.is_throttled(status, final_url)
+        with self._lock:
+            bucket = self._bucket(self._key(url))
+            if throttled:
+                bucket['rate'] = max(self.MIN_RATE, bucket['rate'] * self.DECREASE_FACTOR)
+                # 남은 토큰을 비워 대기 중인 다른 워커도 함께 속도를 늦춤
+                bucket['tokens'] = min(bucket['tokens'], 0.0)
+                bucket['throttled'] += 1
+            elif status is None or status < 400:
+                bucket['rate'] = min(bucket['max_rate'], bucket['rate'] + bucket['max_rate'] * self.RECOVERY_RATIO)
+        if throttled:
+            logger.warning(f"요청 제한 감지 ({self.endpoint_class(url)}), 요청 속도 감소: {bucket['rate']:.2f}/초")
+    
+    def get_stats(self) -> Dict:
+        """버킷별 현재 속도 및 통계"""
+        with self._lock:
+            return {
+                f"{host}:{endpoint}": {
+                    'rate': round(bucket['rate'], 2),
+                    'max_rate': bucket['max_rate'],
+                    'requests': bucket['requests'],
+                    'throttled': bucket['throttled'],
+                    'wait_time': round(bucket['wait_time'], 2)
+                }
+                for (host, endpoint), bucket in self._buckets.items()
+            }
+
+class ConcurrencyController:
+    """AIMD 동시성 제어
+    
+    지연 시간과 오류율이 정상이면 한도만큼 성공할 때마다 1씩 늘리고(가산 증가),
+    타임아웃/429/503 또는 메모리 부족이면 절반으로 줄임(곱셈 감소)
+    """
+    
+    DECREASE_FACTOR = 0.5
+    # 오류율 계산에 사용하는 최근 결과 수
+    WINDOW = 20
+    # 과부하로 보는 HTTP 상태 코드
+    OVERLOAD_STATUSES = (429, 503)
+    
+    def __init__(self, name: str, initial: int, minimum: int, maximum: int, config: ConfigManager,
+                 latency_target: float = 0.0, on_change=None):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.config = config
+        # 0이면 지연 시간은 판단에 사용하지 않음 (브라우저 작업은 영상마다 시간 차이가 큼)
+        self.latency_target = latency_target
+        self.on_change = on_change
+        self._limit = min(max(initial, self.minimum), self.maximum)
+        self._successes = 0
+        self._outcomes = deque(maxlen=self.WINDOW)
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._stats = {'samples': 0, 'errors': 0, 'overloads': 0, 'increases': 0, 'decreases': 0}
+    
+    @property
+    def limit(self) -> int:
+        """현재 동시성 한도"""
+        return self._limit
+    
+    @classmethod
+    def is_overload(cls, error: BaseException) -> bool:
+        """타임아웃 또는 429/503 응답인지 확인"""
+        if isinstance(error, (asyncio.TimeoutError, TimeoutError, requests.Timeout, TimeoutException)):
+            return True
+        # aiohttp는 status, requests는 response.status_code
+        status = getattr(error, 'status', None)
+        if status is None and getattr(error, 'response', None) is not None:
+            status = getattr(error.response, 'status_code', None)
+        return status in cls.OVERLOAD_STATUSES
+    
+    def memory_pressure(self) -> bool:
+        """시스템 메모리 사용률이 memory_pressure_percent 이상인지 확인"""
+        try:
+            import psutil
+            return psutil.virtual_memory().percent >= self.config.get('memory_pressure_percent', 90)
+        except ImportError:
+            return False
+    
+    def record(self, started: float, error: bool = False, overload: bool = False):
+        """작업 하나의 결과 반영 - started는 작업 시작 시각"""
+        latency = time.time() - started
+        with self._lock:
+            old_limit = self.limit
+            self._stats['samples'] += 1
+            if overload:
+                self._stats['overloads'] += 1
+            elif error:
+                self._stats['errors'] += 1
+            self._outcomes.append(error or overload)
+            if not self.config.get('adaptive_concurrency', True):
+                return
+            
+            error_rate = sum(self._outcomes) / len(self._outcomes)
+            too_many_errors = len(self._outcomes) >= self.WINDOW // 2 and \
+                error_rate > self.config.get('concurrency_error_threshold', 0.2)
+            if overload or too_many_errors:
+                # 마지막 감소 전에 시작한 작업의 실패는 이미 반영된 과부하이므로 다시 줄이지 않음
+                if started >= self._last_decrease:
+                    self._limit = max(self.minimum, int(self._limit * self.DECREASE_FACTOR))
+                    self._last_decrease = time.time()
+                    self._outcomes.clear()
+                    self._successes = 0
+                    self._stats['decreases'] += 1
+            elif error:
+                self._successes = 0
+            elif (not self.latency_target or latency <= self.latency_target):
+                # 현재 한도만큼 연속으로 정상 완료되면 1 증가
+                self._successes += 1
+                if self._successes >= self._limit:
+                    self._successes = 0
+                    self._limit = min(self.maximum, self._limit + 1)
+            
+            new_limit = self.limit
+            if new_limit > old_limit:
+                self._stats['increases'] += 1
+        
+        if new_limit != old_limit:
+            logger.info(f"{self.name} 동시성 한도 변경: {old_limit} → {new_limit}")
+            if self.on_change:
+                self.on_change(new_limit)
+    
+    @contextmanager
+    def track(self, check_memory: bool = False):
+        """블록 실행 시간과 예외를 결과로 기록 (check_memory면 완료 후 메모리 부족도 과부하로 처리)"""
+        started = time.time()
+        try:
+            yield
+        except CrawlCancelledError:
+            raise
+        except Exception as e:
+            self.record(started, error=True, overload=self.is_overload(e))
+            raise
+        self.record(started, overload=check_memory and self.memory_pressure())
+    
+    def get_stats(self) -> Dict:
+        """현재 한도와 통계 반환"""
+        with self._lock:
+            return {'limit': self.limit, 'minimum': self.minimum, 'maximum': self.maximum, **self._stats}
+
+class PerformanceMonitor:
+    """성능 모니터링 클래스 - 강화된 버전"""
+    
+    # 작업별 지연 시간 백분위 계산에 사용하는 최근 표본 수와 최소 표본 수
+    LATENCY_WINDOW = 200
+    LATENCY_MIN_SAMPLES = 20
+    
+    def __init__(self):
+        self.timers = {}
+        self.memory_usage = []
+        self.start_time = time.time()
+        self.operation_counts = defaultdict(int)
+        self.error_counts = defaultdict(int)
+        self.network_stats = defaultdict(int)
+        self.backend_stats = defaultdict(int)
+        self.latencies = defaultdict(lambda: deque(maxlen=self.LATENCY_WINDOW))
+        self.hedge_stats = defaultdict(int)
+        
+    def start_timer(self, name: str):
+        """타이머 시작"""
+        self.timers[name] = time.time()
+        self.operation_counts[name] += 1
+    
+    def end_timer(self, name: str):
+        """타이머 종료 및 시간 반환"""
+        if name in self.timers:
+            elapsed = time.time() - self.timers[name]
+            logger.info(f"{name} 실행 시간: {elapsed:.2f}초")
+            return elapsed
+        return 0
+    
+    def log_error(self, operation: str, error: Exception):
+        """에러 로깅"""
+        self.error_counts[operation] += 1
+        logger.error(f"{operation} 에러: {error}")
+    
+    def record_network_stats(self, page: str, stats: Dict):
+        """페이지별 네트워크 통계(차단 요청, 전송/절약 바이트) 누적"""
+        self.network_stats['pages'] += 1
+        for key, value in stats.items():
+            self.network_stats[key] += value
+        logger.info(
+            f"{page} 네트워크: 전송 {stats.get('transferred_bytes', 0) / 1024:.0f}KB, "
+            f"차단 {stats.get('blocked_requests', 0)}건 "
+            f"(절약 추정 {stats.get('estimated_bytes_saved', 0) / 1024:.0f}KB)"
+        )
+    
+    def record_backend_request(self, operation: str, fallback: bool = False):
+        """자동 백엔드의 작업별 요청 수와 보조 백엔드 대체 횟수 누적"""
+        self.backend_stats[f"{operation}_requests"] += 1
+        if fallback:
+            self.backend_stats[f"{operation}_fallbacks"] += 1
+    
+    def record_latency(self, operation: str, seconds: float):
+        """작업 지연 시간 표본 추가 (최근 LATENCY_WINDOW개 유지)"""
+        self.latencies[operation].append(seconds)
+    
+    def latency_percentile(self, operation: str, percentile: float) -> Optional[float]:
+        """최근 지연 시간의 백분위 값 - 표본이 LATENCY_MIN_SAMPLES개 미만이면 None"""
+        samples = self.latencies.get(operation)
+        if not samples or len(samples) < self.LATENCY_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, max(0, int(np.ceil(percentile / 100 * len(ordered))) - 1))
+        return ordered[index]
+    
+    def record_hedge(self, operation: str, hedged: bool = False, hedge_won: bool = False):
+        """헤징 대상 요청 수, 헤지 요청 수, 헤지 요청이 먼저 끝난 횟수 누적"""
+        self.hedge_stats[f"{operation}_requests"] += 1
+        if hedged:
+            self.hedge_stats[f"{operation}_hedged"] += 1
+        if hedge_won:
+            self.hedge_stats[f"{operation}_hedge_wins"] += 1
+    
+    def get_metrics(self) -> Dict:
+        """성능 메트릭 반환"""
+        total_time = time.time() - self.start_time
+        return {
+            'total_time': total_time,
+            'timers': self.timers.copy(),
+            'memory_usage': self.memory_usage,
+            'operation_counts': dict(self.operation_counts),
+            'error_counts': dict(self.error_counts),
+            'network': dict(self.network_stats),
+            'backend': self._calculate_fallback_rate(),
+            'latency': {
+                operation: {
+                    'samples': len(samples),
+                    'p50': self.latency_percentile(operation, 50),
+                    'p95': self.latency_percentile(operation, 95)
+                }
+                for operation, samples in self.latencies.items()
+            },
+            'hedging': dict(self.hedge_stats),
+            'success_rate': self._calculate_success_rate()
+        }
+    
+    def _calculate_fallback_rate(self) -> Dict:
+        """백엔드 대체율 계산"""
+        requests_total = sum(v for k, v in self.backend_stats.items() if k.endswith('_requests'))
+        fallbacks_total = sum(v for k, v in self.backend_stats.items() if k.endswith('_fallbacks'))
+        rate = (fallbacks_total / requests_total * 100) if requests_total > 0 else 0
+        return {
+            'requests': requests_total,
+            'fallbacks': fallbacks_total,
+            'fallback_rate': f"{rate:.1f}%",
+            'by_operation': dict(self.backend_stats)
+        }
+    
+    def _calculate_success_rate(self) -> Dict:
+        """성공률 계산"""
+        rates = {}
+        for operation in self.operation_counts:
+            total = self.operation_counts[operation]
+            errors = self.error_counts.get(operation, 0)
+            success_rate = ((total - errors) / total * 100) if total > 0 else 100
+            rates[operation] = f"{success_rate:.1f}%"
+        return rates
+    
+    def log_memory_usage(self) -> Optional[float]:
+        """메모리 사용량 로깅 - 현재 RSS(MB) 반환 (psutil이 없으면 None)"""
+        try:
+            import psutil
+            process = psutil.Process()
+            memory_info = process.memory_info()
+            memory_mb = memory_info.rss / 1024 / 1024
+            self.memory_usage.append({
+                'timestamp': time.time(),
+                'memory_mb': memory_mb
+            })
+            logger.info(f"메모리 사용량: {memory_mb:.1f}MB")
+            return memory_mb
+        except ImportError:
+            logger.warning("psutil이 설치되지 않아 메모리 모니터링을 사용할 수 없습니다.")
+            return None
+
+class BackgroundEventLoop:
+    """백그라운드 스레드에서 계속 실행되는 이벤트 루프 - 동기 코드에서 코루틴을 제출하고 결과를 기다림"""
+    
+    def __init__(self, name: str = "YouTubeCrawlerLoop"):
+        self.name = name
+        self._loop = None
+        self._thread = None
+        self._lock = threading.Lock()
+    
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """실행 중인 루프 (처음 사용할 때 스레드 시작)"""
+        with self._lock:
+            if self._loop is None:
+                ready = threading.Event()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_forever, args=(self._loop, ready), name=self.name, daemon=True
+                )
+                self._thread.start()
+                ready.wait()
+            return self._loop
+    
+    @staticmethod
+    def _run_forever(loop: asyncio.AbstractEventLoop, ready: threading.Event):
+        """루프 스레드 본체"""
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        loop.run_forever()
+    
+    def submit(self, coro):
+        """코루틴 제출 - concurrent.futures.Future 반환 (여러 작업을 동시에 실행 가능)"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+    
+    def run(self, coro, timeout: Optional[float] = None):
+        """코루틴을 실행하고 결과 반환 (호출 스레드에서 대기)"""
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("이벤트 루프 스레드 안에서는 동기 메서드를 호출할 수 없습니다. 비동기 메서드를 await 하세요.")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # 시간 초과나 KeyboardInterrupt 시 루프에 남은 작업도 취소
+            future.cancel()
+            raise
+    
+    def cancel_all(self):
+        """루프에서 실행 중인 모든 작업 취소 (루프는 계속 실행)"""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        
+        def cancel_tasks():
+            for task in asyncio.all_tasks(loop):
+                task.cancel()
+        
+        loop.call_soon_threadsafe(cancel_tasks)
+    
+    def stop(self, timeout: float = 10.0):
+        """남은 작업을 취소하고 루프와 스레드 종료"""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None:
+            return
+        
+        async def cancel_pending():
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        try:
+            asyncio.run_coroutine_threadsafe(cancel_pending(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"이벤트 루프 작업 취소 중 오류: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+class DriverPool:
+    """WebDriver 풀 관리 클래스 - 워커 하나당 브라우저 하나"""
+    
+    # 유휴 드라이버를 기다리는 동안 취소 여부를 확인하는 간격 (초)
+    CANCEL_CHECK_INTERVAL = 0.2
+    
+    def __init__(self, factory, size: int, health_check_interval: float = 30.0,
+                 cancel_token: Optional[CancellationToken] = None):
+        self._factory = factory
+        self.cancel_token = cancel_token
+        self.size = max(1, int(size))
+        self.health_check_interval = health_check_interval
+        self._idle = queue.LifoQueue()  # 최근 사용한(따뜻한) 드라이버 우선 재사용
+        self._drivers = []
+        self._dedicated = []  # 풀 워커와 공유하지 않는 전용 드라이버
+        self._last_used = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stats = {'created': 0, 'replaced': 0, 'checkouts': 0, 'health_failures': 0}
+    
+    def prime(self):
+        """드라이버 하나를 미리 생성하여 초기화 오류를 빠르게 감지"""
+        driver = self._create()
+        self._idle.put(driver)
+        return driver
+    
+    def create_dedicated(self):
+        """전용 드라이버 생성 - 유휴 목록과 풀 크기에 포함하지 않고 close_all()에서 함께 종료"""
+        if self._closed:
+            raise RuntimeError("드라이버 풀이 종료되었습니다.")
+        driver = self._factory()
+        with self._lock:
+            self._dedicated.append(driver)
+        return driver
+    
+    def _create(self, reserved: bool = False):
+        """팩토리로 새 드라이버 생성 및 등록"""
+        try:
+            driver = self._factory()
+        except Exception:
+            if reserved:
+                with self._lock:
+                    self._drivers.remove(None)
+            raise
+        with self._lock:
+            if reserved:
+                self._drivers[self._drivers.index(None)] = driver
+            else:
+                self._drivers.append(driver)
+            self._last_used[id(driver)] = time.time()
+            self._stats['created'] += 1
+        logger.info(f"드라이버 생성 ({len(self._drivers)}/{self.size})")
+        return driver
+    
+    def acquire(self, timeout: Optional[float] = None):
+        """드라이버 대여 - 유휴 드라이버가 없으면 풀 크기까지 새로 생성"""
+        if self._closed:
+            raise RuntimeError("드라이버 풀이 종료되었습니다.")
+        
+        driver = None
+        try:
+            driver = self._idle.get_nowait()
+        except queue.Empty:
+            if self._reserve_slot():
+                driver = self._create(reserved=True)
+            else:
+                driver = self._wait_for_idle(timeout)
+        
+        # 오래 쉬었던 드라이버는 상태 확인 후 필요하면 교체
+        idle_for = time.time() - self._last_used.get(id(driver), 0)
+        if idle_for > self.health_check_interval and not self.is_healthy(driver):
+            driver = self._replace(driver)
+        
+        with self._lock:
+            self._stats['checkouts'] += 1
+        return driver
+    
+    def _reserve_slot(self) -> bool:
+        """풀 크기에 여유가 있으면 생성 중인 슬롯을 예약 (동시 생성으로 크기를 넘지 않도록 함)"""
+        with self._lock:
+            if len(self._drivers) < self.size:
+                self._drivers.append(None)
+                return True
+        return False
+    
+    def _wait_for_idle(self, timeout: Optional[float]):
+        """유휴 드라이버 대기 - 짧은 간격으로 나누어 기다리며 취소되면 즉시 중단, 풀이 커지면 새로 생성"""
+        deadline = time.time() + timeout if timeout is not None else None
+        while True:
+            if self.cancel_token:
+                self.cancel_token.raise_if_cancelled()
+            if self._reserve_slot():
+                return self._create(reserved=True)
+            wait = self.CANCEL_CHECK_INTERVAL
+            if deadline is not None:
+                wait = min(wait, deadline - time.time())
+                if wait <= 0:
+                    raise TimeoutError("사용 가능한 드라이버가 없습니다.")
+            try:
+                return self._idle.get(timeout=wait)
+            except queue.Empty:
+                continue
+    
+    def release(self, driver, healthy: bool = True):
+        """드라이버 반납 - 비정상 드라이버는 폐기하고 교체"""
+        if driver is None:
+            return
+        if self._closed:
+            self._quit(driver)
+            return
+        # 크기 변경(resize)과 동시에 실행되어도 풀 크기를 넘는 드라이버가 남지 않도록 잠금 안에서 확인
+        with self._lock:
+            surplus = self._alive_count() > self.size
+            if surplus:
+                self._forget(driver)
+        if surplus:
+            self._quit(driver)  # 풀 크기가 줄어든 경우
+            return
+        if not healthy and not self.is_healthy(driver):
+            # 반납은 호출자의 finally에서 실행되므로 교체 실패가 원래 오류를 가리지 않도록 기록만 함
+            try:
+                driver = self._replace(driver)
+            except Exception as e:
+                logger.error(f"드라이버 교체 실패 (다음 대여 시 새로 생성): {e}")
+                return
+        self._last_used[id(driver)] = time.time()
+        self._idle.put(driver)
+    
+    @contextmanager
+    def driver(self, timeout: Optional[float] = None):
+        """드라이버 대여/반납 컨텍스트 매니저"""
+        driver = self.acquire(timeout)
+        healthy = True
+        try:
+            yield driver
+        except WebDriverException:
+            healthy = False
+            raise
+        finally:
+            self.release(driver, healthy=healthy)
+    
+    def is_healthy(self, driver) -> bool:
+        """드라이버 상태 확인"""
+        try:
+            return driver.execute_script("return 1") == 1
+        except Exception as e:
+            with self._lock:
+                self._stats['health_failures'] += 1
+            logger.warning(f"드라이버 상태 확인 실패: {e}")
+            return False
+    
+    def _replace(self, driver):
+        """비정상 드라이버를 종료하고 새 드라이버로 교체"""
+        self._discard(driver)
+        with self._lock:
+            self._stats['replaced'] += 1
+        logger.info("비정상 드라이버를 새 드라이버로 교체합니다.")
+        return self._create()
+    
+    def _discard(self, driver):
+        """드라이버를 풀에서 제거하고 종료"""
+        with self._lock:
+            self._forget(driver)
+        self._quit(driver)
+    
+    def _forget(self, driver):
+        """드라이버를 풀 목록에서 제거 (호출자가 _lock을 잡고 있어야 함)"""
+        if driver in self._drivers:
+            self._drivers.remove(driver)
+        self._last_used.pop(id(driver), None)
+    
+    def _alive_count(self) -> int:
+        """생성 중인 슬롯을 제외한 드라이버 수"""
+        return len([d for d in self._drivers if d is not None])
+    
+    def _quit(self, driver):
+        """드라이버 종료"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"드라이버 종료 중 오류: {e}")
+    
+    def resize(self, size: int):
+        """풀 크기 변경 - 줄어든 만큼 유휴 드라이버를 종료"""
+        surplus = []
+        with self._lock:
+            self.size = max(1, int(size))
+            while self._alive_count() > self.size:
+                try:
+                    driver = self._idle.get_nowait()
+                except queue.Empty:
+                    break  # 사용 중인 드라이버는 반납 시 정리
+                self._forget(driver)
+                surplus.append(driver)
+        # 종료는 느릴 수 있으므로 잠금 밖에서 실행
+        for driver in surplus:
+            self._quit(driver)
+    
+    @property
+    def closed(self) -> bool:
+        """풀 종료 여부"""
+        return self._closed
+    
+    def has_capacity(self) -> bool:
+        """기다리지 않고 드라이버를 대여할 수 있는지 확인"""
+        return not self._idle.empty() or len(self._drivers) < self.size
+    
+    def get_stats(self) -> Dict:
+        """풀 통계 반환"""
+        with self._lock:
+            return {
+                'size': self.size,
+                'alive': self._alive_count(),
+                'idle': self._idle.qsize(),
+                **self._stats
+            }
+    
+    def close_all(self):
+        """모든 드라이버 종료"""
+        self._closed = True
+        with self._lock:
+            drivers = [d for d in self._drivers if d is not None] + self._dedicated
+            self._drivers.clear()
+            self._dedicated.clear()
+            self._last_used.clear()
+        for driver in drivers:
+            self._quit(driver)
+        logger.info(f"드라이버 풀 종료: {len(drivers)}개 드라이버 종료됨")
+
+class KeywordAnalyzer:
+    """키워드 분석 클래스"""
+    
+    def __init__(self):
+        self.okt = Okt()
+        self.stop_words = self._load_stop_words()
+        
+    def _load_stop_words(self) -> set:
+        """한국어 불용어 로드"""
+        stop_words = {
+            '이', '그', '저', '것', '수', '등', '및', '또는', '그리고', '하지만', '그런데',
+            '그러나', '그래서', '그런', '이런', '저런', '어떤', '무슨', '어떻게', '왜',
+            '언제', '어디서', '누가', '무엇을', '어떤', '이것', '저것', '그것', '우리',
+            '저희', '그들', '당신', '너희', '그녀', '그분', '이분', '저분', '이런',
+            '저런', '그런', '어떤', '무슨', '어떻게', '왜', '언제', '어디서', '누가',
+            '무엇을', '어떤', '이것', '저것', '그것', '우리', '저희', '그들', '당신',
+            '너희', '그녀', '그분', '이분', '저분'
+        }
+        return stop_words
+    
+    def analyze_keywords(self, texts: List[str], top_n: int = 20) -> Dict:
+        """텍스트에서 키워드 분석"""
+        if not texts:
+            return {}
+            
+        # 모든 텍스트 결합
+        combined_text = ' '.join(texts)
+        
+        # 형태소 분석
+        try:
+            nouns = self.okt.nouns(combined_text)
+            # 불용어 제거 및 길이 필터링
+            filtered_nouns = [word for word in nouns if len(word) > 1 and word not in self.stop_words]
+            
+            # 빈도수 계산
+            word_freq = defaultdict(int)
+            for word in filtered_nouns:
+                word_freq[word] += 1
+            
+            # 상위 키워드 추출
+            top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
+            
+            # 감정 분석 (간단한 버전)
+            sentiment_scores = []
+            for text in texts[:10]:  # 처음 10개 텍스트만 분석
+                try:
+                    blob = TextBlob(text)
+                    sentiment_scores.append(blob.sentiment.polarity)
+                except:
+                    sentiment_scores.append(0)
+            
+            avg_sentiment = np.mean(sentiment_scores) if sentiment_scores else 0
+            
+            return {
+                'top_keywords': dict(top_keywords),
+                'total_words': len(filtered_nouns),
+                'unique_words': len(word_freq),
+                'sentiment_score': avg_sentiment,
+                'sentiment_label': self._get_sentiment_label(avg_sentiment)
+            }
+            
+        except Exception as e:
+            logger.error(f"키워드 분석 오류: {e}")
+            return {}
+    
+    def _get_sentiment_label(self, score: float) -> str:
+        """감정 점수를 라벨로 변환"""
+        if score > 0.1:
+            return "긍정적"
+        elif score < -0.1:
+            return "부정적"
+        else:
+            return "중립적"
+            logger.warning("psutil이 설치되지 않아 메모리 사용량을 확인할 수 없습니다.")
+            return 0
+
+class YouTubeParseError(Exception):
+    """유튜브 페이지 또는 응답 데이터 파싱 실패"""
+    pass
+
+class YouTubeDataParser:
+    """유튜브 페이지 데이터 파싱 및 정규화 클래스 - 브라우저/HTTP 경로 공용"""
+    
+    INITIAL_DATA_PATTERN = re.compile(r'(?:var\s+ytInitialData|window\[["\']ytInitialData["\']\])\s*=\s*')
+    PLAYER_RESPONSE_PATTERN = re.compile(r'(?:var\s+ytInitialPlayerResponse|window\[["\']ytInitialPlayerResponse["\']\])\s*=\s*')
+    YTCFG_PATTERN = re.compile(r'ytcfg\.set\(\s*(?=\{)')
+    
+    @staticmethod
+    def extract_json_variable(html: str, pattern) -> Dict:
+        """HTML에 포함된 자바스크립트 변수 할당에서 JSON 객체 추출"""
+        match = pattern.search(html or '')
+        if not match:
+            raise YouTubeParseError("페이지에서 임베디드 JSON을 찾을 수 없습니다.")
+        try:
+            data, _ = json.JSONDecoder().raw_decode(html, match.end())
+            return data
+        except ValueError as e:
+            raise YouTubeParseError(f"임베디드 JSON 디코딩 실패: {e}")
+    
+    @classmethod
+    def extract_initial_data(cls, html: str) -> Dict:
+        """페이지 HTML에서 ytInitialData 추출"""
+        return cls.extract_json_variable(html, cls.INITIAL_DATA_PATTERN)
+    
+    @classmethod
+    def extract_player_response(cls, html: str) -> Dict:
+        """시청 페이지 HTML에서 ytInitialPlayerResponse 추출"""
+        return cls.extract_json_variable(html, cls.PLAYER_RESPONSE_PATTERN)
+    
+    @classmethod
+    def parse_video_details(cls, html: str, video_id: str) -> Dict:
+        """시청 페이지 HTML을 영상 상세 정보 딕셔너리로 변환"""
+        try:
+            initial_data = cls.extract_initial_data(html)
+        except YouTubeParseError:
+            # 좋아요/댓글 수만 빠지므로 플레이어 응답만으로 계속 진행
+            initial_data = None
+        return cls.build_video_details(cls.extract_player_response(html), video_id, initial_data)
+    
+    @classmethod
+    def build_video_details(cls, player_response: Dict, video_id: str, initial_data: Optional[Dict] = None) -> Dict:
+        """ytInitialPlayerResponse(+ ytInitialData)를 영상 상세 정보 딕셔너리로 변환 (브라우저/HTTP 공용)"""
+        details = (player_response or {}).get('videoDetails')
+        if not details:
+            status = ((player_response or {}).get('playabilityStatus') or {}).get('status', 'UNKNOWN')
+            raise YouTubeParseError(f"영상 상세 정보 없음 (video_id: {video_id}, 상태: {status})")
+        microformat = (player_response.get('microformat') or {}).get('playerMicroformatRenderer') or {}
+        
+        return {
+            'video_id': details.get('videoId') or video_id,
+            'title': details.get('title', ''),
+            'channel_name': details.get('author', ''),
+            'channel_id': details.get('channelId', ''),
+            'view_count_exact': int(details.get('viewCount') or 0),
+            'duration_seconds': int(details.get('lengthSeconds') or 0),
+            'published_at': microformat.get('publishDate') or microformat.get('uploadDate') or '',
+            'like_count': cls.find_like_count(initial_data) if initial_data else None,
+            'comment_count': cls.find_comment_count(initial_data) if initial_data else None,
+            'video_url': f"https://www.youtube.com/watch?v={details.get('videoId') or video_id}"
+        }
+    
+    @classmethod
+    def find_like_count(cls, data: Dict) -> Optional[int]:
+        """시청 페이지 데이터에서 좋아요 수 추출 (접근성 텍스트의 정확한 숫자 우선, 없으면 축약 표기)"""
+        for like_button in cls.iter_renderers(data, 'likeButtonViewModel'):
+            for button in cls.iter_renderers(like_button, 'buttonViewModel'):
+                numbers = re.findall(r'\d[\d,]*', button.get('accessibilityText') or '')
+                if numbers:
+                    return int(numbers[0].replace(',', ''))
+                if button.get('title'):
+                    return cls.parse_like_count(button['title'])
+        return None
+    
+    @classmethod
+    def find_comment_count(cls, data: Dict) -> Optional[int]:
+        """시청 페이지 데이터에서 댓글 수 추출 (댓글 패널 헤더 또는 댓글 진입점 헤더)"""
+        for panel in cls.iter_renderers(data, 'engagementPanelSectionListRenderer'):
+            if panel.get('panelIdentifier') == 'engagement-panel-comments-section':
+                header = (panel.get('header') or {}).get('engagementPanelTitleHeaderRenderer') or {}
+                text = cls.text_of(header.get('contextualInfo'))
+                if text:
+                    return cls.parse_like_count(text)
+        for header in cls.iter_renderers(data, 'commentsEntryPointHeaderRenderer'):
+            text = cls.text_of(header.get('commentCount'))
+            if text:
+                return cls.parse_like_count(text)
+        return None
+    
+    @classmethod
+    def extract_ytcfg(cls, html: str) -> Dict:
+        """페이지 HTML의 ytcfg.set({...}) 호출들을 병합하여 반환 (API 키, 클라이언트 컨텍스트)"""
+        ytcfg = {}
+        decoder = json.JSONDecoder()
+        for match in cls.YTCFG_PATTERN.finditer(html or ''):
+            try:
+                data, _ = decoder.raw_decode(html, match.end())
+                ytcfg.update(data)
+            except ValueError:
+                continue
+        return ytcfg
+    
+    @classmethod
+    def find_continuation_token(cls, data: Dict) -> Optional[str]:
+        """데이터에서 다음 페이지 연속 토큰 추출"""
+        for renderer in cls.iter_renderers(data, 'continuationItemRenderer'):
+            token = cls.continuation_item_token(renderer)
+            if token:
+                return token
+        return None
+    
+    @staticmethod
+    def continuation_item_token(renderer: Dict) -> Optional[str]:
+        """continuationItemRenderer에서 토큰 추출 (자동 로드 엔드포인트 또는 '더보기' 버튼)"""
+        endpoint = renderer.get('continuationEndpoint') or \
+            ((renderer.get('button') or {}).get('buttonRenderer') or {}).get('command') or {}
+        return (endpoint.get('continuationCommand') or {}).get('token')
+    
+    @staticmethod
+    def iter_renderers(data: Any, renderer_key: str):
+        """중첩된 JSON에서 지정된 렌더러 객체를 문서 순서대로 순회"""
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in reversed(list(node.items())):
+                    if key == renderer_key and isinstance(value, dict):
+                        yield value
+                    else:
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(reversed(node))
+    
+    @staticmethod
+    def text_of(node: Optional[Dict]) -> str:
+        """simpleText/runs 형식의 텍스트 객체를 문자열로 변환"""
+        if not node:
+            return ''
+        if isinstance(node, str):
+            return node
+        if 'simpleText' in node:
+            return node['simpleText']
+        if 'content' in node:
+            return node['content']
+        return ''.join(run.get('text', '') for run in node.get('runs', []))
+    
+    @classmethod
+    def parse_search_cards(cls, data: Dict) -> List[Dict]:
+        """검색 결과 데이터에서 영상 카드 원시 데이터 목록 추출 (브라우저 일괄 추출과 같은 형식)"""
+        cards = []
+        seen_ids = set()
+        for renderer in cls.iter_renderers(data, 'videoRenderer'):
+            video_id = renderer.get('videoId')
+            if not video_id or video_id in seen_ids:
+                continue
+            seen_ids.add(video_id)
+            cards.append({
+                'title': cls.text_of(renderer.get('title')),
+                'href': f"https://www.youtube.com/watch?v={video_id}",
+                'channel': cls.text_of(renderer.get('ownerText') or renderer.get('longBylineText')),
+                'views': cls.text_of(renderer.get('shortViewCountText') or renderer.get('viewCountText')) or 'N/A',
+                'uploaded': cls.text_of(renderer.get('publishedTimeText')) or 'N/A'
+            })
+        return cards
+    
+    @staticmethod
+    def extract_video_id(url):
+        """URL에서 영상 ID 추출"""
+        try:
+            parsed_url = urlparse(url)
+            if parsed_url.hostname == 'www.youtube.com':
+                query_params = parse_qs(parsed_url.query)
+                return query_params.get('v', [None])[0]
+            elif parsed_url.hostname == 'youtu.be':
+                return parsed_url.path[1:]
+        except:
+            pass
+        return None
+    
+    @staticmethod
+    def parse_upload_time(time_text):
+        """업로드 시간 텍스트를 datetime 객체로 변환 - 강화된 버전"""
+        if not time_text or time_text == "N/A":
+            return None
+            
+        try:
+            now = datetime.now()
+            
+            if '초' in time_text or '분' in time_text:
+                # 방금 전, N분 전, N초 전
+                return now
+            elif '시간' in time_text:
+                # N시간 전
+                hours = int(re.findall(r'(\d+)', time_text)[0])
+                return now - timedelta(hours=hours)
+            elif '일' in time_text:
+                # N일 전
+                days = int(re.findall(r'(\d+)', time_text)[0])
+                return now - timedelta(days=days)
+            elif '주' in time_text:
+                # N주 전
+                weeks = int(re.findall(r'(\d+)', time_text)[0])
+                return now - timedelta(weeks=weeks)
+            elif '개월' in time_text:
+                # N개월 전
+                months = int(re.findall(r'(\d+)', time_text)[0])
+                return now - timedelta(days=months * 30)
+            elif '년' in time_text:
+                # N년 전
+                years = int(re.findall(r'(\d+)', time_text)[0])
+                return now - timedelta(days=years * 365)
+            else:
+                # 다양한 날짜 형식 파싱
+                date_patterns = [
+                    r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})',  # 2024. 1. 15.
+                    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2024년 1월 15일
+                    r'(\d{4})-(\d{1,2})-(\d{1,2})',  # 2024-01-15
+                    r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2024/01/15
+                ]
+                
+                for pattern in date_patterns:
+                    date_match = re.search(pattern, time_text)
+                    if date_match:
+                        year, month, day = map(int, date_match.groups())
+                        return datetime(year, month, day)
+                        
+                # 마지막 시도: 현재 시간 반환
+                logger.warning(f"알 수 없는 시간 형식: {time_text}")
+                return now
+                
+        except Exception as e:
+            logger.warning(f"날짜 파싱 오류: {time_text} - {e}")
+            return None
+    
+    @staticmethod
+    def is_video_in_date_range(video_info, start_date: Optional[datetime], end_date: Optional[datetime]) -> bool:
+        """영상이 지정된 날짜 범위에 있는지 확인"""
+        if not start_date and not end_date:
+            return True
+        
+        upload_time_text = video_info.get('upload_time', '')
+        if not upload_time_text or upload_time_text == 'N/A':
+            return True  # 날짜 정보가 없으면 포함
+        
+        upload_date = YouTubeDataParser.parse_upload_time(upload_time_text)
+        if not upload_date:
+            return True  # 날짜 파싱 실패시 포함
+        
+        # 시작 날짜 체크
+        if start_date and upload_date < start_date:
+            return False
+        
+        # 종료 날짜 체크
+        if end_date and upload_date > end_date:
+            return False
+        
+        return True
+    
+    @staticmethod
+    def build_video_info(card: Dict, keyword: str) -> Dict:
+        """추출된 카드 원시 데이터를 영상 정보 딕셔너리로 변환"""
+        video_url = card.get('href')
+        upload_time = card.get('uploaded') or "N/A"
+        
+        # 발행일 파싱 및 포맷팅
+        parsed_date = YouTubeDataParser.parse_upload_time(upload_time)
+        formatted_date = parsed_date.strftime('%Y.%m.%d') if parsed_date else 'N/A'
+        
+        return {
+            'keyword': keyword,
+            'title': card.get('title'),
+            'channel_name': card.get('channel', ''),
+            'view_count': card.get('views') or "N/A",
+            'upload_time': upload_time,
+            'formatted_upload_date': formatted_date,
+            'video_url': video_url,
+            'video_id': YouTubeDataParser.extract_video_id(video_url),
+            'crawled_at': datetime.now().isoformat()
+        }
+    
+    @classmethod
+    def find_comment_section_token(cls, data: Dict) -> Optional[str]:
+        """시청 페이지 데이터에서 댓글 섹션의 첫 연속 토큰 추출"""
+        for section in cls.iter_renderers(data, 'itemSectionRenderer'):
+            if section.get('sectionIdentifier') == 'comment-item-section':
+                return cls.find_continuation_token(section)
+        return None
+    
+    @classmethod
+    def find_comment_sort_token(cls, data: Dict, index: int) -> Optional[str]:
+        """댓글 헤더의 정렬 메뉴에서 지정된 순서(0: 인기, 1: 최신)의 연속 토큰 추출"""
+        for menu in cls.iter_renderers(data, 'sortFilterSubMenuRenderer'):
+            items = menu.get('subMenuItems') or []
+            if index < len(items):
+                endpoint = items[index].get('serviceEndpoint') or {}
+                return (endpoint.get('continuationCommand') or {}).get('token')
+        return None
+    
+    @classmethod
+    def parse_comment_page(cls, data: Dict) -> Tuple[List[Dict], Optional[str]]:
+        """next API 응답에서 댓글(또는 답글) 원시 데이터와 다음 페이지 토큰 추출"""
+        # 구 형식은 commentRenderer에 내용이 있고, 신 형식은 commentViewModel이 뮤테이션의 commentEntityPayload를 키로 참조
+        entities = {}
+        mutations = ((data.get('frameworkUpdates') or {}).get('entityBatchUpdate') or {}).get('mutations') or []
+        for mutation in mutations:
+            payload = (mutation.get('payload') or {}).get('commentEntityPayload')
+            if payload:
+                entities[mutation.get('entityKey') or payload.get('key')] = payload
+        
+        raws = []
+        next_token = None
+        for endpoint in data.get('onResponseReceivedEndpoints') or data.get('onResponseReceivedActions') or []:
+            action = endpoint.get('reloadContinuationItemsCommand') or endpoint.get('appendContinuationItemsAction') or {}
+            for item in action.get('continuationItems') or []:
+                raw = None
+                if 'commentThreadRenderer' in item:
+                    raw = cls._comment_thread_to_raw(item['commentThreadRenderer'], entities)
+                elif 'commentRenderer' in item:
+                    # 답글 페이지 (구 형식)
+                    raw = cls._comment_renderer_to_raw(item['commentRenderer'])
+                elif 'commentViewModel' in item:
+                    # 답글 페이지 (신 형식)
+                    raw = cls._comment_view_model_to_raw(item['commentViewModel'], entities)
+                elif 'continuationItemRenderer' in item:
+                    next_token = cls.continuation_item_token(item['continuationItemRenderer']) or next_token
+                if raw:
+                    raws.append(raw)
+        return raws, next_token
+    
+    @classmethod
+    def _comment_thread_to_raw(cls, thread: Dict, entities: Dict) -> Optional[Dict]:
+        """댓글 스레드를 원시 데이터로 변환하고 답글 연속 토큰을 함께 기록"""
+        renderer = (thread.get('comment') or {}).get('commentRenderer')
+        if renderer:
+            raw = cls._comment_renderer_to_raw(renderer)
+        else:
+            raw = cls._comment_view_model_to_raw(thread.get('commentViewModel') or {}, entities)
+        
+        if raw:
+            replies = (thread.get('replies') or {}).get('commentRepliesRenderer') or {}
+            raw['replies_token'] = cls.find_continuation_token(replies.get('contents') or [])
+        return raw
+    
+    @classmethod
+    def _comment_renderer_to_raw(cls, renderer: Dict) -> Dict:
+        """구 형식 commentRenderer를 브라우저 일괄 추출과 같은 원시 데이터 형식으로 변환"""
+        return {
+            'comment_id': renderer.get('commentId', ''),
+            'text': cls.text_of(renderer.get('contentText')),
+            'like_count': cls.parse_like_count(cls.text_of(renderer.get('voteCount'))),
+            'reply_count': int(renderer.get('replyCount') or 0),
+            'published': cls.text_of(renderer.get('publishedTimeText')),
+            'author': cls.text_of(renderer.get('authorText'))
+        }
+    
+    @classmethod
+    def _comment_view_model_to_raw(cls, view_model: Dict, entities: Dict) -> Optional[Dict]:
+        """신 형식 commentViewModel이 참조하는 commentEntityPayload를 원시 데이터 형식으로 변환"""
+        # 스레드 안에서는 commentViewModel이 한 번 더 감싸여 있음
+        view_model = view_model.get('commentViewModel') or view_model
+        payload = entities.get(view_model.get('commentKey'))
+        if payload:
+            properties = payload.get('properties') or {}
+            toolbar = payload.get('toolbar') or {}
+            return {
+                'comment_id': properties.get('commentId', ''),
+                'text': cls.text_of(properties.get('content')),
+                'like_count': cls.parse_like_count(toolbar.get('likeCountNotliked', '')),
+                'reply_count': cls.parse_like_count(toolbar.get('replyCount', '')),
+                'published': properties.get('publishedTime', ''),
+                'author': (payload.get('author') or {}).get('displayName', '')
+            }
+        return None
+    
+    @staticmethod
+    def build_comment_info(raw: Dict, video_id: str) -> Optional[Dict]:
+        """추출된 댓글 원시 데이터를 댓글 정보 딕셔너리로 변환"""
+        try:
+            comment_text = (raw.get('text') or '').strip()
+            
+            if not comment_text or len(comment_text) < 5:
+                return None
+            
+            # 좋아요/답글 수는 숫자가 이미 있으면 그대로, 아니면 텍스트에서 파싱
+            like_count = raw['like_count'] if 'like_count' in raw else YouTubeDataParser.parse_like_count(raw.get('votes', ''))
+            reply_count = raw['reply_count'] if 'reply_count' in raw else YouTubeDataParser.parse_reply_count(raw.get('replies', ''))
+            comment_time = (raw.get('published') or '').strip()
+            
+            # 댓글에서 키워드 추출 (최대 5개)
+            extracted_keywords = YouTubeDataParser.extract_comment_keywords(comment_text, max_keywords=5)
+            
+            # 키워드 추출 결과 로깅 (디버깅용)
+            if extracted_keywords:
+                logger.info(f"댓글에서 키워드 추출 성공: {extracted_keywords}")
+            else:
+                logger.debug(f"댓글에서 키워드 추출 실패 또는 없음: {comment_text[:50]}...")
+            
+            return {
+                'video_id': video_id,
+                'comment_id': raw.get('comment_id', ''),
+                'parent_comment_id': raw.get('parent_comment_id', ''),
+                'is_reply': bool(raw.get('parent_comment_id')),
+                'comment': comment_text,
+                'author': raw.get('author', ''),
+                'extracted_keywords': extracted_keywords,
+                'like_count': like_count,
+                'reply_count': reply_count,
+                'comment_time': comment_time,
+                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+            
+        except Exception as e:
+            logger.warning(f"댓글 정보 변환 오류: {e}")
+            return None
+    
+    @staticmethod
+    def attach_replies(comments: List[Dict], replies: List[Dict]) -> List[Dict]:
+        """답글을 부모 댓글 바로 뒤에 배치하고 댓글 인덱스를 다시 부여 (부모가 없는 답글은 제외)"""
+        replies_by_parent = defaultdict(list)
+        for reply in replies:
+            replies_by_parent[reply.get('parent_comment_id')].append(reply)
+        
+        threaded = []
+        for comment in comments:
+            threaded.append(comment)
+            if comment.get('comment_id'):
+                threaded.extend(replies_by_parent.get(comment['comment_id'], []))
+        
+        for i, comment in enumerate(threaded):
+            comment['comment_index'] = i + 1
+        return threaded
+    
+    @staticmethod
+    def parse_like_count(like_text: str) -> int:
+        """좋아요 수 텍스트를 정수로 변환"""
+        try:
+            like_text = (like_text or '').strip()
+            if like_text:
+                if 'K' in like_text:
+                    return int(float(like_text.replace('K', '')) * 1000)
+                elif 'M' in like_text:
+                    return int(float(like_text.replace('M', '')) * 1000000)
+                elif '천' in like_text:
+                    return int(float(like_text.replace('천', '')) * 1000)
+                elif '만' in like_text:
+                    return int(float(like_text.replace('만', '')) * 10000)
+                else:
+                    return int(like_text.replace(',', ''))
+        except:
+            pass
+        return 0
+    
+    @staticmethod
+    def parse_reply_count(reply_text: str) -> int:
+        """답글 수 텍스트를 정수로 변환"""
+        reply_text = (reply_text or '').strip()
+        if reply_text and '답글' in reply_text:
+            numbers = re.findall(r'\d+', reply_text)
+            if numbers:
+                return int(numbers[0])
+        return 0
+    
+    @staticmethod
+    def extract_comment_keywords(comment_text: str, max_keywords: int = 5) -> str:
+        """댓글에서 키워드 추출 (최대 5개, 콤마로 구분)"""
+        try:
+            if not comment_text or len(comment_text) < 3:
+                return ""
+            
+            # Java 환경 확인 및 KoNLPy 사용
+            if konlpy_available:
+                try:
+                    # Java 환경 확인
+                    import os
+                    import subprocess
+                    
+                    # JAVA_HOME 확인
+                    java_home = os.environ.get('JAVA_HOME')
+                    if not java_home:
+                        # Java 설치 확인
+                        try:
+                            subprocess.run(['java', '-version'], capture_output=True, check=True)
+                            logger.info("Java가 설치되어 있지만 JAVA_HOME이 설정되지 않음")
+                        except (subprocess.CalledProcessError, FileNotFoundError):
+                            logger.warning("Java가 설치되지 않음, 기본 키워드 추출 방식 사용")
+                            raise Exception("Java not available")
+                    
+                    from konlpy.tag import Okt
+                    okt = Okt()
+                    
+                    # 명사 추출
+                    nouns = okt.nouns(comment_text)
+                    
+                    # 불용어 제거 및 길이 필터링
+                    stop_words = {
+                        '이', '그', '저', '것', '수', '등', '및', '또는', '그리고', '하지만', '그런데',
+                        '그러나', '그래서', '그런', '이런', '저런', '어떤', '무슨', '어떻게', '왜',
+                        '언제', '어디서', '누가', '무엇을', '어떤', '이것', '저것', '그것', '우리',
+                        '저희', '그들', '당신', '너희', '그녀', '그분', '이분', '저분'
+                    }
+                    
+                    filtered_nouns = [word for word in nouns if len(word) >= 2 and word not in stop_words]
+                    
+                    # 빈도수 계산
+                    word_freq = {}
+                    for word in filtered_nouns:
+                        word_freq[word] = word_freq.get(word, 0) + 1
+                    
+                    # 빈도수 순으로 정렬하여 상위 키워드 선택
+                    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+                    
+                    # 최대 5개까지 선택
+                    selected_keywords = [word for word, freq in sorted_words[:max_keywords]]
+                    
+                    # 콤마로 구분하여 반환
+                    return ", ".join(selected_keywords) if selected_keywords else ""
+                    
+                except Exception as konlpy_error:
+                    logger.warning(f"KoNLPy 키워드 추출 실패 (Java/JVM 문제), 기본 방식 사용: {konlpy_error}")
+            
+            # KoNLPy가 없거나 실패한 경우 개선된 기본 방식 사용
+            keywords = []
+            
+            # 한글 명사 추출 (개선된 패턴 매칭)
+            korean_nouns = re.findall(r'[가-힣]{2,}', comment_text)
+            # 영어 단어 추출 (2글자 이상)
+            english_words = re.findall(r'\b[a-zA-Z]{2,}\b', comment_text)
+            
+            # 한글 명사와 영어 단어 결합
+            all_words = korean_nouns + english_words
+            
+            # 확장된 불용어 제거
+            basic_stop_words = {
+                '이', '그', '저', '것', '수', '등', '및', '또는', '그리고', '하지만', '그런데',
+                '그러나', '그래서', '그런', '이런', '저런', '어떤', '무슨', '어떻게', '왜',
+                '언제', '어디서', '누가', '무엇을', '어떤', '이것', '저것', '그것', '우리',
+                '저희', '그들', '당신', '너희', '그녀', '그분', '이분', '저분', '있', '하', '되',
+                '보', '알', '생각', '말', '일', '때', '곳', '사람', '나', '너', '그', '이', '저'
+            }
+            filtered_words = [word for word in all_words if word not in basic_stop_words]
+            
+            # 빈도수 계산
+            word_freq = {}
+            for word in filtered_words:
+                if len(word) >= 2:  # 2글자 이상만
+                    word_freq[word] = word_freq.get(word, 0) + 1
+            
+            # 빈도수 순으로 정렬하여 상위 키워드 선택
+            sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
+            
+            # 최대 5개까지 선택
+            selected_keywords = [word for word, freq in sorted_words[:max_keywords]]
+            
+            # 콤마로 구분하여 반환
+            return ", ".join(selected_keywords) if selected_keywords else ""
+            
+        except Exception as e:
+            logger.warning(f"댓글 키워드 추출 오류: {e}")
+            return ""
+
+class YouTubeHttpClient:
+    """HTTP 클라이언트 - 연결 풀을 재사용하는 requests.Session 래퍼"""
+    
+    BASE_URL = "https://www.youtube.com"
+    USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36"
+    DEFAULT_HEADERS = {
+        'User-Agent': USER_AGENT,
+        'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7'
+    }
+    # 쿠키 동의 페이지로 리다이렉트되지 않도록 동의 쿠키 설정
+    DEFAULT_COOKIES = {'CONSENT': 'YES+cb', 'PREF': 'hl=ko&gl=KR'}
+    
+    def __init__(self, config: Optional[ConfigManager] = None, session: Optional[requests.Session] = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.config = config or ConfigManager()
+        self.session = session or self._build_session()
+        # 모든 워커가 공유하는 요청 속도 제한
+        self.rate_limiter = rate_limiter or RateLimiter(self.config)
+        self.timeout = (self.config.get('connection_timeout', 10), self.config.get('request_timeout', 15))
+    
+    def _build_session(self) -> requests.Session:
+        """연결 풀과 기본 헤더가 설정된 세션 생성"""
+        session = requests.Session()
+        pool_size = self.config.get('http_pool_size', 20)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        session.headers.update(self.DEFAULT_HEADERS)
+        for name, value in self.DEFAULT_COOKIES.items():
+            session.cookies.set(name, value, domain='.youtube.com')
+        return session
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """속도 제한 토큰을 얻은 뒤 요청하고 응답의 차단 신호를 속도 제한에 반영"""
+        self.rate_limiter.acquire(url)
+        response = getattr(self.session, method)(url, timeout=self.timeout, **kwargs)
+        self.rate_limiter.observe(url, response.status_code, getattr(response, 'url', url))
+        return response
+    
+    def get_text(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> str:
+        """GET 요청 후 본문 텍스트 반환"""
+        response = self._send('get', url, params=params, headers=headers)
+        response.raise_for_status()
+        return response.text
+    
+    @staticmethod
+    def conditional_headers(etag: Optional[str] = None, last_modified: Optional[str] = None) -> Dict:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+    
+    def get_conditional(self, url: str, etag: Optional[str] = None,
+                        last_modified: Optional[str] = None) -> Tuple[int, Optional[bytes], Dict]:
+        """조건부 GET - (상태 코드, 본문, 검증 헤더) 반환, 변경이 없으면 본문은 None"""
+        response = self._send('get', url, headers=self.conditional_headers(etag, last_modified))
+        if response.status_code == 304:
+            return 304, None, {}
+        response.raise_for_status()
+        validators = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+        return response.status_code, response.content, validators
+    
+    def post_json(self, url: str, payload: Dict, params: Optional[Dict] = None) -> Dict:
+        """JSON POST 요청 후 응답 JSON 반환"""
+        response = self._send('post', url, json=payload, params=params)
+        response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError as e:
+            raise YouTubeParseError(f"JSON 응답 파싱 실패: {e}")
+    
+    def innertube_url(self, endpoint: str, api_key: str) -> str:
+        """InnerTube API URL 생성 (search, next, browse 등)"""
+        return f"{self.BASE_URL}/youtubei/v1/{endpoint}?key={api_key}&prettyPrint=false"
+    
+    def close(self):
+        """세션 종료"""
+        try:
+            self.session.close()
+        except Exception as e:
+            logger.warning(f"HTTP 세션 종료 중 오류: {e}")
+
+class AsyncYouTubeHttpClient:
+    """비동기 HTTP 클라이언트 - 이벤트 루프 하나에서 연결 풀을 공유하며 전체/호스트별 동시 요청 수를 제한"""
+    
+    BASE_URL = YouTubeHttpClient.BASE_URL
+    
+    def __init__(self, config: Optional[ConfigManager] = None, sync_client: Optional[YouTubeHttpClient] = None):
+        self.config = config or ConfigManager()
+        # aiohttp가 없으면 동기 클라이언트를 스레드에서 실행하는 대체 경로 사용
+        self.sync_client = sync_client or YouTubeHttpClient(self.config)
+        self.rate_limiter = self.sync_client.rate_limiter
+        self.max_concurrency = max(1, self.config.get('http_max_concurrency', 100))
+        self.per_host_concurrency = max(1, self.config.get('http_per_host_concurrency', 32))
+        # 전체 동시 요청 수는 max_concurrency 안에서 응답 지연/오류에 따라 자동 조절
+        self.concurrency = ConcurrencyController(
+            'HTTP', min(self.per_host_concurrency, self.max_concurrency), 1, self.max_concurrency, self.config,
+            latency_target=self.config.get('http_latency_target', 2.0)
+        )
+        self._loop = None
+        self._session = None
+        self._global_semaphore = None
+        self._host_semaphores = {}
+        self._slots = None
+        self._in_flight = 0
+        self._executor = None
+    
+    def _bind_loop(self):
+        """현재 실행 중인 이벤트 루프에 세션과 세마포어를 맞춤"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # 이전 루프에 묶인 세션/세마포어는 새 루프에서 사용할 수 없으므로 새로 생성
+            self._loop = loop
+            self._session = None
+            self._global_semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._host_semaphores = {}
+            self._slots = asyncio.Condition()
+            self._in_flight = 0
+    
+    def _get_session(self):
+        """연결 풀을 공유하는 aiohttp 세션 반환 (지연 생성)"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.per_host_concurrency,
+                ttl_dns_cache=300
+            )
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.config.get('connection_timeout', 10),
+                sock_read=self.config.get('request_timeout', 15)
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers=YouTubeHttpClient.DEFAULT_HEADERS,
+                cookies=YouTubeHttpClient.DEFAULT_COOKIES,
+                # PREF 값의 '&'가 따옴표로 감싸지지 않도록 requests와 같은 형식으로 전송
+                cookie_jar=aiohttp.CookieJar(quote_cookie=False)
+            )
+        return self._session
+    
+    @asynccontextmanager
+    async def _limit(self, url: str):
+        """전체 및 호스트별 동시 요청 수 제한 - 적응형 한도를 넘지 않도록 대기하고 요청 결과를 한도 조절에 반영"""
+        self._bind_loop()
+        host = urlparse(url).hostname or ''
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+        async with self._global_semaphore:
+            async with self._host_semaphores[host]:
+                async with self._slots:
+                    await self._slots.wait_for(lambda: self._in_flight < self.concurrency.limit)
+                    self._in_flight += 1
+                try:
+                    with self.concurrency.track():
+                        yield
+                finally:
+                    async with self._slots:
+                        self._in_flight -= 1
+                        self._slots.notify_all()
+    
+    async def _run_in_thread(self, func, *args):
+        """aiohttp 미설치 시 동기 클라이언트 호출을 전용 스레드 풀에서 실행"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency,
+                thread_name_prefix="YouTubeHttp"
+            )
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+    
+    async def get_text(self, url: str, params: Optional[Dict] = None, headers: Optional[Dict] = None) -> str:
+        """GET 요청 후 본문 텍스트 반환"""
+        if not aiohttp_available:
+            async with self._limit(url):
+                return await self._run_in_thread(self.sync_client.get_text, url, params, headers)
+        # 연결 슬롯을 잡기 전에 속도 제한 토큰부터 획득
+        await self.rate_limiter.acquire_async(url)
+        async with self._limit(url):
+            async with self._get_session().get(url, params=params, headers=headers) as response:
+                self.rate_limiter.observe(url, response.status, str(response.url))
+                response.raise_for_status()
+                return await response.text()
+    
+    async def get_conditional(self, url: str, etag: Optional[str] = None,
+                              last_modified: Optional[str] = None) -> Tuple[int, Optional[bytes], Dict]:
+        """조건부 GET - (상태 코드, 본문, 검증 헤더) 반환, 변경이 없으면 본문은 None"""
+        if not aiohttp_available:
+            async with self._limit(url):
+                return await self._run_in_thread(self.sync_client.get_conditional, url, etag, last_modified)
+        headers = YouTubeHttpClient.conditional_headers(etag, last_modified)
+        await self.rate_limiter.acquire_async(url)
+        async with self._limit(url):
+            async with self._get_session().get(url, headers=headers) as response:
+                self.rate_limiter.observe(url, response.status, str(response.url))
+                if response.status == 304:
+                    return 304, None, {}
+                response.raise_for_status()
+                validators = {'etag': response.headers.get('ETag'), 'last_modified': response.headers.get('Last-Modified')}
+                return response.status, await response.read(), validators
+    
+    async def post_json(self, url: str, payload: Dict, params: Optional[Dict] = None) -> Dict:
+        """JSON POST 요청 후 응답 JSON 반환"""
+        if not aiohttp_available:
+            async with self._limit(url):
+                return await self._run_in_thread(self.sync_client.post_json, url, payload, params)
+        await self.rate_limiter.acquire_async(url)
+        async with self._limit(url):
+            async with self._get_session().post(url, json=payload, params=params) as response:
+                self.rate_limiter.observe(url, response.status, str(response.url))
+                response.raise_for_status()
+                try:
+                    return await response.json(content_type=None)
+                except ValueError as e:
+                    raise YouTubeParseError(f"JSON 응답 파싱 실패: {e}")
+    
+    def innertube_url(self, endpoint: str, api_key: str) -> str:
+        """InnerTube API URL 생성 (search, next, browse 등)"""
+        return f"{self.BASE_URL}/youtubei/v1/{endpoint}?key={api_key}&prettyPrint=false"
+    
+    async def close(self):
+        """현재 루프의 세션 종료"""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.warning(f"비동기 HTTP 세션 종료 중 오류: {e}")
+
+def _run_continuation_steps(steps, fetch_continuation):
+    """연속 페이지 수집 단계 실행 - 단계가 내보낸 토큰을 요청하고 응답을 돌려준 뒤 최종 결과 반환"""
+    try:
+        token = next(steps)
+        while True:
+            token = steps.send(fetch_continuation(token))
+    except StopIteration as finished:
+        return finished.value
+
+async def _run_continuation_steps_async(steps, fetch_continuation):
+    """연속 페이지 수집 단계 비동기 실행 - _run_continuation_steps()와 같고 요청만 await"""
+    try:
+        token = next(steps)
+        while True:
+            token = steps.send(await fetch_continuation(token))
+    except StopIteration as finished:
+        return finished.value
+
+class HttpSearchEngine:
+    """HTTP 검색 엔진 - 브라우저 없이 검색 결과 HTML의 ytInitialData를 파싱"""
+    
+    def __init__(self, client: YouTubeHttpClient, async_client: Optional[AsyncYouTubeHttpClient] = None):
+        self.client = client
+        self.async_client = async_client or AsyncYouTubeHttpClient(client.config, client)
+    
+    def build_search_url(self, keyword: str, start_date: Optional[datetime] = None,
+                         end_date: Optional[datetime] = None) -> str:
+        """검색 URL 생성 (브라우저 검색과 동일한 형식)"""
+        search_url = f"{self.client.BASE_URL}/results?search_query={quote_plus(keyword)}"
+        if start_date or end_date:
+            search_url += "&sp=CAI%253D"
+        return search_url
+    
+    def search(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None) -> List[Dict]:
+        """단일 키워드 검색 - 연속 토큰을 따라가며 max_videos개까지 수집"""
+        search_url = self.build_search_url(keyword, start_date, end_date)
+        logger.info(f"HTTP 검색 요청: {search_url}")
+        html = self.client.get_text(search_url)
+        
+        videos = self.parse_search_page(html, keyword, max_videos, start_date, end_date)
+        request = self._continuation_request(html) if len(videos) < max_videos else None
+        if not request:
+            return videos
+        
+        # 다음 페이지는 InnerTube search API에 연속 토큰으로 직접 요청
+        token, api_key, context = request
+        
+        def fetch_continuation(continuation_token: str) -> Dict:
+            return self.client.post_json(
+                self.client.innertube_url('search', api_key),
+                {'context': context, 'continuation': continuation_token}
+            )
+        
+        return self.follow_continuations(videos, token, fetch_continuation, keyword, max_videos, start_date, end_date)
+    
+    async def search_async(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None) -> List[Dict]:
+        """단일 키워드 비동기 검색 - search()와 같은 파싱 단계 사용"""
+        search_url = self.build_search_url(keyword, start_date, end_date)
+        logger.info(f"HTTP 비동기 검색 요청: {search_url}")
+        html = await self.async_client.get_text(search_url)
+        
+        videos = self.parse_search_page(html, keyword, max_videos, start_date, end_date)
+        request = self._continuation_request(html) if len(videos) < max_videos else None
+        if not request:
+            return videos
+        
+        token, api_key, context = request
+        
+        async def fetch_continuation(continuation_token: str) -> Dict:
+            return await self.async_client.post_json(
+                self.async_client.innertube_url('search', api_key),
+                {'context': context, 'continuation': continuation_token}
+            )
+        
+        return await _run_continuation_steps_async(
+            self._continuation_steps(videos, token, keyword, max_videos, start_date, end_date), fetch_continuation
+        )
+    
+    def parse_search_page(self, html: str, keyword: str, max_videos: int,
+                          start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Dict]:
+        """검색 결과 HTML을 영상 딕셔너리 목록으로 변환"""
+        data = YouTubeDataParser.extract_initial_data(html)
+        cards = YouTubeDataParser.parse_search_cards(data)
+        
+        videos = []
+        self._accept_cards(videos, set(), cards, keyword, max_videos, start_date, end_date)
+        
+        logger.info(f"HTTP 검색 첫 페이지: '{keyword}' {len(videos)}개 영상")
+        return videos
+    
+    def _continuation_request(self, html: str) -> Optional[Tuple[str, str, Dict]]:
+        """검색 페이지 HTML에서 (연속 토큰, API 키, 클라이언트 컨텍스트) 추출"""
+        ytcfg = YouTubeDataParser.extract_ytcfg(html)
+        token = YouTubeDataParser.find_continuation_token(YouTubeDataParser.extract_initial_data(html))
+        api_key = ytcfg.get('INNERTUBE_API_KEY')
+        if not token or not api_key:
+            return None
+        return token, api_key, ytcfg.get('INNERTUBE_CONTEXT', {})
+    
+    def follow_continuations(self, videos: List[Dict], token: Optional[str], fetch_continuation,
+                             keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+                             end_date: Optional[datetime] = None) -> List[Dict]:
+        """연속 토큰으로 다음 페이지를 차례로 요청하여 max_videos개를 채움 (브라우저/HTTP 공용)"""
+        return _run_continuation_steps(
+            self._continuation_steps(videos, token, keyword, max_videos, start_date, end_date), fetch_continuation
+        )
+    
+    def _continuation_steps(self, videos: List[Dict], token: Optional[str], keyword: str, max_videos: int,
+                            start_date: Optional[datetime], end_date: Optional[datetime]):
+        """검색 연속 페이지 수집 단계 - 요청할 토큰을 내보내고 받은 응답을 파싱 (동기/비동기 공용)"""
+        seen_ids = {video.get('video_id') for video in videos}
+        max_pages = self.client.config.get('search_max_pages', 20)
+        pages = 0
+        
+        while token and len(videos) < max_videos and pages < max_pages:
+            response = yield token
+            pages += 1
+            token = self._accept_continuation_page(videos, seen_ids, response, keyword, max_videos, start_date, end_date)
+        
+        logger.info(f"검색 연속 페이지 {pages}개 요청: '{keyword}' 총 {len(videos)}개 영상")
+        return videos
+    
+    def _accept_continuation_page(self, videos: List[Dict], seen_ids: set, response: Dict, keyword: str,
+                                  max_videos: int, start_date: Optional[datetime],
+                                  end_date: Optional[datetime]) -> Optional[str]:
+        """연속 페이지 응답의 영상을 추가하고 계속 요청할 다음 토큰 반환 (중단할 때는 None)"""
+        cards = YouTubeDataParser.parse_search_cards(response)
+        if not cards:
+            return None
+        
+        accepted = self._accept_cards(videos, seen_ids, cards, keyword, max_videos, start_date, end_date)
+        
+        # 업로드 날짜순 정렬 결과에서 한 페이지 전체가 시작일보다 오래되었으면 더 볼 필요 없음
+        if start_date and accepted == 0 and all(
+            (YouTubeDataParser.parse_upload_time(card.get('uploaded')) or datetime.now()) < start_date
+            for card in cards
+        ):
+            return None
+        return YouTubeDataParser.find_continuation_token(response)
+    
+    def _accept_cards(self, videos: List[Dict], seen_ids: set, cards: List[Dict], keyword: str,
+                      max_videos: int, start_date: Optional[datetime], end_date: Optional[datetime]) -> int:
+        """카드를 영상 정보로 변환해 날짜 범위 안의 새 영상만 추가하고 추가된 수를 반환"""
+        accepted = 0
+        for card in cards:
+            if len(videos) >= max_videos:
+                break
+            video_info = YouTubeDataParser.build_video_info(card, keyword)
+            if video_info['video_id'] in seen_ids:
+                continue
+            seen_ids.add(video_info['video_id'])
+            if YouTubeDataParser.is_video_in_date_range(video_info, start_date, end_date):
+                videos.append(video_info)
+                accepted += 1
+        return accepted
+
+class HttpCommentEngine:
+    """HTTP 댓글 엔진 - 시청 페이지의 댓글 연속 토큰으로 InnerTube next API를 페이지 단위로 요청"""
+    
+    # 댓글 헤더 정렬 메뉴(subMenuItems) 순서
+    SORT_MENU_INDEX = {'top': 0, 'newest': 1}
+    
+    def __init__(self, client: YouTubeHttpClient, async_client: Optional[AsyncYouTubeHttpClient] = None):
+        self.client = client
+        self.async_client = async_client or AsyncYouTubeHttpClient(client.config, client)
+    
+    def build_watch_url(self, video_id: str) -> str:
+        """시청 페이지 URL 생성"""
+        return f"{self.client.BASE_URL}/watch?v={video_id}"
+    
+    def get_comments(self, video_id: str, max_comments: int = 50, sort_by: str = 'top',
+                     time_budget: Optional[float] = None) -> List[Dict]:
+        """단일 영상 댓글 수집 - 브라우저 댓글 수집과 같은 댓글 딕셔너리 목록 반환"""
+        request = self._comment_request(video_id, self.client.get_text(self.build_watch_url(video_id)))
+        if not request:
+            return []
+        token, api_key, context = request
+        
+        def fetch_continuation(continuation_token: str) -> Dict:
+            return self.client.post_json(
+                self.client.innertube_url('next', api_key),
+                {'context': context, 'continuation': continuation_token}
+            )
+        
+        return self.collect_comments(video_id, token, fetch_continuation, max_comments, sort_by, time_budget)
+    
+    async def get_comments_async(self, video_id: str, max_comments: int = 50, sort_by: str = 'top',
+                                 time_budget: Optional[float] = None) -> List[Dict]:
+        """단일 영상 비동기 댓글 수집 - get_comments()와 같은 파싱 단계 사용"""
+        html = await self.async_client.get_text(self.build_watch_url(video_id))
+        request = self._comment_request(video_id, html)
+        if not request:
+            return []
+        token, api_key, context = request
+        url = self.async_client.innertube_url('next', api_key)
+        
+        async def fetch_continuation(continuation_token: str) -> Dict:
+            return await self.async_client.post_json(url, {'context': context, 'continuation': continuation_token})
+        
+        return await _run_continuation_steps_async(
+            self._comment_steps(video_id, token, max_comments, sort_by, time_budget), fetch_continuation
+        )
+    
+    async def iter_comments_async(self, video_ids: List[str], max_comments: int = 50, sort_by: str = 'top'):
+        """여러 영상 댓글을 한 이벤트 루프에서 동시에 요청하고 완료되는 순서대로 (video_id, 댓글 목록) 반환"""
+        async def fetch(video_id: str):
+            try:
+                return video_id, await self.get_comments_async(video_id, max_comments, sort_by)
+            except Exception as e:
+                logger.error(f"HTTP 댓글 수집 실패 (video_id: {video_id}): {e}")
+                return video_id, []
+        
+        tasks = [asyncio.ensure_future(fetch(video_id)) for video_id in video_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 멈추면 남은 요청 취소
+            for task in tasks:
+                task.cancel()
+    
+    def collect_comments(self, video_id: str, token: str, fetch_continuation, max_comments: int,
+                         sort_by: str = 'top', time_budget: Optional[float] = None) -> List[Dict]:
+        """댓글 연속 토큰을 따라가며 목표 개수, 시간 예산 또는 마지막 페이지까지 수집"""
+        return _run_continuation_steps(
+            self._comment_steps(video_id, token, max_comments, sort_by, time_budget), fetch_continuation
+        )
+    
+    def collect_replies(self, video_id: str, reply_threads: List[Tuple[str, str]], fetch_continuation,
+                        deadline: Optional[float] = None) -> List[Dict]:
+        """답글 연속 토큰을 따라가며 영상당 답글 예산만큼 수집 (부모 댓글 ID 연결)"""
+        return _run_continuation_steps(self._reply_steps(video_id, reply_threads, deadline), fetch_continuation)
+    
+    def _comment_steps(self, video_id: str, token: str, max_comments: int, sort_by: str,
+                       time_budget: Optional[float]):
+        """댓글 수집 단계 - 요청할 연속 토큰을 내보내고 받은 응답을 파싱 (동기/비동기 공용)"""
+        deadline = time.time() + self._time_budget(time_budget)
+        
+        response = yield token
+        sort_token = self._sort_token(video_id, response, sort_by)
+        if sort_token:
+            response = yield sort_token
+        
+        comments = []
+        seen_ids = set()
+        reply_tokens = {}
+        pages = 1
+        while True:
+            token = self._accept_comment_page(comments, seen_ids, response, video_id, max_comments, reply_tokens)
+            if not token or self._budget_exhausted(video_id, deadline):
+                break
+            response = yield token
+            pages += 1
+        
+        replies = []
+        if self._replies_enabled():
+            replies = yield from self._reply_steps(video_id, self._reply_threads(comments, reply_tokens), deadline)
+        
+        return self._finish(comments, replies, video_id, pages, sort_by)
+    
+    def _reply_steps(self, video_id: str, reply_threads: List[Tuple[str, str]], deadline: Optional[float]):
+        """답글 수집 단계 - 스레드마다 '더보기' 토큰을 내보내고 받은 응답을 파싱"""
+        budget = self.client.config.get('max_replies_per_video', 100)
+        replies = []
+        for parent_id, token in reply_threads:
+            while token and len(replies) < budget and (deadline is None or time.time() < deadline):
+                response = yield token
+                token = self._accept_reply_page(replies, response, video_id, parent_id, budget)
+        
+        logger.info(f"답글 수집: {video_id} {len(replies)}개 (예산 {budget}개)")
+        return replies
+    
+    def _comment_request(self, video_id: str, html: str) -> Optional[Tuple[str, str, Dict]]:
+        """시청 페이지 HTML에서 (댓글 연속 토큰, API 키, 클라이언트 컨텍스트) 추출"""
+        data = YouTubeDataParser.extract_initial_data(html)
+        ytcfg = YouTubeDataParser.extract_ytcfg(html)
+        api_key = ytcfg.get('INNERTUBE_API_KEY')
+        token = YouTubeDataParser.find_comment_section_token(data)
+        if not token or not api_key:
+            logger.info(f"댓글 연속 토큰 없음 (댓글 사용 중지 또는 페이지 구조 변경): {video_id}")
+            return None
+        return token, api_key, ytcfg.get('INNERTUBE_CONTEXT', {})
+    
+    def _sort_token(self, video_id: str, response: Dict, sort_by: str) -> Optional[str]:
+        """인기순이 기본이므로 다른 정렬이면 정렬 메뉴 토큰을 반환 (첫 페이지를 다시 요청)"""
+        sort_index = self.SORT_MENU_INDEX.get(sort_by, 0)
+        if not sort_index:
+            return None
+        sort_token = YouTubeDataParser.find_comment_sort_token(response, sort_index)
+        if not sort_token:
+            logger.warning(f"댓글 정렬 메뉴를 찾지 못해 기본 정렬 사용: {video_id}")
+        return sort_token
+    
+    def _accept_comment_page(self, comments: List[Dict], seen_ids: set, response: Dict, video_id: str,
+                             max_comments: int, reply_tokens: Optional[Dict] = None) -> Optional[str]:
+        """댓글 페이지 응답의 새 댓글을 추가하고 계속 요청할 다음 토큰 반환 (중단할 때는 None)"""
+        raws, token = YouTubeDataParser.parse_comment_page(response)
+        for raw in raws:
+            if raw['comment_id'] and raw['comment_id'] in seen_ids:
+                continue
+            seen_ids.add(raw['comment_id'])
+            comment_info = YouTubeDataParser.build_comment_info(raw, video_id)
+            if comment_info:
+                comments.append(comment_info)
+                if reply_tokens is not None and raw.get('replies_token'):
+                    reply_tokens[raw['comment_id']] = raw['replies_token']
+                if len(comments) >= max_comments:
+                    return None
+        return token if raws else None
+    
+    def _accept_reply_page(self, replies: List[Dict], response: Dict, video_id: str,
+                           parent_id: str, budget: int) -> Optional[str]:
+        """답글 페이지 응답의 답글을 추가하고 '더보기' 토큰 반환 (예산 소진 시 None)"""
+        raws, token = YouTubeDataParser.parse_comment_page(response)
+        for raw in raws:
+            raw['parent_comment_id'] = parent_id
+            reply_info = YouTubeDataParser.build_comment_info(raw, video_id)
+            if reply_info:
+                replies.append(reply_info)
+                if len(replies) >= budget:
+                    return None
+        return token if raws else None
+    
+    def _replies_enabled(self) -> bool:
+        """답글 수집 사용 여부"""
+        return bool(self.client.config.get('collect_replies', False))
+    
+    def _reply_threads(self, comments: List[Dict], reply_tokens: Dict) -> List[Tuple[str, str]]:
+        """수집된 댓글 순서대로 (부모 댓글 ID, 답글 연속 토큰) 목록"""
+        return [(comment['comment_id'], reply_tokens[comment['comment_id']])
+                for comment in comments if comment.get('comment_id') in reply_tokens]
+    
+    def _time_budget(self, time_budget: Optional[float]) -> float:
+        """영상당 댓글 수집 시간 예산"""
+        return self.client.config.get('comment_time_budget', 60) if time_budget is None else time_budget
+    
+    def _budget_exhausted(self, video_id: str, deadline: float) -> bool:
+        """시간 예산 소진 여부"""
+        if time.time() >= deadline:
+            logger.info(f"댓글 시간 예산 소진: {video_id}")
+            return True
+        return False
+    
+    def _finish(self, comments: List[Dict], replies: List[Dict], video_id: str, pages: int, sort_by: str) -> List[Dict]:
+        """답글을 부모 댓글 뒤에 배치하고 인덱스 부여 및 완료 로그"""
+        logger.info(f"HTTP 댓글 수집 완료: {video_id} {len(comments)}개, 답글 {len(replies)}개 ({pages}페이지, {sort_by})")
+        return YouTubeDataParser.attach_replies(comments, replies)
+
+class HttpVideoEngine:
+    """HTTP 영상 정보 엔진 - 시청 페이지의 ytInitialPlayerResponse에서 상세 정보 추출"""
+    
+    def __init__(self, client: YouTubeHttpClient, async_client: Optional[AsyncYouTubeHttpClient] = None):
+        self.client = client
+        self.async_client = async_client or AsyncYouTubeHttpClient(client.config, client)
+    
+    def build_watch_url(self, video_id: str) -> str:
+        """시청 페이지 URL 생성"""
+        return f"{self.client.BASE_URL}/watch?v={video_id}"
+    
+    def get_details(self, video_id: str) -> Dict:
+        """단일 영상 상세 정보"""
+        return YouTubeDataParser.parse_video_details(self.client.get_text(self.build_watch_url(video_id)), video_id)
+    
+    async def get_details_async(self, video_id: str) -> Dict:
+        """단일 영상 비동기 상세 정보"""
+        html = await self.async_client.get_text(self.build_watch_url(video_id))
+        return YouTubeDataParser.parse_video_details(html, video_id)
+
+class ChannelFeedMonitor:
+    """채널 피드 모니터 - 채널별 Atom 피드를 조건부 요청으로 확인하고 처음 보는 영상만 반환"""
+    
+    FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+    NAMESPACES = {
+        'atom': 'http://www.w3.org/2005/Atom',
+        'yt': 'http://www.youtube.com/xml/schemas/2015',
+        'media': 'http://search.yahoo.com/mrss/'
+    }
+    # 피드는 최근 15개 영상만 담으므로 채널당 기억할 영상 ID 수는 작게 유지
+    SEEN_LIMIT = 100
+    
+    def __init__(self, async_client: AsyncYouTubeHttpClient, config: Optional[ConfigManager] = None,
+                 state_file: Optional[str] = None):
+        self.async_client = async_client
+        self.config = config or async_client.config
+        self.state_file = state_file or self.config.get('channel_state_file', 'channel_feed_state.json')
+        self.state = self._load_state()
+        self.last_poll_stats = {}
+    
+    def _load_state(self) -> Dict:
+        """채널별 ETag/Last-Modified 및 확인한 영상 ID 상태 로드"""
+        try:
+            if os.path.exists(self.state_file):
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            logger.warning(f"채널 피드 상태 로드 오류: {e}")
+        return {'channels': {}}
+    
+    def save_state(self):
+        """상태 저장 - 임시 파일에 쓴 뒤 교체하여 중간에 중단되어도 손상되지 않도록 함"""
+        try:
+            temp_file = f"{self.state_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.state, f, ensure_ascii=False)
+            os.replace(temp_file, self.state_file)
+        except Exception as e:
+            logger.warning(f"채널 피드 상태 저장 오류: {e}")
+    
+    @classmethod
+    def parse_feed(cls, body: bytes) -> List[Dict]:
+        """Atom 피드를 스트리밍 XML 파서로 읽어 영상 정보 목록으로 변환"""
+        ns = cls.NAMESPACES
+        entry_tag = f"{{{ns['atom']}}}entry"
+        videos = []
+        try:
+            for _, element in ET.iterparse(BytesIO(body), events=('end',)):
+                if element.tag != entry_tag:
+                    continue
+                video_id = element.findtext('yt:videoId', '', ns)
+                channel_id = element.findtext('yt:channelId', '', ns)
+                published = element.findtext('atom:published', '', ns)
+                statistics = element.find('media:group/media:community/media:statistics', ns)
+                views = statistics.get('views') if statistics is not None else None
+                
+                videos.append({
+                    'keyword': f"channel:{channel_id}",
+                    'title': element.findtext('atom:title', '', ns),
+                    'channel_name': element.findtext('atom:author/atom:name', '', ns),
+                    'channel_id': channel_id,
+                    'view_count': f"조회수 {int(views):,}회" if views else "N/A",
+                    'upload_time': published or "N/A",
+                    'formatted_upload_date': published[:10].replace('-', '.') if published else 'N/A',
+                    'published_at': published,
+                    'video_url': f"https://www.youtube.com/watch?v={video_id}",
+                    'video_id': video_id,
+                    'crawled_at': datetime.now().isoformat()
+                })
+                # 처리한 항목은 바로 해제하여 메모리 사용량을 일정하게 유지
+                element.clear()
+        except ET.ParseError as e:
+            raise YouTubeParseError(f"채널 피드 XML 파싱 실패: {e}")
+        return videos
+    
+    async def poll_channel_async(self, channel_id: str, emit_existing: bool = False) -> Optional[List[Dict]]:
+        """단일 채널 피드 확인 - 변경이 없으면(304) None"""
+        channel_state = self.state['channels'].setdefault(channel_id, {'seen': []})
+        status, body, headers = await self.async_client.get_conditional(
+            self.FEED_URL.format(channel_id=channel_id),
+            etag=channel_state.get('etag'),
+            last_modified=channel_state.get('last_modified')
+        )
+        if status == 304:
+            return None
+        
+        channel_state['etag'] = headers.get('etag')
+        channel_state['last_modified'] = headers.get('last_modified')
+        
+        first_poll = 'polled_at' not in channel_state
+        channel_state['polled_at'] = datetime.now().isoformat()
+        seen = set(channel_state['seen'])
+        new_videos = [video for video in self.parse_feed(body) if video['video_id'] and video['video_id'] not in seen]
+        
+        # 최신 영상 ID를 앞쪽에 두고 SEEN_LIMIT개만 유지
+        channel_state['seen'] = ([video['video_id'] for video in new_videos] + channel_state['seen'])[:self.SEEN_LIMIT]
+        
+        # 처음 확인하는 채널은 기존 영상을 기준선으로만 기록 (emit_existing이면 모두 반환)
+        if first_poll and not emit_existing:
+            return []
+        return new_videos
+    
+    async def poll_async(self, channel_ids: List[str], emit_existing: bool = False) -> List[Dict]:
+        """여러 채널 피드를 동시에 확인하고 처음 보는 영상 목록 반환"""
+        stats = {'channels': len(channel_ids), 'not_modified': 0, 'errors': 0, 'new_videos': 0}
+        
+        async def poll(channel_id: str) -> List[Dict]:
+            try:
+                videos = await self.poll_channel_async(channel_id, emit_existing)
+            except Exception as e:
+                stats['errors'] += 1
+                logger.warning(f"채널 피드 확인 실패 (channel_id: {channel_id}): {e}")
+                return []
+            if videos is None:
+                stats['not_modified'] += 1
+                return []
+            return videos
+        
+        # 동시 요청 수는 비동기 HTTP 클라이언트의 세마포어가 제한
+        results = await asyncio.gather(*(poll(channel_id) for channel_id in channel_ids))
+        new_videos = [video for videos in results for video in videos]
+        stats['new_videos'] = len(new_videos)
+        
+        self.save_state()
+        self.last_poll_stats = stats
+        logger.info(
+            f"채널 피드 확인: {stats['channels']}개 채널, 새 영상 {stats['new_videos']}개, "
+            f"변경 없음 {stats['not_modified']}개, 오류 {stats['errors']}개"
+        )
+        return new_videos
+
+class SqliteWorkQueue:
+    """SQLite 기반 분산 작업 큐 - 여러 노드가 작업을 임대(lease)하여 처리
+    
+    임대 기간(visibility timeout) 안에 완료하거나 하트비트로 연장하지 않으면 다른 노드가 다시 가져가고,
+    최대 시도 횟수를 넘긴 작업은 실패로 처리한다. 공유 파일 시스템의 DB 파일 하나로 여러 호스트가 함께 사용할 수 있다.
+    """
+    
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            job_id TEXT NOT NULL,
+            kind TEXT NOT NULL,
+            dedupe_key TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            lease_owner TEXT,
+            lease_expires REAL,
+            result TEXT,
+            error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            UNIQUE (job_id, kind, dedupe_key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status, lease_expires);
+    """
+    
+    def __init__(self, path: Optional[str] = None, config: Optional[ConfigManager] = None):
+        self.config = config or ConfigManager()
+        self.path = path or self.config.get('work_queue_path', 'work_queue.db')
+        self.visibility_timeout = float(self.config.get('work_lease_timeout', 120))
+        self.max_attempts = max(1, self.config.get('work_max_attempts', 3))
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # 여러 프로세스가 동시에 읽고 쓸 수 있도록 WAL 모드 사용
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(self.SCHEMA)
+    
+    @contextmanager
+    def _transaction(self):
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (노드 사이에서 같은 작업을 중복 임대하지 않도록)"""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield self._conn
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+    
+    def enqueue(self, job_id: str, kind: str, payload: Dict, dedupe_key: str) -> bool:
+        """작업 추가 - 같은 작업(job_id, kind, dedupe_key)이 이미 있으면 추가하지 않음"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO tasks (job_id, kind, dedupe_key, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, dedupe_key, json.dumps(payload, ensure_ascii=False), now, now)
+            )
+            return cursor.rowcount > 0
+    
+    def lease(self, owner: str, limit: int = 1) -> List[Dict]:
+        """대기 중이거나 임대가 만료된 작업을 최대 limit개 임대"""
+        now = time.time()
+        with self._transaction() as conn:
+            # 시도 횟수를 다 쓴 노드가 임대 중 사라진 작업은 실패 처리
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', error = COALESCE(error, 'lease expired'), updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            rows = conn.execute(
+                "SELECT * FROM tasks WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY id LIMIT ?",
+                (now, limit)
+            ).fetchall()
+            for row in rows:
+                conn.execute(
+                    "UPDATE tasks SET status = 'leased', lease_owner = ?, lease_expires = ?, "
+                    "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                    (owner, now + self.visibility_timeout, now, row['id'])
+                )
+        return [
+            {'id': row['id'], 'job_id': row['job_id'], 'kind': row['kind'],
+             'payload': json.loads(row['payload']), 'attempts': row['attempts'] + 1}
+            for row in rows
+        ]
+    
+    def heartbeat(self, owner: str, task_ids: List[int]) -> List[int]:
+        """임대 연장 - 아직 이 노드가 임대 중인 작업 ID 목록 반환"""
+        if not task_ids:
+            return []
+        now = time.time()
+        placeholders = ','.join('?' * len(task_ids))
+        with self._transaction() as conn:
+            conn.execute(
+                f"UPDATE tasks SET lease_expires = ?, updated_at = ? "
+                f"WHERE lease_owner = ? AND status = 'leased' AND id IN ({placeholders})",
+                (now + self.visibility_timeout, now, owner, *task_ids)
+            )
+            rows = conn.execute(
+                f"SELECT id FROM tasks WHERE lease_owner = ? AND status = 'leased' AND id IN ({placeholders})",
+                (owner, *task_ids)
+            ).fetchall()
+        return [row['id'] for row in rows]
+    
+    def complete(self, owner: str, task_id: int, result: Any) -> bool:
+        """작업 완료 - 임대를 잃은 경우(다른 노드가 가져감) False"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, lease_owner = NULL, lease_expires = NULL, "
+                "updated_at = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (json.dumps(result, ensure_ascii=False), time.time(), task_id, owner)
+            )
+            return cursor.rowcount > 0
+    
+    def fail(self, owner: str, task_id: int, error: str) -> bool:
+        """작업 실패 - 시도 횟수가 남아 있으면 다시 대기 상태로 되돌림"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+                "error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ? "
+                "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (self.max_attempts, error, time.time(), task_id, owner)
+            )
+            return cursor.rowcount > 0
+    
+    def stats(self, job_id: Optional[str] = None) -> Dict:
+        """상태별 작업 수"""
+        query = "SELECT status, COUNT(*) AS count FROM tasks"
+        params = ()
+        if job_id:
+            query += " WHERE job_id = ?"
+            params = (job_id,)
+        with self._lock:
+            rows = self._conn.execute(query + " GROUP BY status", params).fetchall()
+        stats = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        stats.update({row['status']: row['count'] for row in rows})
+        return stats
+    
+    def has_unfinished(self, job_id: Optional[str] = None) -> bool:
+        """대기 중이거나 임대 중인 작업이 남아 있는지 여부"""
+        stats = self.stats(job_id)
+        return stats['pending'] + stats['leased'] > 0
+    
+    def submit_job(self, keywords: List[str], max_videos_per_keyword: int = 10, max_comments_per_video: int = 50,
+                   start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                   job_id: Optional[str] = None) -> str:
+        """키워드 검색 작업 등록 (댓글 작업은 검색을 처리한 노드가 영상별로 추가) - job_id 반환"""
+        job_id = job_id or uuid.uuid4().hex[:12]
+        for keyword in keywords:
+            self.enqueue(job_id, 'search', {
+                'keyword': keyword,
+                'max_videos': max_videos_per_keyword,
+                'max_comments': max_comments_per_video,
+                'start_date': start_date.isoformat() if start_date else None,
+                'end_date': end_date.isoformat() if end_date else None
+            }, dedupe_key=keyword)
+        logger.info(f"작업 등록: {job_id} ({len(keywords)}개 키워드)")
+        return job_id
+    
+    def job_results(self, job_id: str) -> Tuple[List[Dict], List[Dict]]:
+        """완료된 작업 결과를 (영상 목록, 댓글 목록)으로 모음 - 영상은 등록한 키워드 순서"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT kind, result FROM tasks WHERE job_id = ? AND status = 'done' ORDER BY id", (job_id,)
+            ).fetchall()
+        videos, comments = [], []
+        for row in rows:
+            (videos if row['kind'] == 'search' else comments).extend(json.loads(row['result']) or [])
+        return videos, comments
+    
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+class CrawlBackend(ABC):
+    """크롤링 백엔드 인터페이스 - 검색, 댓글, 영상 상세 정보 (구현하지 않은 메서드가 있으면 생성 시 TypeError)"""
+    
+    name = 'base'
+    # 이벤트 루프에서 직접 동시 요청할 수 있는지 여부 (False면 스레드 풀에서 실행)
+    concurrent = False
+    # 다른 백엔드로 재시도할 오류 (파싱 실패, HTTP 오류/차단, 타임아웃)
+    FALLBACK_ERRORS = (YouTubeParseError, requests.RequestException, asyncio.TimeoutError) + \
+        ((aiohttp.ClientError,) if aiohttp_available else ())
+    
+    executor = None
+    
+    @abstractmethod
+    def search(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None) -> List[Dict]:
+        """단일 키워드 검색"""
     
-    def set(self, key: str, data: Any):
-        """캐시에 데이터 저장 - 메모리와 파일 모두"""
-        try:
-            # 메모리 캐시에 저장
-            self._memory_cache[key] = data
-            
-            # 파일 캐시에 저장
-            cache_file = os.path.join(self.cache_dir, f"{key}.pkl")
-            with open(cache_file, 'wb') as f:
-                pickle.dump(data, f)
-        except Exception as e:
-            logger.warning(f"캐시 저장 오류: {e}")
+    @abstractmethod
+    def get_comments(self, video_id: str, max_comments: int = 50, time_budget: Optional[float] = None) -> List[Dict]:
+        """단일 영상 댓글 수집 - time_budget(초)이 지나면 그때까지 수집한 댓글 반환"""
     
-    def clear(self):
-        """캐시 전체 삭제"""
-        try:
-            self._memory_cache.clear()
-            for file in os.listdir(self.cache_dir):
-                if file.endswith('.pkl'):
-                    os.remove(os.path.join(self.cache_dir, file))
-            logger.info("캐시가 삭제되었습니다.")
-        except Exception as e:
-            logger.error(f"캐시 삭제 오류: {e}")
+    @abstractmethod
+    def get_video_details(self, video_id: str) -> Dict:
+        """단일 영상 상세 정보"""
     
-    def get_stats(self) -> Dict:
-        """캐시 통계 반환"""
-        total = self._cache_stats['hits'] + self._cache_stats['misses']
-        hit_rate = (self._cache_stats['hits'] / total * 100) if total > 0 else 0
-        return {
-            'hits': self._cache_stats['hits'],
-            'misses': self._cache_stats['misses'],
-            'hit_rate': f"{hit_rate:.1f}%",
-            'memory_cache_size': len(self._memory_cache)
-        }
+    async def search_async(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None) -> List[Dict]:
+        """비동기 검색 - 기본 구현은 스레드 풀에서 동기 메서드 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.search, keyword, max_videos, start_date, end_date)
+    
+    async def get_comments_async(self, video_id: str, max_comments: int = 50,
+                                 time_budget: Optional[float] = None) -> List[Dict]:
+        """비동기 댓글 수집 - 기본 구현은 스레드 풀에서 동기 메서드 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.get_comments, video_id, max_comments, time_budget)
+    
+    async def get_video_details_async(self, video_id: str) -> Dict:
+        """비동기 영상 상세 정보 - 기본 구현은 스레드 풀에서 동기 메서드 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.get_video_details, video_id)
 
-class ConfigManager:
-    """설정 관리 클래스 - 성능 최적화"""
+class HttpBackend(CrawlBackend):
+    """HTTP 백엔드 - 브라우저 없이 InnerTube 데이터를 파싱"""
     
-    def __init__(self):
-        self.config = {
-            'max_workers': int(os.getenv('MAX_WORKERS', '6')),  # 워커 수 증가
-            'timeout': int(os.getenv('TIMEOUT', '30')),
-            'retry_count': int(os.getenv('RETRY_COUNT', '3')),
-            'cache_enabled': os.getenv('CACHE_ENABLED', 'true').lower() == 'true',
-            'headless': os.getenv('HEADLESS', 'true').lower() == 'true',
-            'scroll_count': int(os.getenv('SCROLL_COUNT', '3')),  # 스크롤 수 감소로 속도 향상
-            'wait_time': float(os.getenv('WAIT_TIME', '1.5')),  # 대기 시간 단축
-            'max_memory_mb': int(os.getenv('MAX_MEMORY_MB', '4096')),  # 메모리 증가
-            'comment_batch_size': int(os.getenv('COMMENT_BATCH_SIZE', '20')),  # 댓글 배치 크기
-            'enable_keyword_analysis': os.getenv('ENABLE_KEYWORD_ANALYSIS', 'true').lower() == 'true',
-            'max_comments_per_video': int(os.getenv('MAX_COMMENTS_PER_VIDEO', '100')),
-            'excel_encoding': os.getenv('EXCEL_ENCODING', 'utf-8-sig'),  # 엑셀 인코딩 설정
-            # 네트워크 최적화 설정 추가
-            'page_load_timeout': int(os.getenv('PAGE_LOAD_TIMEOUT', '20')),
-            'implicit_wait': int(os.getenv('IMPLICIT_WAIT', '5')),
-            'network_idle_timeout': int(os.getenv('NETWORK_IDLE_TIMEOUT', '3')),
-            'connection_timeout': int(os.getenv('CONNECTION_TIMEOUT', '10')),
-            'request_timeout': int(os.getenv('REQUEST_TIMEOUT', '15'))
-        }
+    name = 'http'
+    concurrent = True
     
-    def get(self, key: str, default=None):
-        """설정값 가져오기"""
-        return self.config.get(key, default)
+    def __init__(self, search_engine: HttpSearchEngine, comment_engine: HttpCommentEngine,
+                 video_engine: HttpVideoEngine, config: ConfigManager):
+        self.search_engine = search_engine
+        self.comment_engine = comment_engine
+        self.video_engine = video_engine
+        self.config = config
     
-    def set(self, key: str, value):
-        """설정값 설정"""
-        self.config[key] = value
+    def search(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None) -> List[Dict]:
+        return self.search_engine.search(keyword, max_videos, start_date, end_date)
     
-    def update(self, new_config: Dict):
-        """설정 업데이트"""
-        self.config.update(new_config)
+    def get_comments(self, video_id: str, max_comments: int = 50, time_budget: Optional[float] = None) -> List[Dict]:
+        return self.comment_engine.get_comments(
+            video_id, max_comments, sort_by=self.config.get('comment_sort', 'top'), time_budget=time_budget
+        )
+    
+    def get_video_details(self, video_id: str) -> Dict:
+        return self.video_engine.get_details(video_id)
+    
+    async def search_async(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None) -> List[Dict]:
+        return await self.search_engine.search_async(keyword, max_videos, start_date, end_date)
+    
+    async def get_comments_async(self, video_id: str, max_comments: int = 50,
+                                 time_budget: Optional[float] = None) -> List[Dict]:
+        return await self.comment_engine.get_comments_async(
+            video_id, max_comments, sort_by=self.config.get('comment_sort', 'top'), time_budget=time_budget
+        )
+    
+    async def get_video_details_async(self, video_id: str) -> Dict:
+        return await self.video_engine.get_details_async(video_id)
 
-class PerformanceMonitor:
-    """성능 모니터링 클래스 - 강화된 버전"""
+class BrowserBackend(CrawlBackend):
+    """브라우저 백엔드 - 드라이버 풀의 Chrome으로 페이지를 렌더링하여 수집"""
     
-    def __init__(self):
-        self.timers = {}
-        self.memory_usage = []
-        self.start_time = time.time()
-        self.operation_counts = defaultdict(int)
-        self.error_counts = defaultdict(int)
-        
-    def start_timer(self, name: str):
-        """타이머 시작"""
-        self.timers[name] = time.time()
-        self.operation_counts[name] += 1
+    name = 'browser'
     
-    def end_timer(self, name: str):
-        """타이머 종료 및 시간 반환"""
-        if name in self.timers:
-            elapsed = time.time() - self.timers[name]
-            logger.info(f"{name} 실행 시간: {elapsed:.2f}초")
-            return elapsed
-        return 0
+    def __init__(self, crawler):
+        self.crawler = crawler
     
-    def log_error(self, operation: str, error: Exception):
-        """에러 로깅"""
-        self.error_counts[operation] += 1
-        logger.error(f"{operation} 에러: {error}")
+    @property
+    def executor(self):
+        # 워커 수 변경 시 교체되므로 항상 크롤러의 현재 스레드 풀 사용
+        return self.crawler.executor
     
-    def get_metrics(self) -> Dict:
-        """성능 메트릭 반환"""
-        total_time = time.time() - self.start_time
-        return {
-            'total_time': total_time,
-            'timers': self.timers.copy(),
-            'memory_usage': self.memory_usage,
-            'operation_counts': dict(self.operation_counts),
-            'error_counts': dict(self.error_counts),
-            'success_rate': self._calculate_success_rate()
-        }
+    def search(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None) -> List[Dict]:
+        with self.crawler.worker_concurrency.track(check_memory=True):
+            return self.crawler._search_single_keyword_browser(keyword, max_videos, start_date, end_date)
     
-    def _calculate_success_rate(self) -> Dict:
-        """성공률 계산"""
-        rates = {}
-        for operation in self.operation_counts:
-            total = self.operation_counts[operation]
-            errors = self.error_counts.get(operation, 0)
-            success_rate = ((total - errors) / total * 100) if total > 0 else 100
-            rates[operation] = f"{success_rate:.1f}%"
-        return rates
+    def get_comments(self, video_id: str, max_comments: int = 50, time_budget: Optional[float] = None) -> List[Dict]:
+        with self.crawler.worker_concurrency.track(check_memory=True):
+            return self.crawler._get_video_comments_browser(video_id, max_comments, time_budget)
     
-    def log_memory_usage(self):
-        """메모리 사용량 로깅"""
-        try:
-            import psutil
-            process = psutil.Process()
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            self.memory_usage.append({
-                'timestamp': time.time(),
-                'memory_mb': memory_mb
-            })
-            logger.info(f"메모리 사용량: {memory_mb:.1f}MB")
-        except ImportError:
-            logger.warning("psutil이 설치되지 않아 메모리 모니터링을 사용할 수 없습니다.")
+    def get_video_details(self, video_id: str) -> Dict:
+        with self.crawler.worker_concurrency.track(check_memory=True):
+            return self.crawler._get_video_details_browser(video_id)
 
-class KeywordAnalyzer:
-    """키워드 분석 클래스"""
+class FallbackBackend(CrawlBackend):
+    """자동 백엔드 - 저렴한 백엔드를 먼저 시도하고 파싱/요청에 실패한 요청만 다음 백엔드로 재시도"""
     
-    def __init__(self):
-        self.okt = Okt()
-        self.stop_words = self._load_stop_words()
-        
-    def _load_stop_words(self) -> set:
-        """한국어 불용어 로드"""
-        stop_words = {
-            '이', '그', '저', '것', '수', '등', '및', '또는', '그리고', '하지만', '그런데',
-            '그러나', '그래서', '그런', '이런', '저런', '어떤', '무슨', '어떻게', '왜',
-            '언제', '어디서', '누가', '무엇을', '어떤', '이것', '저것', '그것', '우리',
-            '저희', '그들', '당신', '너희', '그녀', '그분', '이분', '저분', '이런',
-            '저런', '그런', '어떤', '무슨', '어떻게', '왜', '언제', '어디서', '누가',
-            '무엇을', '어떤', '이것', '저것', '그것', '우리', '저희', '그들', '당신',
-            '너희', '그녀', '그분', '이분', '저분'
-        }
-        return stop_words
+    name = 'auto'
     
-    def analyze_keywords(self, texts: List[str], top_n: int = 20) -> Dict:
-        """텍스트에서 키워드 분석"""
-        if not texts:
-            return {}
-            
-        # 모든 텍스트 결합
-        combined_text = ' '.join(texts)
-        
-        # 형태소 분석
+    def __init__(self, primary: CrawlBackend, secondary: CrawlBackend, monitor: Optional[PerformanceMonitor] = None):
+        self.primary = primary
+        self.secondary = secondary
+        self.monitor = monitor
+        self.concurrent = primary.concurrent
+    
+    def _call(self, operation: str, *args):
+        """동기 호출 - 실패 시 보조 백엔드로 재시도"""
         try:
-            nouns = self.okt.nouns(combined_text)
-            # 불용어 제거 및 길이 필터링
-            filtered_nouns = [word for word in nouns if len(word) > 1 and word not in self.stop_words]
-            
-            # 빈도수 계산
-            word_freq = defaultdict(int)
-            for word in filtered_nouns:
-                word_freq[word] += 1
-            
-            # 상위 키워드 추출
-            top_keywords = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)[:top_n]
-            
-            # 감정 분석 (간단한 버전)
-            sentiment_scores = []
-            for text in texts[:10]:  # 처음 10개 텍스트만 분석
-                try:
-                    blob = TextBlob(text)
-                    sentiment_scores.append(blob.sentiment.polarity)
-                except:
-                    sentiment_scores.append(0)
-            
-            avg_sentiment = np.mean(sentiment_scores) if sentiment_scores else 0
-            
-            return {
-                'top_keywords': dict(top_keywords),
-                'total_words': len(filtered_nouns),
-                'unique_words': len(word_freq),
-                'sentiment_score': avg_sentiment,
-                'sentiment_label': self._get_sentiment_label(avg_sentiment)
-            }
-            
-        except Exception as e:
-            logger.error(f"키워드 분석 오류: {e}")
-            return {}
+            result = getattr(self.primary, operation)(*args)
+        except self.FALLBACK_ERRORS as e:
+            self._record(operation, e)
+            return getattr(self.secondary, operation)(*args)
+        self._record(operation)
+        return result
     
-    def _get_sentiment_label(self, score: float) -> str:
-        """감정 점수를 라벨로 변환"""
-        if score > 0.1:
-            return "긍정적"
-        elif score < -0.1:
-            return "부정적"
-        else:
-            return "중립적"
-            logger.warning("psutil이 설치되지 않아 메모리 사용량을 확인할 수 없습니다.")
-            return 0
+    async def _call_async(self, operation: str, *args):
+        """비동기 호출 - 실패 시 보조 백엔드로 재시도"""
+        try:
+            result = await getattr(self.primary, f"{operation}_async")(*args)
+        except self.FALLBACK_ERRORS as e:
+            self._record(operation, e)
+            return await getattr(self.secondary, f"{operation}_async")(*args)
+        self._record(operation)
+        return result
+    
+    def _record(self, operation: str, error: Optional[Exception] = None):
+        """요청/대체 횟수 기록"""
+        if error is not None:
+            logger.warning(f"{self.primary.name} 백엔드 {operation} 실패, {self.secondary.name} 백엔드로 재시도: {error}")
+        if self.monitor:
+            self.monitor.record_backend_request(operation, fallback=error is not None)
+    
+    def search(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+               end_date: Optional[datetime] = None) -> List[Dict]:
+        return self._call('search', keyword, max_videos, start_date, end_date)
+    
+    def get_comments(self, video_id: str, max_comments: int = 50, time_budget: Optional[float] = None) -> List[Dict]:
+        return self._call('get_comments', video_id, max_comments, time_budget)
+    
+    def get_video_details(self, video_id: str) -> Dict:
+        return self._call('get_video_details', video_id)
+    
+    async def search_async(self, keyword: str, max_videos: int, start_date: Optional[datetime] = None,
+                           end_date: Optional[datetime] = None) -> List[Dict]:
+        return await self._call_async('search', keyword, max_videos, start_date, end_date)
+    
+    async def get_comments_async(self, video_id: str, max_comments: int = 50,
+                                 time_budget: Optional[float] = None) -> List[Dict]:
+        return await self._call_async('get_comments', video_id, max_comments, time_budget)
+    
+    async def get_video_details_async(self, video_id: str) -> Dict:
+        return await self._call_async('get_video_details', video_id)
 
 class YouTubeCrawler:
+    # 댓글 렌더러 선택자 (구/신 레이아웃 모두 포함)
+    COMMENT_SELECTOR = "ytd-comment-renderer, ytd-comment-view-model"
+    # 시청 페이지 상세 정보로 보강하는 영상 필드
+    ENRICHMENT_FIELDS = ('view_count_exact', 'published_at', 'duration_seconds', 'like_count', 'comment_count')
+    # 영상별 마감 시간 여유 (시간 예산 + 페이지 로딩 시간 + 이 값이 지나면 해당 영상 포기, 초)
+    DEADLINE_GRACE = 10
+    
+    # 펼쳐진 답글 렌더러 선택자
+    REPLY_SELECTOR = "ytd-comment-replies-renderer ytd-comment-renderer, ytd-comment-replies-renderer ytd-comment-view-model"
+    
+    # DOM 텍스트만 읽으므로 영상 세그먼트, 광고, 추적, 폰트, 이미지, 플레이어 JS는 차단
+    DEFAULT_BLOCKED_URL_PATTERNS = [
+        "*.googlevideo.com/*",
+        "*/s/player/*",
+        "*doubleclick.net/*",
+        "*googlesyndication.com/*",
+        "*googleadservices.com/*",
+        "*/pagead/*",
+        "*/ptracking*",
+        "*/api/stats/*",
+        "*/generate_204*",
+        "*i.ytimg.com/*",
+        "*yt3.ggpht.com/*",
+        "*fonts.gstatic.com/*",
+        "*.woff2",
+        "*.woff",
+        "*.ttf",
+    ]
+    
+    # 차단된 요청은 응답 크기를 알 수 없으므로 리소스 유형별 평균 크기로 절약량을 추정
+    BLOCKED_RESOURCE_SIZE_ESTIMATES = {
+        'Media': 1000000,
+        'Script': 300000,
+        'Font': 50000,
+        'Image': 25000,
+        'Stylesheet': 20000,
+        'XHR': 2000,
+        'Fetch': 2000,
+        'Ping': 500,
+        'Other': 5000,
+    }
+    
     def __init__(self, config: Optional[ConfigManager] = None):
-        self.driver = None
+        self._driver = None
         self.config = config or ConfigManager()
-        self.cache = CacheManager() if self.config.get('cache_enabled') else None
+        self.cache = CacheManager(
+            max_memory_mb=self.config.get('cache_memory_mb', 256),
+            ttl=self.config.get('cache_expiry', 43200)
+        ) if self.config.get('cache_enabled') else None
         self.monitor = PerformanceMonitor()
-        self.session = None
-        # 안정성을 위해 max_workers를 더 낮게 설정
-        max_workers = min(self.config.get('max_workers'), 2)
+        # HTTP 엔진용 연결 풀 세션 (브라우저 없이 검색)
+        self.http_client = YouTubeHttpClient(self.config)
+        self.session = self.http_client.session
+        # 브라우저/HTTP 백엔드가 함께 사용하는 요청 속도 제한
+        self.rate_limiter = self.http_client.rate_limiter
+        # 대량 요청용 비동기 클라이언트 (한 이벤트 루프에서 연결 풀 공유)
+        self.async_http_client = AsyncYouTubeHttpClient(self.config, self.http_client)
+        self.http_search = HttpSearchEngine(self.http_client, self.async_http_client)
+        self.http_comments = HttpCommentEngine(self.http_client, self.async_http_client)
+        self.http_videos = HttpVideoEngine(self.http_client, self.async_http_client)
+        # 채널 피드 모니터 (처음 사용할 때 상태 파일 로드)
+        self._channel_monitor = None
+        # 설정(engine=http|browser|auto)에 따라 수집 백엔드 선택
+        self.backend = self._create_backend()
+        # 워커마다 전용 브라우저를 사용하므로 드라이버 풀 크기를 동시성 한도에 맞추고
+        # 스레드 풀은 한도가 늘어날 수 있는 상한 크기로 생성
+        self.max_workers = max(1, self.config.get('max_workers'))
+        self.driver_pool = None
+        self.worker_concurrency = self._create_worker_concurrency()
         self.executor = ThreadPoolExecutor(
-            max_workers=max_workers,
+            max_workers=self.worker_concurrency.maximum,
             thread_name_prefix="YouTubeCrawler"
         )
+        # 동기 메서드가 공유하는 상시 이벤트 루프 (처음 사용할 때 백그라운드 스레드 시작)
+        self._event_loop = BackgroundEventLoop()
+        # 진행 중인 작업 취소 (스크롤 루프, 드라이버 대기, 이벤트 루프 작업이 함께 확인)
+        self._root_cancel_token = CancellationToken()
+        # 헤지 요청처럼 개별 취소가 필요한 스레드 풀 작업의 스레드별 하위 토큰
+        self._scoped_cancel = threading.local()
+        self._active_shards = None
         self.setup_driver()
         
     def send_notification(self, title, message):
@@ -381,8 +3041,120 @@ class YouTubeCrawler:
         except Exception as e:
             logger.error(f"웹 알림 전송 실패: {e}")
         
+    def _create_backend(self) -> CrawlBackend:
+        """엔진 설정에 맞는 수집 백엔드 생성 (auto: HTTP 우선, 실패한 요청만 브라우저로 재시도)"""
+        engine = self.config.get('engine', 'browser')
+        if engine not in ('browser', 'http', 'auto'):
+            logger.warning(f"알 수 없는 엔진 '{engine}', 브라우저 엔진 사용")
+            engine = 'browser'
+        
+        browser_backend = BrowserBackend(self)
+        if engine == 'browser':
+            return browser_backend
+        
+        http_backend = HttpBackend(self.http_search, self.http_comments, self.http_videos, self.config)
+        if engine == 'http':
+            return http_backend
+        return FallbackBackend(http_backend, browser_backend, self.monitor)
+    
+    def _create_worker_concurrency(self) -> ConcurrencyController:
+        """브라우저 워커 동시성 제어 - max_workers에서 시작하여 max_workers_limit(기본 2배)까지 조절"""
+        maximum = self.config.get('max_workers_limit', 0) or self.max_workers * 2
+        return ConcurrencyController(
+            '브라우저 워커', self.max_workers, 1, max(maximum, self.max_workers), self.config,
+            on_change=self._on_worker_limit_change
+        )
+    
+    def _on_worker_limit_change(self, limit: int):
+        """워커 한도가 바뀌면 드라이버 풀 크기 조정 (줄어든 만큼의 사용 중 드라이버는 반납 시 종료)"""
+        if self.driver_pool:
+            self.driver_pool.resize(limit)
+    
     def setup_driver(self):
-        """Chrome 드라이버 설정 - 최적화됨"""
+        """Chrome 드라이버 풀 설정 - 워커당 브라우저 하나"""
+        self.driver_pool = DriverPool(
+            self._create_driver,
+            size=self.worker_concurrency.limit,
+            health_check_interval=self.config.get('driver_health_check_interval', 30),
+            cancel_token=self._root_cancel_token
+        )
+        # 브라우저 엔진이면 첫 드라이버는 즉시 생성 (초기화 오류 조기 감지)
+        # HTTP/auto 엔진이면 브라우저가 실제로 필요할 때까지 생성하지 않음
+        if self.config.get('engine', 'browser') == 'browser':
+            self.driver_pool.prime()
+    
+    @property
+    def driver(self):
+        """하위 호환용 대표 드라이버 - 처음 사용할 때 풀 워커와 공유하지 않는 전용 드라이버로 생성"""
+        if self._driver is None and self.driver_pool and not self.driver_pool.closed \
+                and self.config.get('engine', 'browser') == 'browser':
+            self._driver = self.driver_pool.create_dedicated()
+        return self._driver
+    
+    def _create_driver(self):
+        """Chrome 드라이버 생성 및 요청 차단 적용"""
+        driver = self._launch_chrome()
+        if self.config.get('block_requests', True):
+            self._apply_request_blocking(driver)
+        return driver
+    
+    def _get_blocked_url_patterns(self) -> List[str]:
+        """차단 패턴 목록 - unblocked_url_patterns와 정확히 같은 패턴을 차단 목록에서 제거
+        
+        CDP 차단 목록에는 예외 규칙이 없으므로 요청 URL이 아니라 차단 패턴 문자열 단위로 제거
+        """
+        patterns = self.config.get('blocked_url_patterns') or self.DEFAULT_BLOCKED_URL_PATTERNS
+        unblocked = set(self.config.get('unblocked_url_patterns') or [])
+        unknown = unblocked.difference(patterns)
+        if unknown:
+            logger.warning(f"차단 목록에 없는 차단 해제 패턴 (무시됨): {', '.join(sorted(unknown))}")
+        return [pattern for pattern in patterns if pattern not in unblocked]
+    
+    def _apply_request_blocking(self, driver):
+        """CDP Network.setBlockedURLs로 불필요한 리소스 요청 차단"""
+        patterns = self._get_blocked_url_patterns()
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+            logger.info(f"요청 차단 적용: {len(patterns)}개 패턴")
+        except Exception as e:
+            logger.warning(f"요청 차단 적용 실패 (차단 없이 계속): {e}")
+    
+    def _record_network_savings(self, driver, page: str):
+        """성능 로그에서 페이지의 전송량과 차단 요청을 집계하여 모니터에 기록"""
+        if not self.config.get('block_requests', True):
+            return
+        try:
+            entries = driver.get_log('performance')
+        except Exception as e:
+            logger.debug(f"성능 로그 조회 실패: {e}")
+            return
+        
+        resource_types = {}
+        stats = {'requests': 0, 'blocked_requests': 0, 'transferred_bytes': 0, 'estimated_bytes_saved': 0}
+        for entry in entries:
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError, TypeError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                stats['requests'] += 1
+                resource_types[params.get('requestId')] = params.get('type', 'Other')
+            elif method == 'Network.loadingFinished':
+                stats['transferred_bytes'] += int(params.get('encodedDataLength', 0))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                stats['blocked_requests'] += 1
+                resource_type = params.get('type') or resource_types.get(params.get('requestId'), 'Other')
+                stats['estimated_bytes_saved'] += self.BLOCKED_RESOURCE_SIZE_ESTIMATES.get(
+                    resource_type, self.BLOCKED_RESOURCE_SIZE_ESTIMATES['Other']
+                )
+        
+        self.monitor.record_network_stats(page, stats)
+    
+    def _launch_chrome(self):
+        """Chrome 드라이버 실행 - 최적화됨"""
         chrome_options = Options()
         
         # 성능 최적화 옵션들
@@ -495,6 +3267,11 @@ class YouTubeCrawler:
             "profile.default_content_setting_values.durable_storage": 2
         })
         
+        # 페이지별 절약량 보고를 위한 네트워크 성능 로그
+        if self.config.get('block_requests', True):
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+            chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+        
         # 오디오 관련 설정
         chrome_options.add_argument("--mute-audio")
         chrome_options.add_argument("--disable-audio")
@@ -508,38 +3285,40 @@ class YouTubeCrawler:
                 # Streamlit Cloud 환경에서는 시스템에 설치된 Chrome 사용
                 chrome_options.binary_location = "/usr/bin/chromium"
                 service = Service("/usr/bin/chromedriver")
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
             else:
                 # 로컬 환경에서는 ChromeDriverManager 사용
                 service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
+                driver = webdriver.Chrome(service=service, options=chrome_options)
             
             # 타임아웃 설정 (안정성 향상)
             timeout = min(self.config.get('timeout'), 15)
-            self.driver.set_page_load_timeout(timeout)
-            self.driver.implicitly_wait(timeout // 3)  # 안정적인 대기 시간
-            self.driver.set_script_timeout(timeout)
+            driver.set_page_load_timeout(timeout)
+            driver.implicitly_wait(timeout // 3)  # 안정적인 대기 시간
+            driver.set_script_timeout(timeout)
             
             # 자동화 감지 방지 스크립트 실행
-            self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
-            self.driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})")
+            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
+            driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']})")
             
             logger.info("Chrome 드라이버 초기화 성공")
+            return driver
             
         except Exception as e:
             logger.error(f"ChromeDriver 초기화 실패: {e}")
-            self._fallback_driver_setup(chrome_options)
+            return self._fallback_driver_setup(chrome_options)
     
     def _fallback_driver_setup(self, chrome_options):
         """대체 드라이버 설정"""
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
+            driver = webdriver.Chrome(options=chrome_options)
             timeout = self.config.get('timeout')
-            self.driver.set_page_load_timeout(timeout)
-            self.driver.implicitly_wait(timeout // 3)
-            self.driver.set_script_timeout(timeout)
+            driver.set_page_load_timeout(timeout)
+            driver.implicitly_wait(timeout // 3)
+            driver.set_script_timeout(timeout)
             logger.info("시스템 ChromeDriver 사용 성공")
+            return driver
         except Exception as e:
             logger.error(f"시스템 ChromeDriver도 실패: {e}")
             try:
@@ -547,11 +3326,12 @@ class YouTubeCrawler:
                 basic_options.add_argument("--headless")
                 basic_options.add_argument("--no-sandbox")
                 basic_options.add_argument("--disable-dev-shm-usage")
-                self.driver = webdriver.Chrome(options=basic_options)
+                driver = webdriver.Chrome(options=basic_options)
                 timeout = self.config.get('timeout')
-                self.driver.set_page_load_timeout(timeout)
-                self.driver.implicitly_wait(timeout // 3)
+                driver.set_page_load_timeout(timeout)
+                driver.implicitly_wait(timeout // 3)
                 logger.info("기본 설정으로 ChromeDriver 사용 성공")
+                return driver
             except Exception as e3:
                 logger.error(f"모든 ChromeDriver 초기화 실패: {e3}")
                 raise e3
@@ -585,11 +3365,17 @@ class YouTubeCrawler:
         # 결과 병합
         all_videos = []
         for i, result in enumerate(results):
+            if isinstance(result, CrawlCancelledError):
+                raise result
             if isinstance(result, Exception):
                 logger.error(f"키워드 '{keywords[i]}' 검색 실패: {result}")
                 continue
             all_videos.extend(result)
         
+        # 시청 페이지 상세 정보 보강 (선택 사항)
+        if self.config.get('enrich_videos', False) and all_videos:
+            await self.enrich_videos_async(all_videos)
+        
         # 캐시 저장
         if self.cache and all_videos:
             self.cache.set(cache_key, all_videos)
@@ -600,10 +3386,57 @@ class YouTubeCrawler:
         self.send_notification("유튜브 크롤러", f"비동기 검색 완료! 총 {len(all_videos)}개 영상을 발견했습니다.")
         return all_videos
     
+    def submit(self, coro):
+        """코루틴을 크롤러의 상시 이벤트 루프에 제출 - concurrent.futures.Future 반환
+        
+        예: futures = [crawler.submit(crawler.get_video_comments_async(video_id)) for video_id in video_ids]
+        """
+        return self._event_loop.submit(coro)
+    
+    @property
+    def cancel_token(self) -> CancellationToken:
+        """현재 스레드의 취소 토큰 - 하위 토큰으로 실행 중인 작업이면 그 토큰, 아니면 크롤러 전체 토큰"""
+        return getattr(self._scoped_cancel, 'token', None) or self._root_cancel_token
+    
+    def _run_with_cancel_token(self, token: CancellationToken, func, *args):
+        """스레드 풀 작업을 지정한 취소 토큰으로 실행 (스크롤/대기 루프가 self.cancel_token으로 확인)"""
+        previous = getattr(self._scoped_cancel, 'token', None)
+        self._scoped_cancel.token = token
+        try:
+            return func(*args)
+        finally:
+            self._scoped_cancel.token = previous
+    
+    def _run_sync(self, coro):
+        """동기 진입점 - 상시 이벤트 루프에서 코루틴을 실행하고 결과를 기다림 (루프와 연결 풀을 호출 사이에 재사용)"""
+        if self.cancel_token.cancelled:
+            coro.close()
+            self.cancel_token.raise_if_cancelled()
+        try:
+            return self._event_loop.run(coro)
+        except (CancelledError, asyncio.CancelledError):
+            raise CrawlCancelledError("크롤링이 취소되었습니다.")
+    
+    def cancel(self):
+        """진행 중인 크롤링 취소
+        
+        이벤트 루프의 작업(대기 중인 스레드 풀 작업 포함)을 취소하고, 실행 중인 브라우저 작업은
+        다음 스크롤/대기 단계에서 중단되어 드라이버를 반납한다. 다시 사용하려면 reset_cancellation() 호출.
+        """
+        logger.info("크롤링 취소 요청")
+        self._root_cancel_token.cancel()
+        self._event_loop.cancel_all()
+        if self._active_shards:
+            self._active_shards.cancel()
+    
+    def reset_cancellation(self):
+        """취소 상태 해제"""
+        self._root_cancel_token.reset()
+    
     def search_videos(self, keywords: List[str], max_videos_per_keyword: int = 10, 
                      start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> List[Dict]:
         """동기 영상 검색 (기존 호환성 유지)"""
-        return asyncio.run(self.search_videos_async(keywords, max_videos_per_keyword, start_date, end_date))
+        return self._run_sync(self.search_videos_async(keywords, max_videos_per_keyword, start_date, end_date))
     
     def _get_search_cache_key(self, keywords: List[str], max_videos: int, 
                             start_date: Optional[datetime], end_date: Optional[datetime]) -> str:
@@ -612,13 +3445,16 @@ class YouTubeCrawler:
             'keywords': keywords,
             'max_videos': max_videos,
             'start_date': start_date.isoformat() if start_date else None,
-            'end_date': end_date.isoformat() if end_date else None
+            'end_date': end_date.isoformat() if end_date else None,
+            'enriched': self.config.get('enrich_videos', False)
         }
-        return self.cache._get_cache_key(json.dumps(cache_data, sort_keys=True))
+        # 캐시를 끈 경우에도 같은 키를 만들 수 있도록 직접 해시
+        return hashlib.md5(json.dumps(cache_data, sort_keys=True).encode()).hexdigest()
     
     async def _search_single_keyword_async(self, keyword: str, max_videos: int, 
                                          start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Dict]:
         """단일 키워드 비동기 검색"""
+        self.cancel_token.raise_if_cancelled()
         logger.info(f"키워드 '{keyword}' 비동기 검색 시작")
         
         # 캐시 확인
@@ -629,13 +3465,8 @@ class YouTubeCrawler:
                 logger.info(f"키워드 '{keyword}' 캐시된 결과 사용")
                 return cached_result
         
-        # 스레드 풀에서 실행
-        loop = asyncio.get_event_loop()
-        result = await loop.run_in_executor(
-            self.executor, 
-            self._search_single_keyword, 
-            keyword, max_videos, start_date, end_date
-        )
+        # HTTP 백엔드는 이벤트 루프에서 직접 요청, 브라우저 백엔드는 스레드 풀에서 실행
+        result = await self.backend.search_async(keyword, max_videos, start_date, end_date)
         
         # 캐시 저장
         if self.cache and result:
@@ -645,73 +3476,269 @@ class YouTubeCrawler:
     
     def _search_single_keyword(self, keyword: str, max_videos: int, 
                              start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Dict]:
-        """단일 키워드로 검색 (최적화됨)"""
-        search_url = f"https://www.youtube.com/results?search_query={keyword.replace(' ', '+')}"
-        
-        # 날짜 필터링
-        if start_date or end_date:
-            search_url += f"&sp=CAI%253D"
+        """단일 키워드로 검색 (최적화됨) - 설정된 백엔드 사용"""
+        return self.backend.search(keyword, max_videos, start_date, end_date)
+    
+    def _search_single_keyword_browser(self, keyword: str, max_videos: int,
+                                       start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Dict]:
+        """브라우저 검색 - 풀에서 전용 드라이버를 대여"""
+        with self.driver_pool.driver() as driver:
+            try:
+                return self._search_single_keyword_with_driver(driver, keyword, max_videos, start_date, end_date)
+            finally:
+                self._record_network_savings(driver, f"검색 '{keyword}'")
+    
+    def _search_single_keyword_with_driver(self, driver, keyword: str, max_videos: int,
+                                         start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Dict]:
+        """대여한 드라이버로 단일 키워드 검색"""
+        search_url = self.http_search.build_search_url(keyword, start_date, end_date)
         
         try:
-            self.driver.get(search_url)
+            self._load_page(driver, search_url)
             logger.info(f"검색 URL 로딩: {search_url}")
             
             # 페이지 로딩 대기
-            WebDriverWait(self.driver, self.config.get('timeout')).until(
+            WebDriverWait(driver, self.config.get('timeout')).until(
                 EC.presence_of_element_located((By.TAG_NAME, "ytd-video-renderer"))
             )
             
+        except CrawlCancelledError:
+            raise
         except Exception as e:
             logger.error(f"페이지 로딩 오류: {e}")
             try:
-                WebDriverWait(self.driver, self.config.get('timeout') // 2).until(
+                WebDriverWait(driver, self.config.get('timeout') // 2).until(
                     EC.presence_of_element_located((By.TAG_NAME, "body"))
                 )
             except Exception as e2:
                 logger.error(f"대안 페이지 로딩도 실패: {e2}")
                 raise
         
-        # 스크롤하여 더 많은 영상 로드
-        self._scroll_page_optimized()
+        # 첫 페이지 카드 추출 (스크롤 없이)
+        videos = self._collect_video_cards(driver, keyword, max_videos, start_date, end_date)
+        if len(videos) >= max_videos:
+            return videos
+        
+        # 다음 페이지는 연속 토큰으로 페이지 안에서 직접 요청 (스크롤-대기 루프 없음)
+        try:
+            state = self._get_search_continuation_state(driver)
+            if state.get('token') and state.get('api_key'):
+                def fetch_continuation(token: str) -> Dict:
+                    return self._innertube_fetch_in_page(driver, 'search', state['api_key'], {
+                        'context': state.get('context') or {},
+                        'continuation': token
+                    })
+                
+                return self.http_search.follow_continuations(
+                    videos, state['token'], fetch_continuation, keyword, max_videos, start_date, end_date
+                )
+        except CrawlCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"연속 토큰 페이지 요청 실패, 스크롤 방식으로 전환: {e}")
+        
+        # 연속 토큰을 사용할 수 없으면 기존 스크롤 방식으로 대체
+        self._scroll_page_optimized(driver)
+        return self._collect_video_cards(driver, keyword, max_videos, start_date, end_date)
+    
+    def _collect_video_cards(self, driver, keyword: str, max_videos: int,
+                             start_date: Optional[datetime], end_date: Optional[datetime]) -> List[Dict]:
+        """현재 로드된 영상 카드를 추출하여 날짜 범위 안의 영상만 반환"""
+        videos = []
+        try:
+            candidates = self._extract_video_cards_bulk(driver, keyword, limit=max_videos * 2)
+        except Exception as e:
+            logger.warning(f"일괄 영상 정보 추출 실패, 개별 추출로 전환: {e}")
+            candidates = self._extract_video_cards_per_element(driver, keyword, limit=max_videos * 2)
+        
+        for video_info in candidates:
+            if self._is_video_in_date_range(video_info, start_date, end_date):
+                videos.append(video_info)
+                if len(videos) >= max_videos:
+                    break
+                
+        return videos
+    
+    def _get_search_continuation_state(self, driver) -> Dict:
+        """페이지의 ytInitialData/ytcfg에서 연속 토큰, API 키, 클라이언트 컨텍스트 조회 (HTTP 검색과 같은 토큰 파서 사용)"""
+        page_state = driver.execute_script("""
+            var cfg = (window.ytcfg && window.ytcfg.get) ? window.ytcfg : null;
+            return {
+                initial: window.ytInitialData ? JSON.stringify(window.ytInitialData) : null,
+                api_key: cfg ? cfg.get('INNERTUBE_API_KEY') : null,
+                context: cfg ? cfg.get('INNERTUBE_CONTEXT') : null
+            };
+        """) or {}
+        initial_data = json.loads(page_state['initial']) if page_state.get('initial') else {}
+        return {
+            'token': YouTubeDataParser.find_continuation_token(initial_data),
+            'api_key': page_state.get('api_key'),
+            'context': page_state.get('context')
+        }
+    
+    def _load_page(self, driver, url: str):
+        """속도 제한 토큰을 얻은 뒤 페이지를 열고 동의/캡차 페이지 리다이렉트를 속도 제한에 반영"""
+        self.cancel_token.raise_if_cancelled()
+        self.rate_limiter.acquire(url)
+        driver.get(url)
+        try:
+            final_url = driver.current_url
+        except Exception:
+            final_url = url
+        self.rate_limiter.observe(url, None, final_url)
+    
+    def _innertube_fetch_in_page(self, driver, endpoint: str, api_key: str, payload: Dict) -> Dict:
+        """브라우저 세션(쿠키 포함)으로 InnerTube API를 호출하고 JSON 응답 반환"""
+        url = f"/youtubei/v1/{endpoint}?key={api_key}&prettyPrint=false"
+        self.cancel_token.raise_if_cancelled()
+        self.rate_limiter.acquire(url)
+        response = driver.execute_async_script("""
+            var url = arguments[0];
+            var payload = arguments[1];
+            var done = arguments[arguments.length - 1];
+            fetch(url, {
+                method: 'POST',
+                credentials: 'include',
+                headers: {'Content-Type': 'application/json'},
+                body: JSON.stringify(payload)
+            }).then(function(response) {
+                if (!response.ok) {
+                    done({__error: 'HTTP ' + response.status, __status: response.status});
+                    return;
+                }
+                return response.json().then(done);
+            }).catch(function(error) {
+                done({__error: String(error)});
+            });
+        """, url, payload)
+        
+        self.rate_limiter.observe(url, response.get('__status') if isinstance(response, dict) else None)
+        if not isinstance(response, dict) or '__error' in response:
+            raise YouTubeParseError(f"InnerTube {endpoint} 응답 오류: {(response or {}).get('__error') if isinstance(response, dict) else response}")
+        return response
+    
+    def _extract_video_cards_bulk(self, driver, keyword: str, limit: int) -> List[Dict]:
+        """모든 영상 카드 정보를 단일 execute_script 호출로 추출"""
+        raw_cards = driver.execute_script("""
+            var limit = arguments[0];
+            var cards = document.querySelectorAll('ytd-video-renderer');
+            var results = [];
+            for (var i = 0; i < cards.length && results.length < limit; i++) {
+                var card = cards[i];
+                var titleEl = card.querySelector('#video-title');
+                if (!titleEl || !titleEl.href) continue;
+                var channelEl = card.querySelector('#channel-name a');
+                var viewEl = card.querySelector('#metadata-line span');
+                var timeEl = card.querySelector('#metadata-line span:nth-child(2)');
+                results.push({
+                    title: titleEl.getAttribute('title') || titleEl.innerText.trim(),
+                    href: titleEl.href,
+                    channel: channelEl ? channelEl.innerText.trim() : '',
+                    views: viewEl ? viewEl.innerText.trim() : 'N/A',
+                    uploaded: timeEl ? timeEl.innerText.trim() : 'N/A'
+                });
+            }
+            return results;
+        """, limit) or []
         
-        # 영상 정보 추출
+        logger.info(f"영상 카드 일괄 추출: {len(raw_cards)}개")
+        return [self._build_video_info(card, keyword) for card in raw_cards]
+    
+    def _extract_video_cards_per_element(self, driver, keyword: str, limit: int) -> List[Dict]:
+        """요소별 영상 정보 추출 (일괄 추출 실패 시 대체 경로)"""
         videos = []
-        video_elements = self.driver.find_elements(By.TAG_NAME, "ytd-video-renderer")
+        video_elements = driver.find_elements(By.TAG_NAME, "ytd-video-renderer")
         
-        for element in video_elements[:max_videos * 2]:
+        for element in video_elements[:limit]:
             try:
                 video_info = self._extract_video_info_optimized(element, keyword)
-                if video_info and self._is_video_in_date_range(video_info, start_date, end_date):
+                if video_info:
                     videos.append(video_info)
-                    if len(videos) >= max_videos:
-                        break
             except Exception as e:
                 logger.warning(f"영상 정보 추출 오류: {e}")
                 continue
-                
+        
         return videos
     
-    def _scroll_page_optimized(self):
+    def _build_video_info(self, card: Dict, keyword: str) -> Dict:
+        """추출된 카드 원시 데이터를 영상 정보 딕셔너리로 변환"""
+        return YouTubeDataParser.build_video_info(card, keyword)
+    
+    def _scroll_page_optimized(self, driver):
         """최적화된 페이지 스크롤"""
         try:
             logger.info("최적화된 페이지 스크롤 시작...")
-            last_height = self.driver.execute_script("return document.body.scrollHeight")
+            last_height = driver.execute_script("return document.body.scrollHeight")
             scroll_count = self.config.get('scroll_count')
             wait_time = self.config.get('wait_time')
             
             for i in range(scroll_count):
-                self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(wait_time)
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                # 새 카드가 붙거나 DOM이 잠잠해지면 즉시 다음 단계로 진행
+                self._wait_for_dom_change(driver, "ytd-video-renderer", timeout=wait_time)
                 
-                new_height = self.driver.execute_script("return document.body.scrollHeight")
+                new_height = driver.execute_script("return document.body.scrollHeight")
                 if new_height == last_height:
                     logger.info(f"스크롤 완료 (반복 {i+1})")
                     break
                 last_height = new_height
                 
+        except CrawlCancelledError:
+            raise
         except Exception as e:
             logger.error(f"스크롤 중 오류: {e}")
     
+    def _wait_for_dom_change(self, driver, selector: str, timeout: float,
+                             quiet_period: Optional[float] = None) -> Dict:
+        """MutationObserver 기반 대기 - 요소 수가 늘거나 DOM이 조용해지면 즉시 반환"""
+        # 모든 스크롤 루프가 이 대기를 거치므로 여기서 취소 확인
+        self.cancel_token.raise_if_cancelled()
+        if quiet_period is None:
+            quiet_period = self.config.get('dom_quiet_period', 0.4)
+        
+        try:
+            result = driver.execute_async_script("""
+                var selector = arguments[0];
+                var timeoutMs = arguments[1];
+                var quietMs = arguments[2];
+                var done = arguments[arguments.length - 1];
+                var countOf = function() { return document.querySelectorAll(selector).length; };
+                var initial = countOf();
+                var finished = false;
+                var observer = null, quietTimer = null, hardTimer = null;
+                var finish = function(reason) {
+                    if (finished) return;
+                    finished = true;
+                    if (observer) observer.disconnect();
+                    clearTimeout(quietTimer);
+                    clearTimeout(hardTimer);
+                    done({reason: reason, initial: initial, count: countOf()});
+                };
+                var armQuietTimer = function() {
+                    clearTimeout(quietTimer);
+                    quietTimer = setTimeout(function() { finish('idle'); }, quietMs);
+                };
+                observer = new MutationObserver(function() {
+                    if (countOf() > initial) {
+                        finish('grew');
+                    } else {
+                        armQuietTimer();
+                    }
+                });
+                observer.observe(document.body || document.documentElement, {childList: true, subtree: true});
+                hardTimer = setTimeout(function() { finish('timeout'); }, timeoutMs);
+                armQuietTimer();
+            """, selector, int(timeout * 1000), int(quiet_period * 1000))
+            logger.debug(f"DOM 대기 완료: {selector} {result}")
+        except Exception as e:
+            # 스크립트 대기가 불가능하면 기존처럼 최대 시간만큼 대기
+            logger.warning(f"DOM 변경 대기 실패, 고정 대기로 전환: {e}")
+            self.cancel_token.wait(timeout)
+            result = {'reason': 'sleep'}
+        # 대기 중에 취소되었으면 다음 드라이버 호출 전에 중단
+        self.cancel_token.raise_if_cancelled()
+        return result or {}
+    
     def _extract_video_info_optimized(self, element, keyword: str) -> Optional[Dict]:
         """최적화된 영상 정보 추출"""
         try:
@@ -743,25 +3770,14 @@ class YouTubeCrawler:
                 upload_time = time_element.text
             except:
                 pass
-                
-            # 영상 ID 추출
-            video_id = self._extract_video_id(video_url)
-            
-            # 발행일 파싱 및 포맷팅
-            parsed_date = self._parse_upload_time(upload_time)
-            formatted_date = parsed_date.strftime('%Y.%m.%d') if parsed_date else 'N/A'
             
-            return {
-                'keyword': keyword,
+            return self._build_video_info({
                 'title': title,
-                'channel_name': channel_name,
-                'view_count': view_count,
-                'upload_time': upload_time,
-                'formatted_upload_date': formatted_date,
-                'video_url': video_url,
-                'video_id': video_id,
-                'crawled_at': datetime.now().isoformat()
-            }
+                'href': video_url,
+                'channel': channel_name,
+                'views': view_count,
+                'uploaded': upload_time
+            }, keyword)
             
         except Exception as e:
             logger.warning(f"영상 정보 추출 오류: {e}")
@@ -769,128 +3785,303 @@ class YouTubeCrawler:
     
     def _extract_video_id(self, url):
         """URL에서 영상 ID 추출"""
-        try:
-            parsed_url = urlparse(url)
-            if parsed_url.hostname == 'www.youtube.com':
-                query_params = parse_qs(parsed_url.query)
-                return query_params.get('v', [None])[0]
-            elif parsed_url.hostname == 'youtu.be':
-                return parsed_url.path[1:]
-        except:
-            pass
-        return None
+        return YouTubeDataParser.extract_video_id(url)
     
     def _parse_upload_time(self, time_text):
-        """업로드 시간 텍스트를 datetime 객체로 변환 - 강화된 버전"""
-        if not time_text or time_text == "N/A":
-            return None
-            
-        try:
-            now = datetime.now()
-            
-            if '초' in time_text or '분' in time_text:
-                # 방금 전, N분 전, N초 전
-                return now
-            elif '시간' in time_text:
-                # N시간 전
-                hours = int(re.findall(r'(\d+)', time_text)[0])
-                return now - timedelta(hours=hours)
-            elif '일' in time_text:
-                # N일 전
-                days = int(re.findall(r'(\d+)', time_text)[0])
-                return now - timedelta(days=days)
-            elif '주' in time_text:
-                # N주 전
-                weeks = int(re.findall(r'(\d+)', time_text)[0])
-                return now - timedelta(weeks=weeks)
-            elif '개월' in time_text:
-                # N개월 전
-                months = int(re.findall(r'(\d+)', time_text)[0])
-                return now - timedelta(days=months * 30)
-            elif '년' in time_text:
-                # N년 전
-                years = int(re.findall(r'(\d+)', time_text)[0])
-                return now - timedelta(days=years * 365)
-            else:
-                # 다양한 날짜 형식 파싱
-                date_patterns = [
-                    r'(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})',  # 2024. 1. 15.
-                    r'(\d{4})년\s*(\d{1,2})월\s*(\d{1,2})일',  # 2024년 1월 15일
-                    r'(\d{4})-(\d{1,2})-(\d{1,2})',  # 2024-01-15
-                    r'(\d{4})/(\d{1,2})/(\d{1,2})',  # 2024/01/15
-                ]
-                
-                for pattern in date_patterns:
-                    date_match = re.search(pattern, time_text)
-                    if date_match:
-                        year, month, day = map(int, date_match.groups())
-                        return datetime(year, month, day)
-                        
-                # 마지막 시도: 현재 시간 반환
-                logger.warning(f"알 수 없는 시간 형식: {time_text}")
-                return now
-                
-        except Exception as e:
-            logger.warning(f"날짜 파싱 오류: {time_text} - {e}")
-            return None
+        """업로드 시간 텍스트를 datetime 객체로 변환"""
+        return YouTubeDataParser.parse_upload_time(time_text)
     
     def _is_video_in_date_range(self, video_info, start_date: Optional[datetime], end_date: Optional[datetime]) -> bool:
         """영상이 지정된 날짜 범위에 있는지 확인"""
-        if not start_date and not end_date:
-            return True
-        
-        upload_time_text = video_info.get('upload_time', '')
-        if not upload_time_text or upload_time_text == 'N/A':
-            return True  # 날짜 정보가 없으면 포함
-        
-        upload_date = self._parse_upload_time(upload_time_text)
-        if not upload_date:
-            return True  # 날짜 파싱 실패시 포함
-        
-        # 시작 날짜 체크
-        if start_date and upload_date < start_date:
-            return False
-        
-        # 종료 날짜 체크
-        if end_date and upload_date > end_date:
-            return False
-        
-        return True
+        return YouTubeDataParser.is_video_in_date_range(video_info, start_date, end_date)
+    
+    async def get_video_comments_async(self, video_id: str, max_comments: int = 50,
+                                       time_budget: Optional[float] = None) -> List[Dict]:
+        """비동기 댓글 수집 - time_budget(초, 기본값 comment_time_budget)이 지나면 그때까지 수집한 댓글 반환"""
+        comments, _ = await self._fetch_video_comments(video_id, max_comments, time_budget)
+        return comments
+    
+    @staticmethod
+    def _top_level_count(comments: List[Dict]) -> int:
+        """답글을 제외한 댓글 수 (댓글 목표 수와 비교하는 기준)"""
+        return sum(1 for comment in comments if not comment.get('is_reply'))
     
-    async def get_video_comments_async(self, video_id: str, max_comments: int = 50) -> List[Dict]:
-        """비동기 댓글 수집"""
+    async def _fetch_video_comments(self, video_id: str, max_comments: int,
+                                    time_budget: Optional[float] = None) -> Tuple[List[Dict], bool]:
+        """댓글 수집 - (댓글 목록, 마지막 페이지까지 읽었는지 여부) 반환
+        
+        시간 예산 때문에 목표 개수 전에 멈춘 목록은 잘린 결과이므로 캐시하지 않음
+        """
+        self.cancel_token.raise_if_cancelled()
         self.monitor.start_timer(f'comments_{video_id}')
         
-        # 캐시 확인
+        # 캐시 확인 (완전한 결과만 저장되므로 목표보다 적으면 마지막 페이지까지 읽은 결과)
         cache_key = f"comments_{video_id}_{max_comments}"
         if self.cache:
             cached_comments = self.cache.get(cache_key)
             if cached_comments:
                 logger.info(f"댓글 캐시 사용: {video_id}")
-                return cached_comments
+                return cached_comments, self._top_level_count(cached_comments) < max_comments
         
-        # 스레드 풀에서 실행
-        loop = asyncio.get_event_loop()
-        comments = await loop.run_in_executor(
-            self.executor,
-            self._get_video_comments_sync,
-            video_id,
-            max_comments
-        )
+        # HTTP 백엔드는 이벤트 루프에서 직접 요청, 브라우저 백엔드는 스레드 풀에서 실행
+        if time_budget is None:
+            time_budget = self.config.get('comment_time_budget', 60)
+        started = time.time()
+        if self.config.get('enable_hedging', False):
+            comments = await self._get_comments_hedged(video_id, max_comments, time_budget)
+        else:
+            comments = await self.backend.get_comments_async(video_id, max_comments, time_budget)
+        elapsed = time.time() - started
+        # 헤징 기준(rolling p95)으로 쓰는 지연 시간 기록
+        self.monitor.record_latency('comments', elapsed)
         
-        # 캐시 저장
-        if self.cache and comments:
+        # 목표 개수 전에 시간 예산보다 먼저 끝났으면 더 읽을 페이지가 없었던 것
+        reached = self._top_level_count(comments) >= max_comments
+        exhausted = not reached and elapsed < time_budget
+        
+        # 캐시 저장 (시간 예산에 잘린 목록은 제외)
+        if self.cache and comments and (reached or exhausted):
             self.cache.set(cache_key, comments)
         
         self.monitor.end_timer(f'comments_{video_id}')
-        return comments
+        return comments, exhausted
+    
+    def _hedge_allowed(self) -> bool:
+        """헤지 요청 비율이 hedge_max_ratio 미만이고 브라우저면 남는 드라이버가 있는지 확인"""
+        stats = self.monitor.hedge_stats
+        # 진행 중인 현재 요청까지 포함한 비율
+        if stats['comments_hedged'] >= self.config.get('hedge_max_ratio', 0.05) * (stats['comments_requests'] + 1):
+            return False
+        return self.backend.concurrent or self.driver_pool.has_capacity()
+    
+    async def _get_comments_hedged(self, video_id: str, max_comments: int,
+                                   time_budget: Optional[float] = None) -> List[Dict]:
+        """헤징 댓글 요청 - rolling p95보다 오래 걸리면 다른 연결/워커로 같은 요청을 보내고 먼저 끝난 결과 사용
+        
+        늦게 끝난 요청은 취소하며, 헤지 요청 수는 전체 댓글 요청의 hedge_max_ratio 이하로 제한
+        """
+        if time_budget is None:
+            time_budget = self.config.get('comment_time_budget', 60)
+        started = time.time()
+        tokens = []
+        
+        def fetch(budget: float) -> asyncio.Future:
+            if self.backend.concurrent:
+                return asyncio.ensure_future(self.backend.get_comments_async(video_id, max_comments, budget))
+            # 스레드 풀 작업은 태스크를 취소해도 멈추지 않으므로 요청별 하위 토큰으로 스크롤 루프를 중단시켜 드라이버 반납
+            token = self.cancel_token.child()
+            tokens.append(token)
+            return asyncio.ensure_future(asyncio.get_running_loop().run_in_executor(
+                self.backend.executor, self._run_with_cancel_token, token,
+                self.backend.get_comments, video_id, max_comments, budget
+            ))
+        
+        tasks = [fetch(time_budget)]
+        hedge_delay = self.monitor.latency_percentile('comments', 95)
+        hedged = hedge_won = False
+        try:
+            if hedge_delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+                if not done and self._hedge_allowed():
+                    hedged = True
+                    logger.info(f"댓글 요청 헤징 (p95 {hedge_delay:.1f}초 초과): {video_id}")
+                    # 헤지 요청은 원래 요청과 같은 시점에 끝나도록 남은 시간 예산만 사용
+                    remaining = max(0.0, time_budget - (time.time() - started))
+                    tasks.append(fetch(remaining))
+            
+            # 먼저 성공한 결과 사용 (한쪽이 실패하면 나머지 결과를 기다림)
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        hedge_won = task is not tasks[0]
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+            for token in tokens:
+                token.cancel()
+            self.monitor.record_hedge('comments', hedged, hedge_won)
     
     def get_video_comments(self, video_id: str, max_comments: int = 50) -> List[Dict]:
         """동기 댓글 수집 (기존 호환성 유지)"""
-        return asyncio.run(self.get_video_comments_async(video_id, max_comments))
+        return self._run_sync(self.get_video_comments_async(video_id, max_comments))
+    
+    async def _get_video_comments_checkpointed(self, video_id: str, max_comments: int,
+                                               journal: Optional[CheckpointJournal] = None,
+                                               time_budget: Optional[float] = None,
+                                               requested: Optional[int] = None) -> List[Dict]:
+        """댓글 수집 - 체크포인트 저널에 완료로 기록된 영상은 요청 없이 저장된 댓글 반환
+        
+        요청한 개수(requested, 기본값 max_comments)를 채웠거나 마지막 페이지까지 읽은 경우만 완료로 기록
+        """
+        unit = f"comments:{video_id}"
+        if journal and journal.is_done(unit):
+            return journal.get(unit)
+        comments, exhausted = await self._fetch_video_comments(video_id, max_comments, time_budget)
+        if journal:
+            if exhausted or self._top_level_count(comments) >= (requested or max_comments):
+                journal.record(unit, comments)
+            else:
+                logger.info(f"목표보다 적게 수집되어 완료로 기록하지 않음 (재개 시 다시 수집): {video_id}")
+        return comments
+    
+    def _job_time_budget(self, workers: int) -> JobTimeBudget:
+        """설정값으로 작업 시간 예산 생성"""
+        return JobTimeBudget(
+            self.config.get('job_time_budget', 0), workers,
+            self.config.get('comment_time_budget', 60), self.config.get('min_comments_per_video', 5)
+        )
+    
+    async def _get_video_comments_with_deadline(self, video_id: str, max_comments: int, budget: JobTimeBudget,
+                                                journal: Optional[CheckpointJournal] = None) -> List[Dict]:
+        """영상별 마감 시간을 적용한 댓글 수집
+        
+        시간 예산이 지나면 수집기가 그때까지 모은 댓글을 반환하고, 페이지 로딩 등이 멈춘 경우에만
+        예산 + DEADLINE_GRACE초에 이 영상만 포기하여 다른 영상의 완료 결과는 그대로 유지
+        """
+        try:
+            target, time_budget = budget.plan(max_comments)
+            if target <= 0:
+                logger.warning(f"작업 시간 예산 소진 - 댓글 수집 건너뜀: {video_id}")
+                return []
+            if target < max_comments:
+                logger.info(f"작업 마감 임박 - 댓글 목표 {max_comments}개 → {target}개: {video_id}")
+            
+            timeout = time_budget + self.config.get('page_load_timeout', 20) + self.DEADLINE_GRACE
+            try:
+                return await asyncio.wait_for(
+                    self._get_video_comments_checkpointed(video_id, target, journal, time_budget, max_comments),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                budget.stats['timed_out'] += 1
+                logger.warning(f"댓글 수집 마감 초과 ({timeout:.0f}초): {video_id}")
+                return []
+        finally:
+            budget.finish()
     
     def _get_video_comments_sync(self, video_id: str, max_comments: int = 50) -> List[Dict]:
-        """동기 댓글 수집 구현"""
+        """동기 댓글 수집 구현 - 설정된 백엔드 사용"""
+        return self.backend.get_comments(video_id, max_comments)
+    
+    def get_video_details(self, video_id: str) -> Dict:
+        """영상 상세 정보 (정확한 조회수, 길이, 게시일 등)"""
+        return self.backend.get_video_details(video_id)
+    
+    async def get_video_details_async(self, video_id: str) -> Dict:
+        """비동기 영상 상세 정보"""
+        return await self.backend.get_video_details_async(video_id)
+    
+    async def enrich_videos_async(self, videos: List[Dict]) -> List[Dict]:
+        """검색 결과 영상들에 시청 페이지 상세 정보(정확한 조회수, 게시 시각, 길이, 좋아요/댓글 수)를 동시에 추가"""
+        self.monitor.start_timer('enrich_videos')
+        
+        async def enrich(video: Dict) -> bool:
+            video_id = video.get('video_id')
+            if not video_id:
+                return False
+            
+            # 영상별 캐시 (같은 영상은 다시 요청하지 않음)
+            cache_key = f"details_{video_id}"
+            details = self.cache.get(cache_key) if self.cache else None
+            if not details:
+                try:
+                    details = await self.get_video_details_async(video_id)
+                except Exception as e:
+                    logger.warning(f"영상 상세 정보 수집 실패 (video_id: {video_id}): {e}")
+                    return False
+                if self.cache:
+                    self.cache.set(cache_key, details)
+            
+            for field in self.ENRICHMENT_FIELDS:
+                video[field] = details.get(field)
+            # 상대 시간 추정 대신 실제 게시일로 발행일 표시
+            if details.get('published_at'):
+                video['formatted_upload_date'] = details['published_at'][:10].replace('-', '.')
+            return True
+        
+        # 동시 요청 수는 HTTP 클라이언트 세마포어(브라우저는 스레드/드라이버 풀)가 제한
+        results = await asyncio.gather(*(enrich(video) for video in videos))
+        
+        self.monitor.end_timer('enrich_videos')
+        logger.info(f"영상 상세 정보 보강 완료: {sum(results)}/{len(videos)}개")
+        return videos
+    
+    def enrich_videos(self, videos: List[Dict]) -> List[Dict]:
+        """영상 상세 정보 보강 (동기)"""
+        return self._run_sync(self.enrich_videos_async(videos))
+    
+    @property
+    def channel_monitor(self) -> ChannelFeedMonitor:
+        """채널 피드 모니터 (지연 생성)"""
+        if self._channel_monitor is None:
+            self._channel_monitor = ChannelFeedMonitor(self.async_http_client, self.config)
+        return self._channel_monitor
+    
+    async def poll_channels_async(self, channel_ids: List[str], max_comments_per_video: int = 50,
+                                  emit_existing: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """채널 피드에서 처음 보는 영상만 골라 댓글 수집 - (새 영상 목록, 댓글 목록) 반환"""
+        self.monitor.start_timer('poll_channels')
+        new_videos = await self.channel_monitor.poll_async(channel_ids, emit_existing)
+        
+        comments = []
+        if new_videos and max_comments_per_video > 0:
+            comments = await self.get_comments_for_videos_async(new_videos, max_comments_per_video)
+        
+        self.monitor.end_timer('poll_channels')
+        return new_videos, comments
+    
+    def poll_channels(self, channel_ids: List[str], max_comments_per_video: int = 50,
+                      emit_existing: bool = False) -> Tuple[List[Dict], List[Dict]]:
+        """채널 피드 확인 및 새 영상 댓글 수집 (동기)"""
+        return self._run_sync(self.poll_channels_async(channel_ids, max_comments_per_video, emit_existing))
+    
+    async def watch_channels_async(self, channel_ids: List[str], max_comments_per_video: int = 50,
+                                   interval: Optional[float] = None, iterations: Optional[int] = None):
+        """채널 피드를 주기적으로 확인하며 (새 영상 목록, 댓글 목록)을 내보내는 비동기 제너레이터"""
+        interval = interval if interval is not None else self.config.get('channel_poll_interval', 900)
+        count = 0
+        while iterations is None or count < iterations:
+            yield await self.poll_channels_async(channel_ids, max_comments_per_video)
+            count += 1
+            if iterations is None or count < iterations:
+                await asyncio.sleep(interval)
+    
+    def _get_video_details_browser(self, video_id: str) -> Dict:
+        """브라우저 영상 상세 정보 - 렌더링된 페이지의 ytInitialPlayerResponse 사용"""
+        with self.driver_pool.driver() as driver:
+            try:
+                self._load_page(driver, self.http_videos.build_watch_url(video_id))
+                page_data = driver.execute_script("""
+                    return {
+                        player: window.ytInitialPlayerResponse ? JSON.stringify(window.ytInitialPlayerResponse) : null,
+                        initial: window.ytInitialData ? JSON.stringify(window.ytInitialData) : null
+                    };
+                """) or {}
+                if not page_data.get('player'):
+                    raise YouTubeParseError(f"페이지에 ytInitialPlayerResponse 없음 (video_id: {video_id})")
+                initial_data = json.loads(page_data['initial']) if page_data.get('initial') else None
+                return YouTubeDataParser.build_video_details(json.loads(page_data['player']), video_id, initial_data)
+            finally:
+                self._record_network_savings(driver, f"영상 정보 {video_id}")
+    
+    def _get_video_comments_browser(self, video_id: str, max_comments: int = 50,
+                                    time_budget: Optional[float] = None) -> List[Dict]:
+        """브라우저 댓글 수집 - 풀에서 전용 드라이버를 대여"""
+        with self.driver_pool.driver() as driver:
+            try:
+                return self._get_video_comments_with_driver(driver, video_id, max_comments, time_budget)
+            finally:
+                self._record_network_savings(driver, f"댓글 {video_id}")
+    
+    def _get_video_comments_with_driver(self, driver, video_id: str, max_comments: int = 50,
+                                        time_budget: Optional[float] = None) -> List[Dict]:
+        """대여한 드라이버로 댓글 수집 - 페이지 로딩 등이 실패하면 예외 발생 (빈 결과가 완료로 기록되지 않도록)"""
         comments = []
         
         try:
@@ -902,15 +4093,22 @@ class YouTubeCrawler:
             
             # 타임아웃 설정으로 페이지 로딩
             try:
-                self.driver.get(comment_url)
-                time.sleep(min(self.config.get('wait_time'), 2))  # 대기 시간 제한
+                self._load_page(driver, comment_url)
+                self._wait_for_dom_change(driver, "ytd-comments", timeout=min(self.config.get('wait_time'), 2))
+            except CrawlCancelledError:
+                raise
             except Exception as e:
                 logger.warning(f"페이지 로딩 오류: {e}")
-                return comments
+                raise
+            
+            # 페이지 로딩 이후의 스크롤, 댓글 연속 로딩, 답글 수집은 하나의 시간 예산을 함께 사용
+            if time_budget is None:
+                time_budget = self.config.get('comment_time_budget', 60)
+            deadline = time.time() + time_budget
             
             # 자동 재생 비활성화 및 소리 끄기 (타임아웃 적용)
             try:
-                self.driver.execute_script("""
+                driver.execute_script("""
                     // 자동 재생 비활성화
                     if (window.yt && window.yt.player) {
                         window.yt.player.getPlayerByElement = function() {
@@ -944,47 +4142,53 @@ class YouTubeCrawler:
             # 댓글 섹션 찾기 (타임아웃 적용)
             comment_section = None
             try:
-                comment_section = self._find_comment_section()
+                comment_section = self._find_comment_section(driver)
                 if comment_section:
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'start'});", comment_section)
-                    time.sleep(1)  # 짧은 대기 시간
+                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'start'});", comment_section)
+                    self._wait_for_dom_change(driver, self.COMMENT_SELECTOR, timeout=1)
+            except CrawlCancelledError:
+                raise
             except Exception as e:
                 logger.warning(f"댓글 섹션 스크롤 오류: {e}")
             
             # 댓글 로드 (타임아웃 적용)
             try:
-                self._scroll_comments_optimized()
+                self._scroll_comments_optimized(driver)
+            except CrawlCancelledError:
+                raise
             except Exception as e:
                 logger.warning(f"댓글 스크롤 오류: {e}")
             
-            # 댓글 요소 찾기 (타임아웃 적용)
-            comment_elements = []
+            # 목표 개수 또는 시간 예산에 도달할 때까지 댓글을 이어서 로드하며 수집
             try:
-                comment_elements = self._find_comment_elements()
+                comment_data = self._load_comments_incrementally(
+                    driver, video_id, max_comments, max(0.0, deadline - time.time())
+                )
+            except CrawlCancelledError:
+                raise
             except Exception as e:
-                logger.warning(f"댓글 요소 찾기 오류: {e}")
+                logger.warning(f"일괄 댓글 추출 실패, 개별 추출로 전환: {e}")
+                comment_data = self._extract_comments_per_element(driver, video_id, max_comments)
             
-            # 댓글 정보 추출 (제한된 수만 처리)
-            comment_data = []
-            max_elements = min(len(comment_elements), 20)  # 최대 20개만 처리
+            # 댓글 정렬 및 선택
+            comments = self._sort_and_select_comments(comment_data, max_comments)
             
-            for i, element in enumerate(comment_elements[:max_elements]):
+            # 선택된 댓글의 답글 수집 (선택 사항)
+            if self.config.get('collect_replies', False) and comments:
                 try:
-                    comment_info = self._extract_comment_info(element, video_id)
-                    if comment_info:
-                        comment_data.append(comment_info)
-                        if len(comment_data) >= max_comments:
-                            break
+                    replies = self._collect_replies_in_page(driver, video_id, comments, deadline)
+                    comments = YouTubeDataParser.attach_replies(comments, replies)
+                except CrawlCancelledError:
+                    raise
                 except Exception as e:
-                    logger.warning(f"댓글 정보 추출 오류 (인덱스 {i}): {e}")
-                    continue
-            
-            # 댓글 정렬 및 선택
-            comments = self._sort_and_select_comments(comment_data, max_comments)
+                    logger.warning(f"답글 수집 오류: {e}")
             
+        except CrawlCancelledError:
+            raise
         except Exception as e:
             logger.error(f"댓글 수집 오류 (video_id: {video_id}): {e}")
             self.send_notification("유튜브 크롤러", f"댓글 수집 오류 - {video_id}")
+            raise
             
         # 댓글 수집 완료 알림
         if comments:
@@ -996,7 +4200,7 @@ class YouTubeCrawler:
             
         return comments
     
-    def _find_comment_section(self):
+    def _find_comment_section(self, driver):
         """댓글 섹션 찾기"""
         comment_selectors = [
             "#comments",
@@ -1008,7 +4212,7 @@ class YouTubeCrawler:
         
         for selector in comment_selectors:
             try:
-                comment_section = WebDriverWait(self.driver, 10).until(
+                comment_section = WebDriverWait(driver, 10).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                 )
                 logger.info(f"댓글 섹션 찾음: {selector}")
@@ -1019,7 +4223,7 @@ class YouTubeCrawler:
         logger.warning("댓글 섹션을 찾을 수 없습니다.")
         return None
     
-    def _find_comment_elements(self):
+    def _find_comment_elements(self, driver):
         """댓글 요소 찾기 (최적화됨)"""
         # 주요 선택자만 사용
         primary_selectors = [
@@ -1029,10 +4233,10 @@ class YouTubeCrawler:
         
         for selector in primary_selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements and len(elements) > 0:
                     logger.info(f"댓글 요소 찾음: {selector} - {len(elements)}개")
-                    return elements[:15]  # 최대 15개만 반환 (안정성 향상)
+                    return elements
             except Exception as e:
                 logger.warning(f"선택자 {selector} 오류: {e}")
                 continue
@@ -1045,17 +4249,17 @@ class YouTubeCrawler:
         
         for selector in fallback_selectors:
             try:
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
                 if elements and len(elements) > 0:
                     logger.info(f"대체 댓글 요소 찾음: {selector} - {len(elements)}개")
-                    return elements[:15]  # 최대 15개만 반환 (안정성 향상)
+                    return elements
             except Exception as e:
                 logger.warning(f"대체 선택자 {selector} 오류: {e}")
                 continue
         
         # JavaScript로 간단한 확인 (타임아웃 적용)
         try:
-            comment_count = self.driver.execute_script("""
+            comment_count = driver.execute_script("""
                 try {
                     var comments = document.querySelectorAll('ytd-comment-renderer');
                     return comments.length;
@@ -1066,9 +4270,9 @@ class YouTubeCrawler:
             
             if comment_count > 0:
                 try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, "ytd-comment-renderer")
+                    elements = driver.find_elements(By.CSS_SELECTOR, "ytd-comment-renderer")
                     logger.info(f"JavaScript 확인 후 댓글 요소 찾음: {len(elements)}개")
-                    return elements[:15]  # 최대 15개만 반환 (안정성 향상)
+                    return elements
                 except Exception as e:
                     logger.warning(f"JavaScript 확인 후 요소 찾기 실패: {e}")
         except Exception as e:
@@ -1077,6 +4281,211 @@ class YouTubeCrawler:
         logger.warning("댓글 요소를 찾을 수 없습니다.")
         return []
     
+    def _load_comments_incrementally(self, driver, video_id: str, max_comments: int,
+                                     time_budget: Optional[float] = None) -> List[Dict]:
+        """댓글 연속 로딩 - max_comments 또는 시간 예산에 도달할 때까지 스크롤하며 증분 수집"""
+        if time_budget is None:
+            time_budget = self.config.get('comment_time_budget', 60)
+        deadline = time.time() + time_budget
+        wait_time = self.config.get('wait_time')
+        
+        comments = []
+        offset = 0  # 이미 수집한 렌더러 노드 수
+        while len(comments) < max_comments:
+            self.cancel_token.raise_if_cancelled()
+            # 새로 붙은 노드만 수집
+            raw_comments = self._harvest_comment_nodes(driver, offset, max_comments - len(comments))
+            offset += len(raw_comments)
+            for raw in raw_comments:
+                comment_info = self._build_comment_info(raw, video_id)
+                if comment_info:
+                    comments.append(comment_info)
+            
+            remaining = deadline - time.time()
+            if len(comments) >= max_comments or remaining <= 0:
+                break
+            
+            # 댓글 목록 끝(연속 로딩 트리거)으로 스크롤
+            has_more = driver.execute_script("""
+                var continuation = document.querySelector('ytd-comments ytd-continuation-item-renderer');
+                if (continuation) {
+                    continuation.scrollIntoView({block: 'end'});
+                } else {
+                    window.scrollTo(0, document.documentElement.scrollHeight);
+                }
+                return !!continuation;
+            """)
+            result = self._wait_for_dom_change(driver, self.COMMENT_SELECTOR, timeout=min(wait_time, remaining))
+            
+            # 더 불러올 댓글이 없고 새 노드도 없으면 종료
+            if not has_more and result.get('count', offset) <= offset:
+                break
+        
+        if len(comments) < max_comments:
+            logger.info(f"댓글 연속 로딩 종료: {len(comments)}/{max_comments}개 (video_id: {video_id})")
+        return comments[:max_comments]
+    
+    def _extract_comments_bulk(self, driver, video_id: str, limit: int) -> List[Dict]:
+        """로드된 모든 댓글 정보를 단일 execute_script 호출로 추출"""
+        raw_comments = self._harvest_comment_nodes(driver, 0, limit)
+        
+        logger.info(f"댓글 일괄 추출: {len(raw_comments)}개")
+        comments = []
+        for raw in raw_comments:
+            comment_info = self._build_comment_info(raw, video_id)
+            if comment_info:
+                comments.append(comment_info)
+        return comments
+    
+    def _harvest_comment_nodes(self, driver, offset: int, limit: int) -> List[Dict]:
+        """offset 이후의 댓글 렌더러 노드 원시 데이터를 한 번에 추출"""
+        return driver.execute_script("""
+            var offset = arguments[0];
+            var limit = arguments[1];
+            var nodes = document.querySelectorAll(arguments[2]);
+            var results = [];
+            var textOf = function(root, selector) {
+                var el = root.querySelector(selector);
+                return el ? el.innerText.trim() : '';
+            };
+            // 작성 시간 링크(&lc=댓글ID)에서 댓글 ID 추출
+            var idOf = function(root) {
+                var link = root.querySelector('#published-time-text a');
+                var match = link ? (link.getAttribute('href') || '').match(/[?&]lc=([^&]+)/) : null;
+                return match ? decodeURIComponent(match[1]) : '';
+            };
+            for (var i = offset; i < nodes.length && results.length < limit; i++) {
+                var node = nodes[i];
+                results.push({
+                    comment_id: idOf(node),
+                    text: textOf(node, '#content-text'),
+                    votes: textOf(node, '#vote-count-middle'),
+                    replies: textOf(node, '#reply-count'),
+                    published: textOf(node, '#header-author #published-time-text'),
+                    author: textOf(node, '#author-text')
+                });
+            }
+            return results;
+        """, offset, limit, self.COMMENT_SELECTOR) or []
+    
+    def _collect_replies_in_page(self, driver, video_id: str, comments: List[Dict],
+                                 deadline: Optional[float] = None) -> List[Dict]:
+        """선택된 댓글 스레드의 '답글' 버튼을 한 번에 펼치고 답글을 일괄 추출 (영상당 답글 예산 적용)
+        
+        deadline은 댓글 수집과 함께 쓰는 영상의 마감 시각 - 지나면 더 펼치지 않고 이미 열린 답글만 추출
+        """
+        budget = self.config.get('max_replies_per_video', 100)
+        if deadline is None:
+            deadline = time.time() + self.config.get('comment_time_budget', 60)
+        # 댓글 ID를 얻지 못한 레이아웃이면 모든 스레드를 대상으로 함
+        parent_ids = [comment['comment_id'] for comment in comments if comment.get('comment_id')]
+        
+        reply_count = 0
+        while reply_count < budget and time.time() < deadline:
+            self.cancel_token.raise_if_cancelled()
+            # 보이는 '답글 N개'와 '답글 더보기' 버튼을 한 번의 스크립트 호출로 클릭
+            clicked = driver.execute_script("""
+                var parentIds = arguments[0];
+                var maxClicks = arguments[1];
+                var idOf = function(root) {
+                    var link = root ? root.querySelector('#published-time-text a') : null;
+                    var match = link ? (link.getAttribute('href') || '').match(/[?&]lc=([^&]+)/) : null;
+                    return match ? decodeURIComponent(match[1]) : '';
+                };
+                var clicked = 0;
+                var threads = document.querySelectorAll('ytd-comment-thread-renderer');
+                for (var i = 0; i < threads.length && clicked < maxClicks; i++) {
+                    var thread = threads[i];
+                    if (parentIds.length && parentIds.indexOf(idOf(thread.querySelector('#comment'))) < 0) {
+                        continue;
+                    }
+                    var buttons = thread.querySelectorAll(
+                        '#more-replies button, #more-replies-sub-thread button, #replies ytd-continuation-item-renderer button'
+                    );
+                    for (var j = 0; j < buttons.length && clicked < maxClicks; j++) {
+                        if (buttons[j].offsetParent !== null) {
+                            buttons[j].click();
+                            clicked++;
+                        }
+                    }
+                }
+                return clicked;
+            """, parent_ids, budget - reply_count)
+            if not clicked:
+                break
+            
+            self._wait_for_dom_change(driver, self.REPLY_SELECTOR, timeout=min(self.config.get('wait_time'), max(0, deadline - time.time())))
+            reply_count = driver.execute_script(
+                "return document.querySelectorAll(arguments[0]).length;", self.REPLY_SELECTOR
+            ) or 0
+        
+        raw_replies = driver.execute_script("""
+            var parentIds = arguments[0];
+            var limit = arguments[1];
+            var textOf = function(root, selector) {
+                var el = root.querySelector(selector);
+                return el ? el.innerText.trim() : '';
+            };
+            var idOf = function(root) {
+                var link = root ? root.querySelector('#published-time-text a') : null;
+                var match = link ? (link.getAttribute('href') || '').match(/[?&]lc=([^&]+)/) : null;
+                return match ? decodeURIComponent(match[1]) : '';
+            };
+            var results = [];
+            var threads = document.querySelectorAll('ytd-comment-thread-renderer');
+            for (var i = 0; i < threads.length && results.length < limit; i++) {
+                var parentId = idOf(threads[i].querySelector('#comment'));
+                var container = threads[i].querySelector('#replies');
+                if (!container || (parentIds.length && parentIds.indexOf(parentId) < 0)) {
+                    continue;
+                }
+                var nodes = container.querySelectorAll('ytd-comment-renderer, ytd-comment-view-model');
+                for (var j = 0; j < nodes.length && results.length < limit; j++) {
+                    results.push({
+                        comment_id: idOf(nodes[j]),
+                        parent_comment_id: parentId,
+                        text: textOf(nodes[j], '#content-text'),
+                        votes: textOf(nodes[j], '#vote-count-middle'),
+                        published: textOf(nodes[j], '#header-author #published-time-text'),
+                        author: textOf(nodes[j], '#author-text')
+                    });
+                }
+            }
+            return results;
+        """, parent_ids, budget) or []
+        
+        replies = []
+        for raw in raw_replies:
+            reply_info = self._build_comment_info(raw, video_id)
+            if reply_info:
+                replies.append(reply_info)
+        
+        logger.info(f"답글 수집: {video_id} {len(replies)}개 (예산 {budget}개)")
+        return replies
+    
+    def _extract_comments_per_element(self, driver, video_id: str, max_comments: int) -> List[Dict]:
+        """요소별 댓글 정보 추출 (일괄 추출 실패 시 대체 경로)"""
+        comment_elements = []
+        try:
+            comment_elements = self._find_comment_elements(driver)
+        except Exception as e:
+            logger.warning(f"댓글 요소 찾기 오류: {e}")
+        
+        comment_data = []
+        
+        for i, element in enumerate(comment_elements):
+            try:
+                comment_info = self._extract_comment_info(element, video_id)
+                if comment_info:
+                    comment_data.append(comment_info)
+                    if len(comment_data) >= max_comments:
+                        break
+            except Exception as e:
+                logger.warning(f"댓글 정보 추출 오류 (인덱스 {i}): {e}")
+                continue
+        
+        return comment_data
+    
     def _extract_comment_info(self, element, video_id: str) -> Optional[Dict]:
         """댓글 정보 추출"""
         try:
@@ -1087,67 +4496,53 @@ class YouTubeCrawler:
             if not comment_text or len(comment_text) < 5:
                 return None
             
-            # 좋아요 수 추출
-            like_count = self._extract_like_count(element)
-            
-            # 댓글의 댓글 수 추출
-            reply_count = self._extract_reply_count(element)
-            
-            # 댓글 시간 추출
-            comment_time = self._extract_comment_time(element)
-            
-            # 댓글에서 키워드 추출 (최대 5개)
-            extracted_keywords = self._extract_comment_keywords(comment_text, max_keywords=5)
-            
-            # 키워드 추출 결과 로깅 (디버깅용)
-            if extracted_keywords:
-                logger.info(f"댓글에서 키워드 추출 성공: {extracted_keywords}")
-            else:
-                logger.debug(f"댓글에서 키워드 추출 실패 또는 없음: {comment_text[:50]}...")
-            
-            return {
-                'video_id': video_id,
-                'comment': comment_text,
-                'extracted_keywords': extracted_keywords,
-                'like_count': like_count,
-                'reply_count': reply_count,
-                'comment_time': comment_time,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
+            try:
+                author = element.find_element(By.CSS_SELECTOR, "#author-text").text.strip()
+            except:
+                author = ""
+            
+            return self._build_comment_info({
+                'text': comment_text,
+                'like_count': self._extract_like_count(element),
+                'reply_count': self._extract_reply_count(element),
+                'published': self._extract_comment_time(element),
+                'author': author
+            }, video_id)
             
         except Exception as e:
             logger.warning(f"댓글 정보 추출 오류: {e}")
             return None
     
+    def _build_comment_info(self, raw: Dict, video_id: str) -> Optional[Dict]:
+        """추출된 댓글 원시 데이터를 댓글 정보 딕셔너리로 변환"""
+        return YouTubeDataParser.build_comment_info(raw, video_id)
+    
     def _extract_like_count(self, element) -> int:
         """좋아요 수 추출"""
         try:
             like_element = element.find_element(By.CSS_SELECTOR, "#vote-count-middle")
-            like_text = like_element.text.strip()
-            if like_text:
-                if 'K' in like_text:
-                    return int(float(like_text.replace('K', '')) * 1000)
-                elif 'M' in like_text:
-                    return int(float(like_text.replace('M', '')) * 1000000)
-                else:
-                    return int(like_text.replace(',', ''))
+            return self._parse_like_count(like_element.text)
         except:
             pass
         return 0
     
+    def _parse_like_count(self, like_text: str) -> int:
+        """좋아요 수 텍스트를 정수로 변환"""
+        return YouTubeDataParser.parse_like_count(like_text)
+    
     def _extract_reply_count(self, element) -> int:
         """댓글의 댓글 수 추출"""
         try:
             reply_element = element.find_element(By.CSS_SELECTOR, "#reply-count")
-            reply_text = reply_element.text.strip()
-            if reply_text and '답글' in reply_text:
-                numbers = re.findall(r'\d+', reply_text)
-                if numbers:
-                    return int(numbers[0])
+            return self._parse_reply_count(reply_element.text)
         except:
             pass
         return 0
     
+    def _parse_reply_count(self, reply_text: str) -> int:
+        """답글 수 텍스트를 정수로 변환"""
+        return YouTubeDataParser.parse_reply_count(reply_text)
+    
     def _extract_comment_time(self, element) -> str:
         """댓글 시간 추출"""
         try:
@@ -1158,100 +4553,7 @@ class YouTubeCrawler:
     
     def _extract_comment_keywords(self, comment_text: str, max_keywords: int = 5) -> str:
         """댓글에서 키워드 추출 (최대 5개, 콤마로 구분)"""
-        try:
-            if not comment_text or len(comment_text) < 3:
-                return ""
-            
-            # Java 환경 확인 및 KoNLPy 사용
-            if konlpy_available:
-                try:
-                    # Java 환경 확인
-                    import os
-                    import subprocess
-                    
-                    # JAVA_HOME 확인
-                    java_home = os.environ.get('JAVA_HOME')
-                    if not java_home:
-                        # Java 설치 확인
-                        try:
-                            subprocess.run(['java', '-version'], capture_output=True, check=True)
-                            logger.info("Java가 설치되어 있지만 JAVA_HOME이 설정되지 않음")
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            logger.warning("Java가 설치되지 않음, 기본 키워드 추출 방식 사용")
-                            raise Exception("Java not available")
-                    
-                    from konlpy.tag import Okt
-                    okt = Okt()
-                    
-                    # 명사 추출
-                    nouns = okt.nouns(comment_text)
-                    
-                    # 불용어 제거 및 길이 필터링
-                    stop_words = {
-                        '이', '그', '저', '것', '수', '등', '및', '또는', '그리고', '하지만', '그런데',
-                        '그러나', '그래서', '그런', '이런', '저런', '어떤', '무슨', '어떻게', '왜',
-                        '언제', '어디서', '누가', '무엇을', '어떤', '이것', '저것', '그것', '우리',
-                        '저희', '그들', '당신', '너희', '그녀', '그분', '이분', '저분'
-                    }
-                    
-                    filtered_nouns = [word for word in nouns if len(word) >= 2 and word not in stop_words]
-                    
-                    # 빈도수 계산
-                    word_freq = {}
-                    for word in filtered_nouns:
-                        word_freq[word] = word_freq.get(word, 0) + 1
-                    
-                    # 빈도수 순으로 정렬하여 상위 키워드 선택
-                    sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-                    
-                    # 최대 5개까지 선택
-                    selected_keywords = [word for word, freq in sorted_words[:max_keywords]]
-                    
-                    # 콤마로 구분하여 반환
-                    return ", ".join(selected_keywords) if selected_keywords else ""
-                    
-                except Exception as konlpy_error:
-                    logger.warning(f"KoNLPy 키워드 추출 실패 (Java/JVM 문제), 기본 방식 사용: {konlpy_error}")
-            
-            # KoNLPy가 없거나 실패한 경우 개선된 기본 방식 사용
-            keywords = []
-            
-            # 한글 명사 추출 (개선된 패턴 매칭)
-            korean_nouns = re.findall(r'[가-힣]{2,}', comment_text)
-            # 영어 단어 추출 (2글자 이상)
-            english_words = re.findall(r'\b[a-zA-Z]{2,}\b', comment_text)
-            
-            # 한글 명사와 영어 단어 결합
-            all_words = korean_nouns + english_words
-            
-            # 확장된 불용어 제거
-            basic_stop_words = {
-                '이', '그', '저', '것', '수', '등', '및', '또는', '그리고', '하지만', '그런데',
-                '그러나', '그래서', '그런', '이런', '저런', '어떤', '무슨', '어떻게', '왜',
-                '언제', '어디서', '누가', '무엇을', '어떤', '이것', '저것', '그것', '우리',
-                '저희', '그들', '당신', '너희', '그녀', '그분', '이분', '저분', '있', '하', '되',
-                '보', '알', '생각', '말', '일', '때', '곳', '사람', '나', '너', '그', '이', '저'
-            }
-            filtered_words = [word for word in all_words if word not in basic_stop_words]
-            
-            # 빈도수 계산
-            word_freq = {}
-            for word in filtered_words:
-                if len(word) >= 2:  # 2글자 이상만
-                    word_freq[word] = word_freq.get(word, 0) + 1
-            
-            # 빈도수 순으로 정렬하여 상위 키워드 선택
-            sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
-            
-            # 최대 5개까지 선택
-            selected_keywords = [word for word, freq in sorted_words[:max_keywords]]
-            
-            # 콤마로 구분하여 반환
-            return ", ".join(selected_keywords) if selected_keywords else ""
-            
-        except Exception as e:
-            logger.warning(f"댓글 키워드 추출 오류: {e}")
-            return ""
+        return YouTubeDataParser.extract_comment_keywords(comment_text, max_keywords)
     
     def _sort_and_select_comments(self, comment_data: List[Dict], max_comments: int) -> List[Dict]:
         """댓글 정렬 및 선택"""
@@ -1284,7 +4586,7 @@ class YouTubeCrawler:
         
         return comments
     
-    def _scroll_comments_optimized(self):
+    def _scroll_comments_optimized(self, driver):
         """최적화된 댓글 스크롤"""
         try:
             logger.info("최적화된 댓글 스크롤 시작...")
@@ -1292,164 +4594,86 @@ class YouTubeCrawler:
             # 댓글 섹션 찾기 (타임아웃 적용)
             comment_section = None
             try:
-                comment_section = self._find_comment_section()
+                comment_section = self._find_comment_section(driver)
             except Exception as e:
                 logger.warning(f"댓글 섹션 찾기 오류: {e}")
             
             if not comment_section:
                 logger.warning("댓글 섹션을 찾을 수 없습니다. 페이지 하단으로 스크롤합니다.")
                 try:
-                    self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                    time.sleep(1)  # 짧은 대기 시간
+                    driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                    self._wait_for_dom_change(driver, "ytd-comments", timeout=1)
+                except CrawlCancelledError:
+                    raise
                 except Exception as e:
                     logger.warning(f"페이지 하단 스크롤 오류: {e}")
                 
                 # 다시 댓글 섹션 찾기
                 try:
-                    comment_section = self._find_comment_section()
+                    comment_section = self._find_comment_section(driver)
                 except Exception as e:
                     logger.warning(f"재시도 댓글 섹션 찾기 오류: {e}")
             
             # 댓글 섹션으로 스크롤
             if comment_section:
                 try:
-                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'start'});", comment_section)
-                    time.sleep(1)  # 짧은 대기 시간
+                    driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'start'});", comment_section)
+                    self._wait_for_dom_change(driver, self.COMMENT_SELECTOR, timeout=1)
+                except CrawlCancelledError:
+                    raise
                 except Exception as e:
                     logger.warning(f"댓글 섹션 스크롤 실패: {e}")
             
             # 간단한 스크롤만 시도 (복잡한 방법 제거)
             try:
-                self._scroll_method_simple()
+                self._scroll_method_simple(driver)
+            except CrawlCancelledError:
+                raise
             except Exception as e:
                 logger.warning(f"간단한 스크롤 실패: {e}")
             
             logger.info("댓글 스크롤 완료")
             
+        except CrawlCancelledError:
+            raise
         except Exception as e:
             logger.error(f"댓글 스크롤 오류: {e}")
     
-    def _scroll_method_simple(self):
+    def _scroll_method_simple(self, driver):
         """간단한 스크롤 방법"""
         try:
             # 최소한의 스크롤만 수행
             for i in range(3):  # 3번만 스크롤
                 try:
-                    self.driver.execute_script("window.scrollBy(0, 300);")
-                    time.sleep(0.5)  # 짧은 대기 시간
+                    driver.execute_script("window.scrollBy(0, 300);")
+                    result = self._wait_for_dom_change(driver, self.COMMENT_SELECTOR, timeout=self.config.get('wait_time'))
                     
                     # 댓글 확인
-                    comments = self.driver.find_elements(By.CSS_SELECTOR, "ytd-comment-renderer")
-                    if len(comments) > 0:
-                        logger.info(f"댓글 {len(comments)}개 발견")
+                    comment_count = result.get('count')
+                    if comment_count is None:
+                        comment_count = len(driver.find_elements(By.CSS_SELECTOR, self.COMMENT_SELECTOR))
+                    if comment_count > 0:
+                        logger.info(f"댓글 {comment_count}개 발견")
                         return True
+                except CrawlCancelledError:
+                    raise
                 except Exception as e:
                     logger.warning(f"스크롤 반복 {i+1} 오류: {e}")
                     continue
                     
             return False
+        except CrawlCancelledError:
+            raise
         except Exception as e:
             logger.warning(f"간단한 스크롤 방법 오류: {e}")
             return False
     
-    def _scroll_method_1(self):
-        """기본 스크롤 방법"""
-        try:
-            for i in range(5):
-                self.driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(1)
-                
-                comments = self.driver.find_elements(By.CSS_SELECTOR, "ytd-comment-renderer")
-                if len(comments) > 0:
-                    logger.info(f"댓글 {len(comments)}개 발견")
-                    return True
-                
-                # 추가 댓글 로드 버튼 클릭 시도
-                try:
-                    more_button = self.driver.find_element(By.CSS_SELECTOR, "#more-replies")
-                    if more_button and more_button.is_displayed():
-                        more_button.click()
-                        time.sleep(1)
-                except:
-                    pass
-                    
-            return False
-        except Exception as e:
-            logger.warning(f"기본 스크롤 방법 오류: {e}")
-            return False
-    
-    def _scroll_method_2(self):
-        """동적 로딩 대기 방법"""
-        try:
-            comments_section = self.driver.find_element(By.CSS_SELECTOR, "ytd-comments")
-            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'start'});", comments_section)
-            time.sleep(2)
-            
-            for i in range(10):
-                self.driver.execute_script("window.scrollBy(0, 200);")
-                time.sleep(0.8)
-                
-                comments = self.driver.find_elements(By.CSS_SELECTOR, "ytd-comment-renderer")
-                if len(comments) > 0:
-                    logger.info(f"동적 로딩으로 댓글 {len(comments)}개 발견")
-                    return True
-                    
-                # "더 보기" 버튼 클릭 시도
-                try:
-                    more_buttons = self.driver.find_elements(By.CSS_SELECTOR, "[aria-label*='더 보기'], [aria-label*='Show more']")
-                    for button in more_buttons:
-                        if button.is_displayed():
-                            button.click()
-                            time.sleep(0.5)
-                except:
-                    pass
-                    
-            return False
-        except Exception as e:
-            logger.warning(f"동적 로딩 방법 오류: {e}")
-            return False
-    
-    def _scroll_method_3(self):
-        """JavaScript 직접 실행 방법"""
-        try:
-            result = self.driver.execute_script("""
-                var commentsSection = document.querySelector('ytd-comments');
-                if (commentsSection) {
-                    commentsSection.scrollIntoView({behavior: 'smooth', block: 'start'});
-                    
-                    var event = new Event('scroll');
-                    window.dispatchEvent(event);
-                    
-                    var moreButtons = document.querySelectorAll('[aria-label*="더 보기"], [aria-label*="Show more"]');
-                    for (var i = 0; i < moreButtons.length; i++) {
-                        if (moreButtons[i].offsetParent !== null) {
-                            moreButtons[i].click();
-                        }
-                    }
-                    
-                    var comments = document.querySelectorAll('ytd-comment-renderer');
-                    return comments.length;
-                }
-                return 0;
-            """)
-            
-            time.sleep(2)
-            
-            comments = self.driver.find_elements(By.CSS_SELECTOR, "ytd-comment-renderer")
-            if len(comments) > 0:
-                logger.info(f"JavaScript 실행으로 댓글 {len(comments)}개 발견")
-                return True
-            return False
-        except Exception as e:
-            logger.warning(f"JavaScript 실행 방법 오류: {e}")
-            return False
-    
     async def save_to_excel_async(self, videos: List[Dict], comments: List[Dict], filename: str = "youtube_data.xlsx") -> Optional[str]:
         """비동기 엑셀 저장"""
         self.monitor.start_timer('save_excel')
         
         # 스레드 풀에서 실행
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
             self.executor,
             self._save_to_excel_sync,
@@ -1463,7 +4687,7 @@ class YouTubeCrawler:
     
     def save_to_excel(self, videos: List[Dict], comments: List[Dict], filename: str = "youtube_data.xlsx") -> Optional[str]:
         """동기 엑셀 저장 (기존 호환성 유지)"""
-        return asyncio.run(self.save_to_excel_async(videos, comments, filename))
+        return self._run_sync(self.save_to_excel_async(videos, comments, filename))
     
     def _save_to_excel_sync(self, videos: List[Dict], comments: List[Dict], filename: str) -> Optional[str]:
         """동기 엑셀 저장 구현 - 강화된 버전"""
@@ -1534,60 +4758,408 @@ class YouTubeCrawler:
             self.send_notification("유튜브 크롤러", f"데이터 저장 오류: {e}")
             return None
     
-    async def get_comments_for_videos_async(self, videos: List[Dict], max_comments_per_video: int = 50) -> List[Dict]:
-        """여러 영상의 댓글을 비동기로 수집 (최적화됨)"""
+    async def get_comments_for_videos_async(self, videos: List[Dict], max_comments_per_video: int = 50,
+                                            job_id: Optional[str] = None) -> List[Dict]:
+        """여러 영상의 댓글을 비동기로 수집 (최적화됨) - job_id를 주면 영상별 완료 결과를 체크포인트에 기록"""
         self.monitor.start_timer('batch_comments')
+        journal = None
+        if job_id:
+            journal = self.checkpoint_journal(job_id)
+            journal.start({'mode': 'comments', 'videos': videos, 'max_comments_per_video': max_comments_per_video})
+        
+        # HTTP 백엔드는 배치 없이 모든 영상을 동시에 요청하고 완료되는 순서대로 병합
+        if self.backend.concurrent:
+            all_comments = []
+            async for _, comments in self.iter_comments_for_videos_async(videos, max_comments_per_video, journal):
+                all_comments.extend(comments)
+            
+            if journal:
+                journal.finish()
+            self.monitor.end_timer('batch_comments')
+            self.monitor.log_memory_usage()
+            logger.info(f"HTTP 댓글 수집 완료: {len(all_comments)}개 댓글")
+            return all_comments
         
-        # 배치 크기 제한으로 안정성 향상
-        batch_size = min(len(videos), 2)  # 최대 2개 영상씩 처리 (안정성 향상)
+        # 드라이버 풀 크기만큼 영상을 동시에 처리 (워커당 전용 브라우저)
+        # 풀 크기는 적응형 동시성 한도에 따라 바뀌므로 배치마다 다시 계산
         all_comments = []
+        budget = self._job_time_budget(self.driver_pool.size)
+        budget.add(sum(1 for video in videos if video.get('video_id')))
         
-        for i in range(0, len(videos), batch_size):
+        i = 0
+        batch_number = 0
+        while i < len(videos):
+            batch_size = max(1, self.driver_pool.size)
+            budget.workers = batch_size
             batch = videos[i:i+batch_size]
-            logger.info(f"배치 {i//batch_size + 1} 처리 중... ({len(batch)}개 영상)")
+            batch_number += 1
+            logger.info(f"배치 {batch_number} 처리 중... ({len(batch)}개 영상)")
             
             # 배치별 비동기 댓글 수집 태스크 생성
             tasks = []
             for video in batch:
                 video_id = video.get('video_id')
                 if video_id:
-                    task = self.get_video_comments_async(video_id, max_comments_per_video)
-                    tasks.append(task)
+                    task = self._get_video_comments_with_deadline(video_id, max_comments_per_video, budget, journal)
+                    tasks.append((video, task))
             
             if tasks:
-                try:
-                    # 배치별로 댓글 수집 완료 대기 (타임아웃 적용)
-                    results = await asyncio.wait_for(
-                        asyncio.gather(*tasks, return_exceptions=True),
-                        timeout=45  # 45초 타임아웃 (안정성 향상)
-                    )
-                    
-                    # 결과 병합
-                    for j, result in enumerate(results):
-                        if isinstance(result, Exception):
-                            logger.error(f"영상 '{batch[j].get('title', 'Unknown')}' 댓글 수집 실패: {result}")
-                            continue
-                        all_comments.extend(result)
-                        
-                except asyncio.TimeoutError:
-                    logger.warning(f"배치 {i//batch_size + 1} 타임아웃 발생")
-                except Exception as e:
-                    logger.error(f"배치 {i//batch_size + 1} 처리 오류: {e}")
+                # 마감 시간은 영상별로 적용되므로 느린 영상이 있어도 먼저 끝난 영상의 댓글은 유지
+                results = await asyncio.gather(*(task for _, task in tasks), return_exceptions=True)
+                
+                # 결과 병합
+                for (video, _), result in zip(tasks, results):
+                    if isinstance(result, CrawlCancelledError):
+                        raise result
+                    if isinstance(result, Exception):
+                        logger.error(f"영상 '{video.get('title', 'Unknown')}' 댓글 수집 실패: {result}")
+                        continue
+                    all_comments.extend(result)
             
             # 배치 간 메모리 최적화
-            if i + batch_size < len(videos):
+            i += len(batch)
+            if i < len(videos):
                 self.optimize_memory()
                 await asyncio.sleep(1)  # 배치 간 대기
         
+        if journal:
+            journal.finish()
         self.monitor.end_timer('batch_comments')
         self.monitor.log_memory_usage()
         
-        logger.info(f"배치 댓글 수집 완료: {len(all_comments)}개 댓글")
+        logger.info(f"배치 댓글 수집 완료: {len(all_comments)}개 댓글 (시간 예산: {budget.stats})")
         return all_comments
     
-    def get_comments_for_videos(self, videos: List[Dict], max_comments_per_video: int = 50) -> List[Dict]:
+    async def iter_comments_for_videos_async(self, videos: List[Dict], max_comments_per_video: int = 50,
+                                             journal: Optional[CheckpointJournal] = None):
+        """여러 영상의 댓글을 동시에 수집하여 완료되는 순서대로 (video_id, 댓글 목록) 반환"""
+        video_ids = [video['video_id'] for video in videos if video.get('video_id')]
+        budget = self._job_time_budget(len(video_ids))
+        budget.add(len(video_ids))
+        
+        async def fetch(video_id: str):
+            try:
+                return video_id, await self._get_video_comments_with_deadline(video_id, max_comments_per_video, budget, journal)
+            except CrawlCancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"댓글 수집 실패 (video_id: {video_id}): {e}")
+                return video_id, []
+        
+        tasks = [asyncio.ensure_future(fetch(video_id)) for video_id in video_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 중간에 멈추면 남은 요청 취소
+            for task in tasks:
+                task.cancel()
+    
+    def get_comments_for_videos(self, videos: List[Dict], max_comments_per_video: int = 50,
+                                job_id: Optional[str] = None) -> List[Dict]:
         """여러 영상의 댓글을 동기로 수집 (기존 호환성 유지)"""
-        return asyncio.run(self.get_comments_for_videos_async(videos, max_comments_per_video))
+        return self._run_sync(self.get_comments_for_videos_async(videos, max_comments_per_video, job_id))
+    
+    def checkpoint_journal(self, job_id: str) -> CheckpointJournal:
+        """작업 ID의 체크포인트 저널"""
+        return CheckpointJournal(job_id, self.config.get('checkpoint_dir', 'checkpoints'))
+    
+    async def resume_async(self, job_id: str, on_videos=None, on_comments=None) -> Tuple[List[Dict], List[Dict]]:
+        """체크포인트에서 작업 재개 - 완료한 단위 작업은 저장된 결과를 사용하고 남은 작업만 요청"""
+        journal = self.checkpoint_journal(job_id)
+        if not journal.exists:
+            raise ValueError(f"체크포인트가 없습니다: {job_id}")
+        
+        params = journal.params
+        logger.info(f"작업 재개: {job_id} (완료된 단위 작업 {len(journal.units)}개)")
+        if params['mode'] == 'comments':
+            comments = await self.get_comments_for_videos_async(params['videos'], params['max_comments_per_video'], job_id)
+            return params['videos'], comments
+        
+        start_date = datetime.fromisoformat(params['start_date']) if params.get('start_date') else None
+        end_date = datetime.fromisoformat(params['end_date']) if params.get('end_date') else None
+        return await self.run_pipeline_async(
+            params['keywords'], params['max_videos_per_keyword'], params['max_comments_per_video'],
+            start_date, end_date, on_videos, on_comments, job_id
+        )
+    
+    def resume(self, job_id: str, on_videos=None, on_comments=None) -> Tuple[List[Dict], List[Dict]]:
+        """체크포인트에서 작업 재개 (동기)"""
+        return self._run_sync(self.resume_async(job_id, on_videos, on_comments))
+    
+    def _pipeline_comment_workers(self) -> int:
+        """파이프라인 댓글 워커 수 - HTTP는 설정값, 브라우저는 워커 한도의 상한만큼 (실제 동시 실행은 드라이버 풀 크기로 제한)"""
+        if self.backend.concurrent:
+            return max(1, self.config.get('pipeline_comment_workers', 32))
+        return self.worker_concurrency.maximum
+    
+    def _live_comment_workers(self, worker_count: int) -> int:
+        """실제로 동시에 댓글을 수집하는 워커 수 - 브라우저는 현재 드라이버 풀 크기로 제한"""
+        if self.backend.concurrent or not self.driver_pool:
+            return worker_count
+        return min(worker_count, self.driver_pool.size)
+    
+    async def pipeline_async(self, keywords: List[str], max_videos_per_keyword: int = 10,
+                             max_comments_per_video: int = 50, start_date: Optional[datetime] = None,
+                             end_date: Optional[datetime] = None, journal: Optional[CheckpointJournal] = None):
+        """검색 → 댓글 단계를 제한된 큐로 연결한 파이프라인
+        
+        키워드 검색이 끝나는 즉시 영상이 댓글 워커로 넘어가며, 결과를 완료 순서대로
+        ('videos', 키워드, 영상 목록) 또는 ('comments', 영상, 댓글 목록)으로 반환.
+        체크포인트 저널을 주면 완료된 키워드/영상은 요청 없이 기록된 결과를 사용
+        """
+        self.monitor.start_timer('pipeline')
+        queue_size = max(1, self.config.get('pipeline_queue_size', 100))
+        # 큐 크기가 단계 사이에 쌓이는 데이터 양(메모리)을 제한 - 가득 차면 앞 단계가 대기
+        video_queue = asyncio.Queue(maxsize=queue_size)
+        result_queue = asyncio.Queue(maxsize=queue_size)
+        worker_count = self._pipeline_comment_workers() if max_comments_per_video > 0 else 0
+        queued_ids = set()
+        # 작업 시간 예산은 검색 단계를 포함한 파이프라인 전체에 적용
+        budget = self._job_time_budget(self._live_comment_workers(worker_count))
+        
+        async def search_stage(keyword: str):
+            unit = f"search:{keyword}"
+            if journal and journal.is_done(unit):
+                videos = journal.get(unit)
+            else:
+                try:
+                    videos = await self._search_single_keyword_async(keyword, max_videos_per_keyword, start_date, end_date)
+                    if self.config.get('enrich_videos', False) and videos:
+                        await self.enrich_videos_async(videos)
+                    if journal:
+                        journal.record(unit, videos)
+                except CrawlCancelledError:
+                    raise
+                except Exception as e:
+                    # 실패한 키워드는 기록하지 않아 재개할 때 다시 검색
+                    logger.error(f"키워드 '{keyword}' 검색 실패: {e}")
+                    videos = []
+            await result_queue.put(('videos', keyword, videos))
+            
+            # 여러 키워드에서 나온 같은 영상은 댓글을 한 번만 수집
+            for video in videos:
+                video_id = video.get('video_id')
+                if worker_count and video_id and video_id not in queued_ids:
+                    queued_ids.add(video_id)
+                    budget.add()
+                    await video_queue.put(video)
+        
+        async def comment_worker():
+            while True:
+                video = await video_queue.get()
+                if video is None:
+                    return
+                # 드라이버 풀 크기는 적응형 동시성 한도에 따라 바뀌므로 영상마다 다시 반영
+                budget.workers = max(1, self._live_comment_workers(worker_count))
+                try:
+                    comments = await self._get_video_comments_with_deadline(
+                        video['video_id'], max_comments_per_video, budget, journal
+                    )
+                except CrawlCancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"댓글 수집 실패 (video_id: {video['video_id']}): {e}")
+                    comments = []
+                await result_queue.put(('comments', video, comments))
+        
+        async def produce():
+            try:
+                await asyncio.gather(*(search_stage(keyword) for keyword in keywords))
+                # 검색이 모두 끝나면 워커별 종료 신호 전달 후 남은 댓글 수집 대기
+                for _ in workers:
+                    await video_queue.put(None)
+                await asyncio.gather(*workers)
+            finally:
+                await result_queue.put(None)
+        
+        workers = [asyncio.ensure_future(comment_worker()) for _ in range(worker_count)]
+        producer = asyncio.ensure_future(produce())
+        started = time.time()
+        first_comments_logged = False
+        try:
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                if item[0] == 'comments' and not first_comments_logged:
+                    first_comments_logged = True
+                    logger.info(f"파이프라인 첫 댓글 결과: 시작 후 {time.time() - started:.1f}초")
+                yield item
+        finally:
+            # 소비자가 중간에 멈추면 남은 단계 취소
+            for task in workers + [producer]:
+                task.cancel()
+            self.monitor.end_timer('pipeline')
+    
+    async def run_pipeline_async(self, keywords: List[str], max_videos_per_keyword: int = 10,
+                                 max_comments_per_video: int = 50, start_date: Optional[datetime] = None,
+                                 end_date: Optional[datetime] = None, on_videos=None,
+                                 on_comments=None, job_id: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
+        """파이프라인 실행 - 단계 결과를 콜백(on_videos(키워드, 영상), on_comments(영상, 댓글))으로 전달하고 (영상 목록, 댓글 목록) 반환
+        
+        job_id를 주면 완료한 단위 작업을 체크포인트 저널에 기록하여 resume(job_id)으로 이어서 실행할 수 있음
+        """
+        journal = None
+        if job_id:
+            journal = self.checkpoint_journal(job_id)
+            journal.start({
+                'mode': 'pipeline',
+                'keywords': keywords,
+                'max_videos_per_keyword': max_videos_per_keyword,
+                'max_comments_per_video': max_comments_per_video,
+                'start_date': start_date.isoformat() if start_date else None,
+                'end_date': end_date.isoformat() if end_date else None
+            })
+        
+        videos_by_keyword = {}
+        all_comments = []
+        async for kind, source, items in self.pipeline_async(
+            keywords, max_videos_per_keyword, max_comments_per_video, start_date, end_date, journal
+        ):
+            if kind == 'videos':
+                videos_by_keyword[source] = items
+                if on_videos:
+                    on_videos(source, items)
+            else:
+                all_comments.extend(items)
+                if on_comments:
+                    on_comments(source, items)
+        
+        if journal:
+            journal.finish()
+        
+        # 영상 목록은 입력한 키워드 순서로 정리
+        all_videos = [video for keyword in keywords for video in videos_by_keyword.get(keyword, [])]
+        logger.info(f"파이프라인 완료: 영상 {len(all_videos)}개, 댓글 {len(all_comments)}개")
+        return all_videos, all_comments
+    
+    def run_pipeline(self, keywords: List[str], max_videos_per_keyword: int = 10,
+                     max_comments_per_video: int = 50, start_date: Optional[datetime] = None,
+                     end_date: Optional[datetime] = None, on_videos=None,
+                     on_comments=None, job_id: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
+        """파이프라인 실행 (동기) - crawl_processes가 2 이상이면 키워드를 프로세스별로 나누어 실행 (체크포인트 미사용 시)"""
+        if self.config.get('crawl_processes', 1) != 1 and len(keywords) > 1 and not job_id:
+            self.cancel_token.raise_if_cancelled()
+            self._active_shards = ShardedCrawler(self.config)
+            try:
+                return self._active_shards.run(
+                    keywords, max_videos_per_keyword, max_comments_per_video, start_date, end_date, on_videos, on_comments
+                )
+            finally:
+                self._active_shards = None
+        return self._run_sync(self.run_pipeline_async(
+            keywords, max_videos_per_keyword, max_comments_per_video, start_date, end_date, on_videos, on_comments, job_id
+        ))
+    
+    @staticmethod
+    async def _work_queue_call(executor: ThreadPoolExecutor, method, *args):
+        """작업 큐 호출을 전용 스레드에서 실행 - SQLite 쓰기 잠금 대기(busy timeout)가 이벤트 루프를 막지 않도록 함"""
+        return await asyncio.get_running_loop().run_in_executor(executor, method, *args)
+    
+    async def _run_work_task(self, work_queue: SqliteWorkQueue, node_id: str, task: Dict,
+                             queue_executor: ThreadPoolExecutor) -> bool:
+        """임대한 작업 하나 처리 - 검색 작업은 영상별 댓글 작업을 큐에 추가"""
+        payload = task['payload']
+        try:
+            if task['kind'] == 'search':
+                start_date = datetime.fromisoformat(payload['start_date']) if payload.get('start_date') else None
+                end_date = datetime.fromisoformat(payload['end_date']) if payload.get('end_date') else None
+                result = await self._search_single_keyword_async(
+                    payload['keyword'], payload['max_videos'], start_date, end_date
+                )
+                if self.config.get('enrich_videos', False) and result:
+                    await self.enrich_videos_async(result)
+                # 완료 처리 전에 댓글 작업을 추가 (재시도되어도 dedupe_key로 중복 추가 방지)
+                if payload.get('max_comments', 0) > 0:
+                    for video in result:
+                        if video.get('video_id'):
+                            await self._work_queue_call(queue_executor, partial(
+                                work_queue.enqueue, task['job_id'], 'comments',
+                                {'video': video, 'max_comments': payload['max_comments']},
+                                dedupe_key=video['video_id']
+                            ))
+            elif task['kind'] == 'comments':
+                result = await self.get_video_comments_async(payload['video']['video_id'], payload['max_comments'])
+            else:
+                raise ValueError(f"알 수 없는 작업 종류: {task['kind']}")
+        except CrawlCancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"작업 {task['id']} ({task['kind']}) 실패 (시도 {task['attempts']}회): {e}")
+            await self._work_queue_call(queue_executor, work_queue.fail, node_id, task['id'], str(e))
+            return False
+        
+        if not await self._work_queue_call(queue_executor, work_queue.complete, node_id, task['id'], result):
+            logger.warning(f"작업 {task['id']} 임대 만료로 결과 버림 (다른 노드가 다시 처리)")
+            return False
+        return True
+    
+    async def run_worker_async(self, work_queue: SqliteWorkQueue, node_id: Optional[str] = None,
+                               stop_when_empty: bool = True, max_tasks: Optional[int] = None) -> Dict:
+        """분산 작업 큐 워커 - 작업을 임대하여 동시에 처리하고 처리 중인 작업의 임대를 하트비트로 연장"""
+        node_id = node_id or f"{socket.gethostname()}-{os.getpid()}"
+        concurrency = max(1, self.config.get('work_concurrency', 8))
+        heartbeat_interval = max(1.0, work_queue.visibility_timeout / 3)
+        poll_interval = 1.0
+        in_flight = {}
+        stats = {'node_id': node_id, 'leased': 0, 'succeeded': 0, 'failed': 0}
+        last_heartbeat = time.time()
+        # 큐 호출은 순서대로 실행되도록 스레드 하나에서 처리 (연결도 하나를 공유)
+        queue_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='work-queue')
+        logger.info(f"작업 큐 워커 시작: {node_id} (동시 작업 {concurrency}개)")
+        
+        try:
+            while True:
+                # 빈 슬롯만큼 작업 임대
+                free_slots = concurrency - len(in_flight)
+                if max_tasks is not None:
+                    free_slots = min(free_slots, max_tasks - stats['leased'])
+                if free_slots > 0:
+                    for task in await self._work_queue_call(queue_executor, work_queue.lease, node_id, free_slots):
+                        stats['leased'] += 1
+                        in_flight[task['id']] = asyncio.ensure_future(
+                            self._run_work_task(work_queue, node_id, task, queue_executor)
+                        )
+                
+                if not in_flight:
+                    reached_limit = max_tasks is not None and stats['leased'] >= max_tasks
+                    if reached_limit or (stop_when_empty and
+                                         not await self._work_queue_call(queue_executor, work_queue.has_unfinished)):
+                        break
+                    # 다른 노드가 처리 중인 작업의 임대 만료 또는 새 작업을 기다림
+                    await asyncio.sleep(poll_interval)
+                    continue
+                
+                done, _ = await asyncio.wait(in_flight.values(), timeout=poll_interval,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                for task_id, future in list(in_flight.items()):
+                    if future in done:
+                        del in_flight[task_id]
+                        stats['succeeded' if future.result() else 'failed'] += 1
+                
+                # 오래 걸리는 작업이 다른 노드에 재할당되지 않도록 임대 연장
+                if in_flight and time.time() - last_heartbeat >= heartbeat_interval:
+                    last_heartbeat = time.time()
+                    still_owned = set(await self._work_queue_call(
+                        queue_executor, work_queue.heartbeat, node_id, list(in_flight)
+                    ))
+                    for task_id in set(in_flight) - still_owned:
+                        logger.warning(f"작업 {task_id} 임대를 잃어 취소")
+                        in_flight.pop(task_id).cancel()
+        finally:
+            for future in in_flight.values():
+                future.cancel()
+            # 이미 제출된 큐 호출(완료/실패 기록)은 스레드에서 끝까지 실행
+            queue_executor.shutdown(wait=False)
+        
+        logger.info(f"작업 큐 워커 종료: {stats}")
+        return stats
+    
+    def run_worker(self, work_queue: SqliteWorkQueue, node_id: Optional[str] = None,
+                   stop_when_empty: bool = True, max_tasks: Optional[int] = None) -> Dict:
+        """분산 작업 큐 워커 실행 (동기)"""
+        return self._run_sync(self.run_worker_async(work_queue, node_id, stop_when_empty, max_tasks))
     
     def get_performance_metrics(self) -> Dict:
         """성능 메트릭 반환"""
@@ -1598,7 +5170,14 @@ class YouTubeCrawler:
             'metrics': metrics,
             'memory_usage_mb': memory_usage,
             'cache_enabled': self.cache is not None,
+            'cache': self.cache.get_stats() if self.cache else {},
             'max_workers': self.config.get('max_workers'),
+            'driver_pool': self.driver_pool.get_stats() if self.driver_pool else {},
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'concurrency': {
+                'browser_workers': self.worker_concurrency.get_stats(),
+                'http': self.async_http_client.concurrency.get_stats()
+            },
             'config': self.config.config
         }
     
@@ -1611,6 +5190,29 @@ class YouTubeCrawler:
     def update_config(self, new_config: Dict):
         """설정 업데이트"""
         self.config.update(new_config)
+        
+        # 워커 수가 바뀌면 동시성 한도를 새 값에서 다시 시작하고 스레드 풀과 드라이버 풀 크기도 함께 조정
+        max_workers = new_config.get('max_workers')
+        if (max_workers and max(1, max_workers) != self.max_workers) or 'max_workers_limit' in new_config:
+            self.max_workers = max(1, max_workers or self.max_workers)
+            self.worker_concurrency = self._create_worker_concurrency()
+            old_executor = self.executor
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.worker_concurrency.maximum,
+                thread_name_prefix="YouTubeCrawler"
+            )
+            old_executor.shutdown(wait=False)
+            if self.driver_pool:
+                self.driver_pool.resize(self.worker_concurrency.limit)
+        
+        # 속도 제한 설정이 바뀌면 공유 제한기에 반영
+        if any(key.startswith('rate_limit') for key in new_config):
+            self.rate_limiter.reload()
+        
+        # 엔진이 바뀌면 백엔드 교체 (브라우저는 필요할 때 드라이버 풀에서 생성)
+        if 'engine' in new_config and new_config['engine'] != self.backend.name:
+            self.backend = self._create_backend()
+        
         logger.info(f"설정이 업데이트되었습니다: {new_config}")
     
     def optimize_memory(self):
@@ -1629,14 +5231,14 @@ class YouTubeCrawler:
                 if memory_usage > max_memory:
                     logger.warning(f"메모리 사용량이 높습니다: {memory_usage:.2f} MB (제한: {max_memory} MB)")
                     
-                    # 캐시 삭제로 메모리 확보
+                    # 메모리 캐시를 절반으로 줄여 메모리 확보 (최근 사용한 항목과 파일 캐시는 유지)
                     if self.cache:
-                        self.cache.clear()
-                        logger.info("메모리 최적화를 위해 캐시를 삭제했습니다.")
+                        freed = self.cache.trim_memory(0.5)
+                        logger.info(f"메모리 최적화를 위해 메모리 캐시 {freed / 1024 / 1024:.1f} MB를 정리했습니다.")
                     
                     # 추가 메모리 정리
                     gc.collect()
-            else:
+            elif memory_usage is not None:
                 logger.info(f"현재 메모리 사용량: {memory_usage:.2f} MB")
             
             logger.info("메모리 최적화 완료")
@@ -1656,25 +5258,33 @@ class YouTubeCrawler:
             metrics = self.get_performance_metrics()
             logger.info(f"종료 시 성능 메트릭: {metrics}")
             
+            # 남은 작업을 취소하여 스레드 풀 종료를 기다리지 않도록 함
+            self.cancel()
+            
+            # 비동기 HTTP 세션을 닫고 상시 이벤트 루프 종료
+            try:
+                self._event_loop.run(self.async_http_client.close())
+            except Exception as e:
+                logger.warning(f"비동기 HTTP 세션 종료 중 오류: {e}")
+            self._event_loop.stop()
+            
             # 스레드 풀 종료
             if hasattr(self, 'executor'):
                 self.executor.shutdown(wait=True)
                 logger.info("스레드 풀이 종료되었습니다.")
             
-            # 드라이버 종료
-            if self.driver:
+            # HTTP 세션 종료
+            self.http_client.close()
+            
+            # 드라이버 풀 종료 (대표 드라이버 포함)
+            if self.driver_pool:
                 try:
-                    self.driver.close()
-                    self.driver.quit()
+                    self.driver_pool.close_all()
                     logger.info("ChromeDriver 안전하게 종료됨")
                 except Exception as e:
                     logger.error(f"드라이버 종료 중 오류: {e}")
-                    try:
-                        self.driver.quit()
-                    except:
-                        pass
                 finally:
-                    self.driver = None
+                    self._driver = None
             
             # 메모리 최적화
             self.optimize_memory()
@@ -1690,4 +5300,151 @@ class YouTubeCrawler:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """컨텍스트 매니저 종료"""
-        self.close() 
\ No newline at end of file
+        self.close() 
+
+def _crawl_shard_worker(shard_id: int, keywords: List[str], max_videos_per_keyword: int,
+                        max_comments_per_video: int, start_date: Optional[datetime],
+                        end_date: Optional[datetime], config: Dict, results):
+    """샤드 워커 프로세스 - 자체 크롤러(브라우저/HTTP 클라이언트)로 맡은 키워드를 수집하고 결과를 큐로 전달"""
+    config_manager = ConfigManager()
+    config_manager.update(config)
+    # 워커 안에서 다시 프로세스를 나누지 않도록 단일 프로세스로 실행
+    config_manager.set('crawl_processes', 1)
+    
+    try:
+        with YouTubeCrawler(config_manager) as crawler:
+            videos, comments = crawler.run_pipeline(
+                keywords, max_videos_per_keyword, max_comments_per_video, start_date, end_date,
+                on_videos=lambda keyword, items: results.put(('videos', shard_id, keyword, items)),
+                on_comments=lambda video, items: results.put(('comments', shard_id, video, items))
+            )
+        results.put(('done', shard_id, None, {'videos': len(videos), 'comments': len(comments)}))
+    except Exception as e:
+        results.put(('error', shard_id, None, str(e)))
+
+class ShardedCrawler:
+    """프로세스 샤딩 크롤러 - 키워드를 워커 프로세스에 나누고 결과를 큐 하나로 병합
+    
+    워커마다 자체 브라우저/HTTP 클라이언트를 사용하므로 파싱과 키워드 추출이 여러 코어에서 실행되고,
+    한 워커의 Chrome이 비정상 종료되어도 해당 샤드만 실패한다.
+    """
+    
+    # 결과 큐를 기다리는 간격 (이 간격마다 종료된 워커 확인)
+    POLL_INTERVAL = 0.5
+    
+    def __init__(self, config: Optional[ConfigManager] = None, processes: Optional[int] = None):
+        self.config = config or ConfigManager()
+        self.processes = max(1, processes or self.config.get('crawl_processes', 1) or os.cpu_count() or 1)
+        self.shard_stats = {}
+        self._workers = {}
+        self._cancelled = threading.Event()
+    
+    @staticmethod
+    def split_shards(items: List, shard_count: int) -> List[List]:
+        """항목을 샤드 수만큼 번갈아 나눔 (빈 샤드 제외)"""
+        shards = [items[i::shard_count] for i in range(shard_count)]
+        return [shard for shard in shards if shard]
+    
+    def run(self, keywords: List[str], max_videos_per_keyword: int = 10, max_comments_per_video: int = 50,
+            start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+            on_videos=None, on_comments=None) -> Tuple[List[Dict], List[Dict]]:
+        """샤드별 워커 프로세스를 실행하고 결과를 병합하여 (영상 목록, 댓글 목록) 반환"""
+        shards = self.split_shards(list(keywords), self.processes)
+        # 부모 프로세스의 스레드(드라이버 풀, 로깅)를 복제하지 않도록 spawn 방식 사용
+        context = multiprocessing.get_context('spawn')
+        results = context.Queue(maxsize=max(1, self.config.get('pipeline_queue_size', 100)))
+        
+        workers = self._workers = {}
+        for shard_id, shard_keywords in enumerate(shards):
+            process = context.Process(
+                target=_crawl_shard_worker,
+                args=(shard_id, shard_keywords, max_videos_per_keyword, max_comments_per_video,
+                      start_date, end_date, dict(self.config.config), results),
+                name=f"YouTubeCrawlShard-{shard_id}",
+                daemon=True
+            )
+            process.start()
+            workers[shard_id] = process
+            self.shard_stats[shard_id] = {'keywords': shard_keywords, 'status': 'running'}
+        logger.info(f"프로세스 샤딩 시작: {len(workers)}개 샤드, {len(keywords)}개 키워드")
+        
+        videos_by_keyword = {}
+        all_comments = []
+        collected_ids = set()
+        pending = set(workers)
+        
+        def handle_message(kind: str, shard_id: int, source, payload):
+            if kind == 'videos':
+                videos_by_keyword[source] = payload
+                if on_videos:
+                    on_videos(source, payload)
+            elif kind == 'comments':
+                # 여러 샤드에서 같은 영상이 검색되면 먼저 도착한 댓글만 사용
+                if source.get('video_id') in collected_ids:
+                    return
+                collected_ids.add(source.get('video_id'))
+                all_comments.extend(payload)
+                if on_comments:
+                    on_comments(source, payload)
+            else:
+                pending.discard(shard_id)
+                self.shard_stats[shard_id]['status'] = 'done' if kind == 'done' else 'error'
+                self.shard_stats[shard_id]['result'] = payload
+                if kind == 'error':
+                    logger.error(f"샤드 {shard_id} 실패: {payload}")
+        
+        try:
+            while pending and not self._cancelled.is_set():
+                try:
+                    message = results.get(timeout=self.POLL_INTERVAL)
+                except queue.Empty:
+                    self._check_crashed_workers(workers, pending, results, handle_message)
+                    continue
+                handle_message(*message)
+        finally:
+            for process in workers.values():
+                process.join(timeout=5)
+                if process.is_alive():
+                    process.terminate()
+        
+        if self._cancelled.is_set():
+            raise CrawlCancelledError("크롤링이 취소되었습니다.")
+        
+        all_videos = [video for keyword in keywords for video in videos_by_keyword.get(keyword, [])]
+        failed = [shard_id for shard_id, stats in self.shard_stats.items() if stats['status'] != 'done']
+        logger.info(
+            f"프로세스 샤딩 완료: 영상 {len(all_videos)}개, 댓글 {len(all_comments)}개, "
+            f"실패 샤드 {len(failed)}/{len(workers)}개"
+        )
+        return all_videos, all_comments
+    
+    def cancel(self):
+        """실행 중인 워커 프로세스 종료 (브라우저는 프로세스와 함께 정리)"""
+        self._cancelled.set()
+        for process in list(self._workers.values()):
+            if process.is_alive():
+                process.terminate()
+    
+    def _check_crashed_workers(self, workers: Dict, pending: set, results, handle_message):
+        """완료 메시지 없이 종료된 워커(Chrome/프로세스 비정상 종료)를 실패 샤드로 처리
+        
+        종료 직전에 보낸 메시지('done' 포함)가 결과 큐에 남아 있을 수 있으므로 큐를 모두 처리한 뒤 판단
+        """
+        exited = [shard_id for shard_id in pending if not workers[shard_id].is_alive()]
+        if not exited:
+            return
+        while True:
+            try:
+                handle_message(*results.get_nowait())
+            except queue.Empty:
+                break
+        for shard_id in exited:
+            if shard_id in pending:
+                process = workers[shard_id]
+                pending.discard(shard_id)
+                self.shard_stats[shard_id]['status'] = 'crashed'
+                self.shard_stats[shard_id]['result'] = f"exit code {process.exitcode}"
+                logger.error(
+                    f"샤드 {shard_id} 프로세스 비정상 종료 (exit code {process.exitcode}), "
+                    f"키워드 {self.shard_stats[shard_id]['keywords']} 결과 제외"
+                )